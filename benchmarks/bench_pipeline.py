@@ -0,0 +1,186 @@
+"""Offline scaling benchmarks for the import pipeline (no Maya required).
+
+Runs preview_renaming, get_unique_asset_name, _collect_asset_files and
+batch_import_and_cleanup against the SceneSimulator at several asset counts,
+appends the timings to a JSONL history and flags regressions against the
+previous run.
+
+    python benchmarks/bench_pipeline.py --sizes 10 1000 10000 100000
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import struct
+import argparse
+import tempfile
+import platform
+import contextlib
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+for p in (HERE, os.path.join(ROOT, 'src')):
+    if p not in sys.path:
+        sys.path.insert(0, p)
+
+import import_cleanup_prototype as icp
+import import_scheduler
+from fake_maya import SceneSimulator
+
+DEFAULT_SIZES = (10, 1000, 10000, 100000)
+DEFAULT_HISTORY = os.path.join(HERE, 'results', 'history.jsonl')
+EXTS = ('.ma', '.mb', '.obj', '.fbx', '.usd', '.abc')
+
+def _fbx_stub():
+    # Binary FBX 7500: an Objects record holding one Geometry record, then the null records
+    rec = struct.Struct('<QQQB')
+    geometry = rec.pack(27 + 25 + 7 + 25 + 8, 0, 0, 8) + b'Geometry'
+    objects = rec.pack(27 + 25 + 7 + len(geometry) + 25, 0, 0, 7) + b'Objects' + geometry + b'\0' * 25
+    return b'Kaydara FBX Binary  \x00\x1a\x00' + struct.pack('<I', 7500) + objects + b'\0' * 25
+
+# Smallest files that pass asset_validation, so the benchmark exercises the import path
+STUBS = {
+    '.ma': b'//Maya ASCII 2023 scene\n',
+    '.mb': b'FOR4' + struct.pack('>I', 16) + b'Maya' + b'\0' * 12,
+    '.obj': b'v 0 0 0\n',
+    '.fbx': _fbx_stub(),
+    '.usd': b'PXR-USDC' + b'\0' * 8 + struct.pack('<Q', 88) + b'\0' * 72,
+    '.abc': b'Ogawa\xff' + b'\0' * 10,
+}
+
+@contextlib.contextmanager
+def simulated_cmds(sim):
+    orig = icp.cmds
+    icp.cmds = sim
+    try:
+        yield sim
+    finally:
+        icp.cmds = orig
+
+def make_asset_folder(root, count, per_dir=1000):
+    # Spread files over sub-folders so recursive scanning has something to walk
+    for i in range(count):
+        sub = os.path.join(root, f"drop_{i // per_dir:04d}")
+        if i % per_dir == 0:
+            os.makedirs(sub, exist_ok=True)
+        ext = EXTS[i % len(EXTS)]
+        with open(os.path.join(sub, f"asset_{i:06d}{ext}"), 'wb') as f:
+            f.write(STUBS[ext])
+    return root
+
+def _timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        fn(*args, **kwargs)
+    return time.perf_counter() - t0
+
+def bench_size(size, workdir, obj_exists_cost=0.0, legacy_max=1000):
+    results = {}
+    folder = make_asset_folder(os.path.join(workdir, f"assets_{size}"), size)
+
+    icp.clear_scan_cache()
+    results['collect_cold'] = _timed(icp._collect_asset_files, folder, recursive=True)
+    results['collect_warm'] = _timed(icp._collect_asset_files, folder, recursive=True)
+
+    # Name allocation against a scene already holding `size` variants of one name
+    sim = SceneSimulator(obj_exists_cost=obj_exists_cost)
+    for i in range(size):
+        sim.add_node(f"ASSET_crate_{i:03}" if i else "ASSET_crate")
+    with simulated_cmds(sim):
+        if size <= legacy_max:
+            results['unique_name_probe'] = _timed(icp.get_unique_asset_name, 'crate')
+        alloc_t0 = time.perf_counter()
+        allocator = icp.NameAllocator.from_scene()
+        for _ in range(size):
+            allocator.allocate('crate')
+        results['unique_name_allocator'] = time.perf_counter() - alloc_t0
+
+    sim = SceneSimulator(obj_exists_cost=obj_exists_cost)
+    sim.populate(size)
+    with simulated_cmds(sim):
+        results['preview_renaming'] = _timed(icp.preview_renaming, folder, recursive=True)
+
+    sim = SceneSimulator(obj_exists_cost=obj_exists_cost, nested_groups=2, namespace_every=10)
+    with simulated_cmds(sim):
+        # Simulated timings must not feed the real import stats store
+        scheduler = import_scheduler.ImportScheduler(import_scheduler.ImportStats(None), record=False)
+        results['batch_import'] = _timed(icp.batch_import_and_cleanup, folder, recursive=True,
+                                         center_on_import=True, scale_factor=2.0, scheduler=scheduler)
+    results['batch_import_calls'] = dict(sim.calls)
+    return results
+
+def _git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+def load_last_run(history_path):
+    if not os.path.isfile(history_path):
+        return None
+    last = None
+    with open(history_path) as f:
+        for line in f:
+            if line.strip():
+                last = json.loads(line)
+    return last
+
+def compare(current, previous, threshold):
+    regressions = []
+    if not previous:
+        return regressions
+    for size, benches in current['results'].items():
+        for name, secs in benches.items():
+            old = previous['results'].get(size, {}).get(name)
+            if not isinstance(secs, float) or not isinstance(old, float) or old <= 0:
+                continue
+            # Ignore noise on very fast benchmarks
+            if secs > old * (1 + threshold) and secs - old > 0.005:
+                regressions.append((size, name, old, secs))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline pipeline scaling benchmarks.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--obj-exists-cost', type=float, default=0.0,
+                        help="Simulated seconds per cmds.objExists call")
+    parser.add_argument('--legacy-max', type=int, default=1000,
+                        help="Largest size for the objExists probing benchmark")
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help="JSONL file runs are appended to")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Relative slowdown reported as a regression")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    parser.add_argument('--no-save', action='store_true', help="Do not append this run to the history")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix='pipeline_bench_')
+    run = dict(timestamp=time.strftime('%Y-%m-%dT%H:%M:%S'), revision=_git_revision(),
+               python=platform.python_version(), machine=platform.node(), results={})
+    try:
+        for size in args.sizes:
+            print(f"Benchmarking {size} assets…")
+            run['results'][str(size)] = bench_size(size, workdir, args.obj_exists_cost, args.legacy_max)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"\n{'size':>8}  {'benchmark':<24}{'seconds':>10}")
+    for size, benches in run['results'].items():
+        for name, secs in benches.items():
+            if isinstance(secs, float):
+                print(f"{size:>8}  {name:<24}{secs:10.4f}")
+
+    regressions = compare(run, load_last_run(args.history), args.threshold)
+    for size, name, old, new in regressions:
+        print(f"REGRESSION {name} @ {size}: {old:.4f}s → {new:.4f}s")
+
+    if not args.no_save:
+        os.makedirs(os.path.dirname(args.history), exist_ok=True)
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(run) + '\n')
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
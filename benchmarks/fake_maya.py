@@ -0,0 +1,255 @@
+"""In-memory stand-in for ``maya.cmds`` used by the offline benchmarks.
+
+Models transforms and shapes with a parent hierarchy, UUIDs, namespaces and
+the handful of flags the pipeline uses. ``objExists`` can be given a
+per-call latency so probing loops show their real cost.
+"""
+import os
+import time
+import itertools
+
+
+class SceneSimulator:
+    def __init__(self, obj_exists_cost=0.0, nested_groups=1, namespace_every=0):
+        self.obj_exists_cost = obj_exists_cost
+        self.nested_groups = nested_groups
+        self.namespace_every = namespace_every
+        self.nodes = {}          # name -> dict(type, parent, uuid, scale, translate)
+        self.by_uuid = {}
+        self.namespaces = set()
+        self.ns_members = {}     # namespace -> names directly inside it
+        self.calls = {}
+        self._uuid = itertools.count(1)
+        self._imports = 0
+
+    # --- helpers -----------------------------------------------------------
+    def _count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _unique(self, name):
+        if name not in self.nodes:
+            return name
+        stem = name.rstrip('0123456789')
+        i = 1
+        while f"{stem}{i}" in self.nodes:
+            i += 1
+        return f"{stem}{i}"
+
+    def add_node(self, name, node_type='transform', parent=None):
+        name = self._unique(name)
+        uuid = f"UUID-{next(self._uuid):08d}"
+        self.nodes[name] = dict(type=node_type, parent=parent, uuid=uuid, children=set(),
+                                scale=(1.0, 1.0, 1.0), translate=(0.0, 0.0, 0.0))
+        self.by_uuid[uuid] = name
+        if parent:
+            self.nodes[parent]['children'].add(name)
+        self._index_ns(name)
+        return name
+
+    def _index_ns(self, name, remove=False):
+        if ':' not in name:
+            return
+        ns = name.rsplit(':', 1)[0]
+        if remove:
+            self.ns_members.get(ns, set()).discard(name)
+        else:
+            self.namespaces.add(ns)
+            self.ns_members.setdefault(ns, set()).add(name)
+
+    def populate(self, count, base='prop'):
+        for i in range(count):
+            root = self.add_node(f"{base}{i}")
+            self.add_node(f"{base}{i}Shape", 'mesh', parent=root)
+
+    def _resolve(self, name):
+        if name in self.by_uuid:
+            return self.by_uuid[name]
+        leaf = name.split('|')[-1]
+        if leaf not in self.nodes:
+            raise RuntimeError(f"No object matches name: {name}")
+        return leaf
+
+    def _path(self, name):
+        parts = []
+        while name:
+            parts.append(name)
+            name = self.nodes[name]['parent']
+        return '|' + '|'.join(reversed(parts))
+
+    def _children(self, name):
+        return sorted(self.nodes[name]['children'])
+
+    def _descendants(self, name):
+        out, stack = [], [name]
+        while stack:
+            cur = stack.pop()
+            out.append(cur)
+            stack.extend(self._children(cur))
+        return out
+
+    def _remove(self, name):
+        parent = self.nodes[name]['parent']
+        if parent in self.nodes:
+            self.nodes[parent]['children'].discard(name)
+        for n in self._descendants(name):
+            self.by_uuid.pop(self.nodes[n]['uuid'], None)
+            self._index_ns(n, remove=True)
+            del self.nodes[n]
+
+    # --- maya.cmds surface -------------------------------------------------
+    def ls(self, *args, **kwargs):
+        self._count('ls')
+        if args:
+            names = args[0]
+            if isinstance(names, str):
+                names = [names]
+            resolved = []
+            for n in names:
+                try:
+                    resolved.append(self._resolve(n))
+                except RuntimeError:
+                    continue
+        else:
+            resolved = list(self.nodes)
+
+        if kwargs.get('dag'):
+            resolved = [d for n in resolved for d in self._descendants(n)]
+        node_type = kwargs.get('type') or kwargs.get('exactType')
+        if node_type:
+            resolved = [n for n in resolved if self.nodes[n]['type'] == node_type]
+        if kwargs.get('uuid'):
+            return [self.nodes[n]['uuid'] for n in resolved]
+        if kwargs.get('long'):
+            return [self._path(n) for n in resolved]
+        return resolved
+
+    def objExists(self, name):
+        self._count('objExists')
+        if self.obj_exists_cost:
+            time.sleep(self.obj_exists_cost)
+        return name.split('|')[-1] in self.nodes
+
+    def objectType(self, name):
+        return self.nodes[self._resolve(name)]['type']
+
+    def listRelatives(self, name, parent=False, children=False, shapes=False, **kwargs):
+        self._count('listRelatives')
+        node = self._resolve(name)
+        if parent:
+            p = self.nodes[node]['parent']
+            return [p] if p else None
+        kids = self._children(node)
+        if shapes:
+            kids = [k for k in kids if self.nodes[k]['type'] != 'transform']
+        return kids or None
+
+    def file(self, *args, **kwargs):
+        self._count('file')
+        if kwargs.get('new'):
+            self.__init__(self.obj_exists_cost, self.nested_groups, self.namespace_every)
+            return None
+        if kwargs.get('query'):
+            return []
+        # Simulated import: optional namespace, nested groups, one mesh, one empty group
+        self._imports += 1
+        base = os.path.splitext(os.path.basename(args[0]))[0] if args else 'asset'
+        ns = f"ns{self._imports}:" if self.namespace_every and self._imports % self.namespace_every == 0 else ''
+        created = []
+        parent = None
+        for depth in range(self.nested_groups):
+            parent = self.add_node(f"{ns}{base}_grp{depth}", parent=parent)
+            created.append(parent)
+        geo = self.add_node(f"{ns}{base}_geo", parent=parent)
+        created.append(geo)
+        created.append(self.add_node(f"{ns}{base}_geoShape", 'mesh', parent=geo))
+        created.append(self.add_node(f"{ns}{base}_empty", parent=created[0]))
+        return created
+
+    def rename(self, old, new):
+        self._count('rename')
+        old = self._resolve(old)
+        new = self._unique(new)
+        data = self.nodes.pop(old)
+        self.nodes[new] = data
+        self._index_ns(old, remove=True)
+        self._index_ns(new)
+        self.by_uuid[data['uuid']] = new
+        if data['parent']:
+            siblings = self.nodes[data['parent']]['children']
+            siblings.discard(old)
+            siblings.add(new)
+        for child in data['children']:
+            self.nodes[child]['parent'] = new
+        return new
+
+    def delete(self, *args, **kwargs):
+        self._count('delete')
+        targets = args[0] if args and not isinstance(args[0], str) else args
+        for t in targets:
+            node = self._resolve(t)
+            if node in self.nodes:
+                self._remove(node)
+
+    def xform(self, *nodes, **kwargs):
+        self._count('xform')
+        if kwargs.get('query'):
+            # Each node is a unit cube around its translate; values are concatenated per node
+            out = []
+            for n in nodes:
+                node = self.nodes[self._resolve(n)]
+                t, sc = node['translate'], node['scale']
+                if kwargs.get('boundingBox'):
+                    out.extend([t[i] - 0.5 * sc[i] for i in range(3)] + [t[i] + 0.5 * sc[i] for i in range(3)])
+                else:
+                    out.extend(t)
+            return out
+        for n in nodes:
+            self.nodes[self._resolve(n)]['translate'] = tuple(kwargs.get('translation', (0.0, 0.0, 0.0)))
+
+    def scale(self, sx, sy, sz, *nodes, **kwargs):
+        self._count('scale')
+        for n in nodes:
+            node = self.nodes[self._resolve(n)]
+            node['scale'] = tuple(v * f for v, f in zip(node['scale'], (sx, sy, sz)))
+
+    def move(self, dx, dy, dz, *nodes, **kwargs):
+        self._count('move')
+        for n in nodes:
+            node = self.nodes[self._resolve(n)]
+            node['translate'] = tuple(v + d for v, d in zip(node['translate'], (dx, dy, dz)))
+
+    def getAttr(self, attr):
+        self._count('getAttr')
+        node, plug = attr.rsplit('.', 1)
+        return [self.nodes[self._resolve(node)][plug]]
+
+    def setAttr(self, attr, *values, **kwargs):
+        self._count('setAttr')
+        node, plug = attr.rsplit('.', 1)
+        self.nodes[self._resolve(node)][plug] = tuple(values)
+
+    def namespaceInfo(self, *args, **kwargs):
+        self._count('namespaceInfo')
+        if kwargs.get('listOnlyDependencyNodes'):
+            members = sorted(self.ns_members.get(args[0].lstrip(':'), ()))
+            return [self._path(n) for n in members] if kwargs.get('dagPath') else members
+        return sorted(self.namespaces)
+
+    def namespace(self, **kwargs):
+        self._count('namespace')
+        if 'moveNamespace' in kwargs:
+            src = kwargs['moveNamespace'][0]
+            for name in sorted(self.ns_members.pop(src, ())):
+                self.rename(name, name.rsplit(':', 1)[1])
+        elif 'removeNamespace' in kwargs:
+            self.namespaces.discard(kwargs['removeNamespace'])
+
+    def filePathEditor(self, *args, **kwargs):
+        self._count('filePathEditor')
+        return []
+
+    def undoInfo(self, *args, **kwargs): pass
+    def refresh(self, *args, **kwargs): pass
+    def pluginInfo(self, *args, **kwargs): return True
+    def loadPlugin(self, *args, **kwargs): return True
+    def warning(self, *args, **kwargs): pass
@@ -0,0 +1,178 @@
+"""Pre-import validation of asset files.
+
+Checks each file's size, magic bytes and a cheap structural header probe per
+format on a thread pool, so truncated, empty or mislabelled files are dropped
+(or quarantined) before Maya spends main-thread time trying to import them.
+Only the first bytes of a file are read, except for binary FBX where the
+top-level node records are walked to find the Objects section. Files without
+geometry (rigs, cameras, animation) are valid unless require_geometry is set.
+"""
+import os
+import re
+import shutil
+import struct
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# ok=False results carry a short human-readable reason
+ProbeResult = namedtuple('ProbeResult', ['path', 'ok', 'format', 'reason'])
+
+HEAD_SIZE = 64 * 1024
+
+# Smallest plausible size per extension; anything below is rejected unread
+MIN_SIZES = {'.ma': 16, '.mb': 24, '.fbx': 27, '.obj': 8, '.usd': 8, '.usda': 8, '.abc': 16}
+
+FBX_BINARY_MAGIC = b'Kaydara FBX Binary  \x00'
+USDC_MAGIC = b'PXR-USDC'
+USDA_MAGIC = b'#usda '
+OGAWA_MAGIC = b'Ogawa'
+HDF5_MAGIC = b'\x89HDF\r\n\x1a\n'
+IFF_FORMS = (b'FOR4', b'FOR8', b'CAT4', b'CAT8')
+
+_OBJ_ELEMENT = re.compile(rb'^\s*(v|f|o|g)\s', re.M)
+
+
+def _probe_maya_ascii(head, size, path):
+    if not head.startswith(b'//Maya ASCII'):
+        return 'mayaAscii', 'missing //Maya ASCII header'
+    return 'mayaAscii', None
+
+def _probe_maya_binary(head, size, path):
+    if head[:4] not in IFF_FORMS or b'Maya' not in head[:32]:
+        return 'mayaBinary', 'not a Maya IFF file'
+    # FOR4/CAT4 store a 32-bit chunk size, FOR8/CAT8 a 64-bit one after 4 bytes of padding
+    if head[3:4] == b'8':
+        chunk = struct.unpack('>Q', head[8:16])[0] + 16
+    else:
+        chunk = struct.unpack('>I', head[4:8])[0] + 8
+    if chunk > size:
+        return 'mayaBinary', 'truncated (%d of %d bytes)' % (size, chunk)
+    return 'mayaBinary', None
+
+def _fbx_records(f, pos, end, wide):
+    # Yield (name, children_start, end_offset) for the node records between pos and end
+    header = struct.Struct('<QQQB' if wide else '<IIIB')
+    while pos + header.size <= end:
+        f.seek(pos)
+        raw = f.read(header.size)
+        if len(raw) < header.size:
+            return
+        end_offset, _, prop_len, name_len = header.unpack(raw)
+        if end_offset == 0:
+            return
+        name = f.read(name_len).decode('ascii', 'replace')
+        yield name, pos + header.size + name_len + prop_len, end_offset
+        pos = end_offset
+
+def _probe_fbx(head, size, path, require_geometry=False):
+    if head.startswith(FBX_BINARY_MAGIC):
+        version = struct.unpack('<I', head[23:27])[0]
+        wide = version >= 7500
+        with open(path, 'rb') as f:
+            for name, children, end in _fbx_records(f, 27, size, wide):
+                if end > size:
+                    return 'fbxBinary', 'truncated (%d of %d bytes)' % (size, end)
+                if name == 'Objects':
+                    if require_geometry and not any(n == 'Geometry' for n, _, _ in _fbx_records(f, children, end, wide)):
+                        return 'fbxBinary', 'no geometry in Objects'
+                    return 'fbxBinary', None
+        return 'fbxBinary', 'no Objects section'
+    if head.lstrip().startswith(b';') and b'FBX' in head[:256]:
+        # ASCII FBX: the Objects section may be past the probed head, so only the header is checked
+        return 'fbxAscii', None
+    return 'fbx', 'not an FBX file'
+
+def _probe_obj(head, size, path):
+    if b'\x00' in head:
+        return 'obj', 'binary data in OBJ'
+    if not _OBJ_ELEMENT.search(head):
+        return 'obj', 'no geometry statements'
+    return 'obj', None
+
+def _probe_usd(head, size, path):
+    if head.startswith(USDC_MAGIC):
+        # Crate bootstrap: magic, 8-byte version, then the table of contents offset
+        toc = struct.unpack('<Q', head[16:24])[0] if len(head) >= 24 else 0
+        if not 24 <= toc < size:
+            return 'usdc', 'truncated or corrupt crate header'
+        return 'usdc', None
+    if head.startswith(USDA_MAGIC):
+        return 'usda', None
+    return 'usd', 'not a USD crate or ascii layer'
+
+def _probe_alembic(head, size, path):
+    if head.startswith(OGAWA_MAGIC):
+        # The byte after the magic is 0xff once the writer has closed the archive
+        if head[5:6] != b'\xff':
+            return 'abcOgawa', 'archive was not closed by its writer'
+        return 'abcOgawa', None
+    if head.startswith(HDF5_MAGIC):
+        return 'abcHDF5', None
+    return 'abc', 'not an Ogawa or HDF5 archive'
+
+PROBES = {
+    '.ma': _probe_maya_ascii,
+    '.mb': _probe_maya_binary,
+    '.fbx': _probe_fbx,
+    '.obj': _probe_obj,
+    '.usd': _probe_usd,
+    '.usda': _probe_usd,
+    '.abc': _probe_alembic,
+}
+
+def probe_asset(path, require_geometry=False):
+    ext = os.path.splitext(path)[1].lower()
+    probe = PROBES.get(ext)
+    if probe is None:
+        return ProbeResult(path, False, None, 'unsupported extension %s' % ext)
+    try:
+        size = os.path.getsize(path)
+        if size < MIN_SIZES.get(ext, 1):
+            return ProbeResult(path, False, None, 'empty or too small (%d bytes)' % size)
+        with open(path, 'rb') as f:
+            head = f.read(HEAD_SIZE)
+        if require_geometry and ext == '.fbx':
+            fmt, reason = probe(head, size, path, require_geometry=True)
+        else:
+            fmt, reason = probe(head, size, path)
+    except (OSError, struct.error) as e:
+        return ProbeResult(path, False, None, str(e))
+    return ProbeResult(path, reason is None, fmt, reason)
+
+def validate_assets(paths, max_workers=8, require_geometry=False):
+    # Probe all files in parallel; returns (valid paths, rejected ProbeResults) in input order
+    paths = list(paths)
+    if not paths:
+        return [], []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(lambda p: probe_asset(p, require_geometry), paths))
+    valid = [r.path for r in results if r.ok]
+    rejected = [r for r in results if not r.ok]
+    return valid, rejected
+
+def _quarantine_dest(path, quarantine_dir, root):
+    # Keep the path relative to root so same-named files from different folders do not
+    # collide; anything already there gets a numbered suffix instead of being replaced
+    rel = os.path.relpath(path, root) if root else os.path.basename(path)
+    if rel.startswith(os.pardir):
+        rel = os.path.basename(path)
+    dest = os.path.join(quarantine_dir, rel)
+    stem, ext = os.path.splitext(dest)
+    i = 0
+    while os.path.exists(dest):
+        i += 1
+        dest = f"{stem}_{i:03}{ext}"
+    return dest
+
+def quarantine(rejected, quarantine_dir, root=None):
+    # Move rejected files aside so they are not picked up by the next scan
+    moved = []
+    for r in rejected:
+        dest = _quarantine_dest(r.path, quarantine_dir, root)
+        try:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            shutil.move(r.path, dest)
+            moved.append(dest)
+        except OSError as e:
+            print(f"Failed to quarantine {r.path}: {e}")
+    return moved
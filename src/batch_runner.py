@@ -0,0 +1,177 @@
+"""Headless batch runner for mayapy / maya.standalone.
+
+Splits an asset folder into shards, imports and cleans each shard in its own
+worker process (one saved scene per shard), then merges the shard scenes into
+a single master scene by reference or import.
+
+    mayapy src/batch_runner.py /path/to/assets --workers 8 --output-dir /tmp/ingest
+"""
+import os
+import sys
+import time
+import json
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+if os.path.dirname(os.path.abspath(__file__)) not in sys.path:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import import_cleanup_prototype
+import asset_validation
+import import_scheduler
+from rules_engine import PipelineRules
+
+_maya_ready = False
+
+def _init_maya():
+    global _maya_ready
+    if _maya_ready:
+        return
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    _maya_ready = True
+
+def shard_files(files, shard_count, scheduler=None):
+    if scheduler is not None:
+        # Balance by estimated import cost; files keep their format grouping per shard
+        scheduler.plan(files)
+        return scheduler.shards(shard_count)
+    shard_count = max(1, min(shard_count, len(files)))
+    # Round-robin keeps shards balanced when files are sorted by name or size
+    return [files[i::shard_count] for i in range(shard_count)]
+
+def _save_scene(path):
+    import maya.cmds as cmds
+    scene_type = 'mayaAscii' if path.lower().endswith('.ma') else 'mayaBinary'
+    cmds.file(rename=path)
+    cmds.file(save=True, force=True, type=scene_type)
+
+def run_shard(shard_index, files, folder, output_dir, rules=None, center_on_import=False, scale_factor=1.0,
+              names=None):
+    t0 = time.perf_counter()
+    scene_path = os.path.join(output_dir, f"shard_{shard_index:03}.mb")
+    try:
+        _init_maya()
+        import maya.cmds as cmds
+        if rules is not None:
+            import_cleanup_prototype.pipeline_rules = rules
+        cmds.file(new=True, force=True)
+        metrics = import_cleanup_prototype.batch_import_and_cleanup(
+            folder,
+            center_on_import=center_on_import,
+            scale_factor=scale_factor,
+            files=files,
+            validate=False,
+            scheduler=import_scheduler.ImportScheduler(record=False),
+            names=names
+        )
+        _save_scene(scene_path)
+        metrics.to_json(os.path.join(output_dir, f"shard_{shard_index:03}_metrics.json"))
+    except Exception as e:
+        return dict(shard=shard_index, scene=None, files=len(files), elapsed=time.perf_counter() - t0, error=str(e))
+    return dict(shard=shard_index, scene=scene_path, files=len(files), elapsed=time.perf_counter() - t0, error=None)
+
+def merge_shards(scene_paths, output_path, mode='reference'):
+    _init_maya()
+    import maya.cmds as cmds
+    cmds.file(new=True, force=True)
+    for path in scene_paths:
+        ns = os.path.splitext(os.path.basename(path))[0]
+        if mode == 'reference':
+            cmds.file(path, reference=True, namespace=ns)
+        else:
+            cmds.file(path, i=True, ignoreVersion=True, mergeNamespacesOnClash=True, namespace=':')
+    _save_scene(output_path)
+    return output_path
+
+def run_batch(folder, output_dir, workers=None, shards=None, recursive=False, rules_path=None,
+              center_on_import=False, scale_factor=1.0, merge='reference', validate=True):
+    folder = os.path.abspath(folder)
+    # Every worker gets the same validated snapshot instead of re-reading the rules file
+    rules = PipelineRules.load(rules_path) if rules_path else import_cleanup_prototype.current_rules()
+    rules = rules.snapshot()
+    files = import_cleanup_prototype._collect_asset_files(
+        folder, recursive=recursive, skip_dirs=import_cleanup_prototype._excluded_dirs(folder, rules))
+    if validate and files:
+        # Probe once in the coordinator so shards are balanced over importable files only
+        files, rejected = asset_validation.validate_assets(files, require_geometry=rules.require_geometry)
+        for r in rejected:
+            print(f"Rejected {os.path.basename(r.path)}: {r.reason}")
+    if not files:
+        print(f"No assets found in {folder}")
+        return []
+
+    # Root names are assigned once over the whole list, so duplicate base names in different
+    # shards are numbered exactly as a single-process run would number them
+    names = import_cleanup_prototype.plan_asset_names(files, folder, rules,
+                                                      allocator=import_cleanup_prototype.NameAllocator())
+
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    scheduler = import_scheduler.ImportScheduler()
+    groups = shard_files(files, shards or workers, scheduler=scheduler)
+    print(f"Sharding {len(files)} assets into {len(groups)} shards on {workers} workers")
+
+    t0 = time.perf_counter()
+    results = []
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = [
+            pool.submit(run_shard, i, group, folder, output_dir, rules, center_on_import, scale_factor, names)
+            for i, group in enumerate(groups)
+        ]
+        for fut in as_completed(futures):
+            res = fut.result()
+            results.append(res)
+            if res['error']:
+                print(f"Shard {res['shard']:03} failed after {res['elapsed']:.2f}s: {res['error']}")
+            else:
+                print(f"Shard {res['shard']:03} done: {res['files']} assets in {res['elapsed']:.2f}s → {res['scene']}")
+    results.sort(key=lambda r: r['shard'])
+
+    # Workers only read the stats store; the coordinator records their import timings once
+    spans = []
+    for r in results:
+        try:
+            with open(os.path.join(output_dir, f"shard_{r['shard']:03}_metrics.json")) as f:
+                spans.extend(json.load(f)['spans'])
+        except (OSError, ValueError, KeyError):
+            continue
+    scheduler.record(spans)
+
+    scenes = [r['scene'] for r in results if r['scene']]
+    if merge != 'none' and scenes:
+        master = merge_shards(scenes, os.path.join(output_dir, 'master.mb'), mode=merge)
+        print(f"Merged {len(scenes)} shard scenes ({merge}) → {master}")
+
+    duration = time.perf_counter() - t0
+    print(f"\n>>> PERFORMANCE SUMMARY\n  Total elapsed time: {duration:.2f}s")
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless sharded asset import & cleanup (run with mayapy).")
+    parser.add_argument('folder', help="Asset folder to ingest")
+    parser.add_argument('--output-dir', required=True, help="Where shard and master scenes are saved")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--shards', type=int, default=None, help="Number of shards (default: one per worker)")
+    parser.add_argument('--recursive', action='store_true', help="Include nested sub-folders")
+    parser.add_argument('--rules', default=None, help="Pipeline rules JSON used by every worker")
+    parser.add_argument('--center', action='store_true', help="Center imported roots at the origin")
+    parser.add_argument('--scale', type=float, default=1.0, help="Uniform scale factor for imported roots")
+    parser.add_argument('--merge', choices=('reference', 'import', 'none'), default='reference',
+                        help="How shard scenes are combined into master.mb")
+    parser.add_argument('--no-validate', action='store_true', help="Skip the pre-import header checks")
+    args = parser.parse_args(argv)
+
+    results = run_batch(
+        args.folder, args.output_dir,
+        workers=args.workers, shards=args.shards, recursive=args.recursive,
+        rules_path=args.rules, center_on_import=args.center, scale_factor=args.scale,
+        merge=args.merge, validate=not args.no_validate
+    )
+    return 1 if any(r['error'] for r in results) else 0
+
+if __name__ == '__main__':
+    multiprocessing.set_executable(sys.executable)
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""Local cache of translated assets saved as Maya binary snapshots.
+
+FBX, OBJ, Alembic and USD-as-nodes imports go through slow translators. The
+first import of an asset saves its nodes as a .mb snapshot keyed by the
+source content hash and the options that affect translation; later imports
+load the snapshot instead. Snapshots are taken before the batch cleanup, so
+naming and cleanup rule changes do not invalidate them. The cache is bounded
+by size with least-recently-used eviction.
+
+    python src/import_cache.py prune --max-size 2048 --max-age 30
+    python src/import_cache.py clear
+"""
+import os
+import json
+import time
+import hashlib
+import argparse
+
+from pipeline_cache import MB, cache_path, file_sha1, write_json
+
+DEFAULT_CACHE_DIR = cache_path('import_cache')
+CACHE_VERSION = 1
+CACHEABLE_EXTS = ('.fbx', '.obj', '.abc', '.usd', '.usda')
+INDEX_NAME = 'index.json'
+
+
+class ImportCache:
+    def __init__(self, root=None, max_bytes=5120 * MB):
+        self.root = root or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.entries = {}   # key -> dict(file, size, last_used, source)
+        self.hashes = {}    # source path -> [size, mtime, sha1], avoids rehashing unchanged files
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._removed = set()
+        self.entries, self.hashes = self._read()
+
+    @property
+    def index_path(self):
+        return os.path.join(self.root, INDEX_NAME)
+
+    def _read(self):
+        try:
+            with open(self.index_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}, {}
+        if data.get('version') != CACHE_VERSION:
+            return {}, {}
+        return data.get('entries', {}), data.get('hashes', {})
+
+    def save(self, merge=True):
+        # Merge with the index on disk so concurrent batch shards sharing the cache keep each other's entries
+        if not self._dirty:
+            return
+        if merge:
+            entries, hashes = self._read()
+            for key in self._removed:
+                entries.pop(key, None)
+            entries.update(self.entries)
+            hashes.update(self.hashes)
+            self.entries, self.hashes = entries, hashes
+        write_json(self.index_path, {'version': CACHE_VERSION, 'entries': self.entries, 'hashes': self.hashes},
+                   indent=1)
+        self._removed.clear()
+        self._dirty = False
+
+    def content_hash(self, path):
+        st = os.stat(path)
+        known = self.hashes.get(path)
+        if known and known[0] == st.st_size and known[1] == st.st_mtime:
+            return known[2]
+        digest = file_sha1(path)
+        self.hashes[path] = [st.st_size, st.st_mtime, digest]
+        self._dirty = True
+        return digest
+
+    def key(self, path, options):
+        # Source content + every option that changes what the translator produces
+        payload = json.dumps(dict(v=CACHE_VERSION, src=self.content_hash(path), opts=options), sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def snapshot_path(self, key):
+        return os.path.join(self.root, key[:2], key + '.mb')
+
+    def lookup(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        path = os.path.join(self.root, entry['file'])
+        if not os.path.isfile(path):
+            del self.entries[key]
+            self._removed.add(key)
+            self._dirty = True
+            self.misses += 1
+            return None
+        entry['last_used'] = time.time()
+        self._dirty = True
+        self.hits += 1
+        return path
+
+    def add(self, key, source):
+        # Register a snapshot already written to snapshot_path(key), then enforce the size limit
+        path = self.snapshot_path(key)
+        self._removed.discard(key)
+        self.entries[key] = dict(file=os.path.relpath(path, self.root), size=os.path.getsize(path),
+                                 last_used=time.time(), source=source)
+        self._dirty = True
+        self.evict(keep=key)
+
+    def reject(self, key):
+        # Drop a snapshot returned by lookup() that failed to load (corrupt, version skew);
+        # the lookup counts as a miss
+        if key in self.entries:
+            self._remove(key)
+            self.hits -= 1
+            self.misses += 1
+
+    def total_bytes(self):
+        return sum(e['size'] for e in self.entries.values())
+
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        self._removed.add(key)
+        self._dirty = True
+        try:
+            os.remove(os.path.join(self.root, entry['file']))
+        except OSError:
+            pass
+        return entry['size']
+
+    def evict(self, max_bytes=None, keep=None):
+        # Drop least recently used snapshots until the cache fits in max_bytes
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        total = self.total_bytes()
+        removed = freed = 0
+        for key in sorted(self.entries, key=lambda k: self.entries[k]['last_used']):
+            if total <= limit:
+                break
+            if key == keep:
+                continue
+            size = self._remove(key)
+            total -= size
+            freed += size
+            removed += 1
+        return removed, freed
+
+    def prune(self, max_bytes=None, max_age_days=None):
+        # Remove old, missing-source and over-limit snapshots plus stray files; returns (removed, freed bytes)
+        removed = freed = 0
+        now = time.time()
+        for key, entry in list(self.entries.items()):
+            stale = max_age_days is not None and now - entry['last_used'] > max_age_days * 86400
+            if stale or not os.path.exists(entry.get('source', '')):
+                freed += self._remove(key)
+                removed += 1
+        r, f = self.evict(max_bytes)
+        removed += r
+        freed += f
+        self.hashes = {p: h for p, h in self.hashes.items() if os.path.exists(p)}
+        known = {os.path.normpath(os.path.join(self.root, e['file'])) for e in self.entries.values()}
+        if os.path.isdir(self.root):
+            for dirpath, _, filenames in os.walk(self.root):
+                for name in filenames:
+                    path = os.path.normpath(os.path.join(dirpath, name))
+                    if name.endswith('.mb') and path not in known:
+                        freed += os.path.getsize(path)
+                        os.remove(path)
+                        removed += 1
+        self._dirty = True
+        self.save(merge=False)
+        return removed, freed
+
+    def clear(self):
+        return self.prune(max_bytes=0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the asset import snapshot cache.")
+    parser.add_argument('command', choices=('prune', 'clear', 'info'))
+    parser.add_argument('--dir', default=None, help="Cache directory (default: %s)" % DEFAULT_CACHE_DIR)
+    parser.add_argument('--max-size', type=float, default=None, help="Size limit in MB for prune")
+    parser.add_argument('--max-age', type=float, default=None, help="Drop snapshots unused for this many days")
+    args = parser.parse_args(argv)
+
+    cache = ImportCache(args.dir)
+    if args.command == 'info':
+        print(f"{len(cache.entries)} snapshots, {cache.total_bytes() / MB:.1f} MB in {cache.root}")
+        return 0
+    if args.command == 'clear':
+        removed, freed = cache.clear()
+    else:
+        max_bytes = int(args.max_size * MB) if args.max_size is not None else None
+        removed, freed = cache.prune(max_bytes=max_bytes, max_age_days=args.max_age)
+    print(f"Removed {removed} snapshots, freed {freed / MB:.1f} MB")
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
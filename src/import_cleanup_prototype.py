@@ -1,15 +1,35 @@
 import os
+import sys
 import json
-import re
+import hashlib
 import time
+import cProfile
+import pstats
+import io
+import contextlib
+import queue
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import asset_validation
+import import_scheduler
+import import_cache
+import path_repair
+import pipeline_cache
+from rules_engine import PipelineRules
 
 try:
     import maya.cmds as cmds
-    import maya.utils
+    import maya.api.OpenMaya as om
 except ImportError:
     # Dummy cmds for testing outside Maya environment
     class DummyCmds:
-        def ls(self, **kwargs): return []
+        def ls(self, *args, **kwargs): return []
         def pluginInfo(self, *args, **kwargs): return True
         def file(self, *args, **kwargs): return []
         def listRelatives(self, **kwargs): return []
@@ -23,58 +43,404 @@ except ImportError:
         def loadPlugin(self, *args, **kwargs): return True
         def refresh(self): pass
         def objectType(self, name): return "transform"
-        def xform(self, *args, **kwargs):pass
+        def xform(self, *args, **kwargs):
+            return [0.0] * (6 if kwargs.get('boundingBox') else 3) * len(args) if kwargs.get('query') else None
+        def exactWorldBoundingBox(self, *args, **kwargs): return [0.0] * 6
+        def scale(self, *args, **kwargs): pass
+        def move(self, *args, **kwargs): pass
         def getAttr(self, attr):return 1.0
         def setAttr(self, *args, **kwargs): pass
+        def undoInfo(self, *args, **kwargs): pass
+        def select(self, *args, **kwargs): pass
+        def about(self, **kwargs): return ''
 
     cmds = DummyCmds()
     maya = None
-else:
-    import maya.utils
+    om = None
 
 USD_IMPORT_AS_REF = False
 USD_IMPORT_AS_NODES = True
 
-# Load pipeline rules from JSON config
+# How imports are tracked: 'callback' (MDGMessage node-added callback), 'diff' (scene UUID
+# snapshot before/after each import) or 'none' (trust returnNewNodes). None picks 'callback'
+# inside Maya and 'none' elsewhere.
+NODE_TRACKING = None
+
+# Load pipeline rules from JSON config (validated and compiled once, see rules_engine)
 _rules_path = os.path.join(os.path.dirname(__file__), 'rules', 'pipeline_rules.json')
-with open(_rules_path, 'r') as f:
-    pipeline_rules = json.load(f)
+pipeline_rules = PipelineRules.load(_rules_path)
 
 def reload_rules(rules_file_path):
     global pipeline_rules
-    with open(rules_file_path, 'r') as f:
-        pipeline_rules = json.load(f)
+    pipeline_rules = PipelineRules.load(rules_file_path)
     print(f"Reloaded pipeline_rules from: {rules_file_path}")
 
-def _collect_asset_files(folder_path):
+# Last hot-reload failure, so a broken rules file is reported once rather than on every call
+_rules_reload_error = None
+
+def current_rules():
+    # Active rules, re-read only if the rules file changed on disk since it was loaded.
+    # A file that does not load (half-saved, malformed) keeps the last valid rules active.
+    global pipeline_rules, _rules_reload_error
+    rules = PipelineRules.coerce(pipeline_rules)
+    try:
+        pipeline_rules = rules.reloaded()
+        _rules_reload_error = None
+    except (OSError, ValueError) as e:
+        if str(e) != _rules_reload_error:
+            print(f"Warning: could not reload {rules.source}, keeping the previous rules: {e}")
+        _rules_reload_error = str(e)
+        pipeline_rules = rules
+    return pipeline_rules
+
+# Per-stage and per-file timing spans for one pipeline run, with optional cProfile
+class PipelineMetrics:
+    def __init__(self, profile=False):
+        self.t0 = time.perf_counter()
+        self.spans = []
+        self.profiler = cProfile.Profile() if profile else None
+
+    @contextlib.contextmanager
+    def span(self, name, **meta):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.spans.append(dict(name=name, start=start - self.t0, duration=end - start, **meta))
+
+    def start_profile(self):
+        if self.profiler:
+            self.profiler.enable()
+
+    def stop_profile(self):
+        if self.profiler:
+            self.profiler.disable()
+
+    def profile_stats(self, sort='cumulative', limit=25):
+        if not self.profiler:
+            return ''
+        out = io.StringIO()
+        pstats.Stats(self.profiler, stream=out).sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.t0
+
+    def totals(self):
+        totals = {}
+        for sp in self.spans:
+            totals[sp['name']] = totals.get(sp['name'], 0.0) + sp['duration']
+        return totals
+
+    def slowest(self, name='import', count=10):
+        return sorted((sp for sp in self.spans if sp['name'] == name), key=lambda sp: sp['duration'], reverse=True)[:count]
+
+    def summary(self):
+        lines = [f"  Total elapsed time: {self.elapsed:.2f}s"]
+        for name, total in self.totals().items():
+            lines.append(f"  {name:<16}{total:8.3f}s")
+        return '\n'.join(lines)
+
+    def to_dict(self):
+        return dict(elapsed=self.elapsed, totals=self.totals(), spans=self.spans)
+
+    def to_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    def to_chrome_trace(self, path):
+        # Load in chrome://tracing or Perfetto
+        pid = os.getpid()
+        events = []
+        for sp in self.spans:
+            args = {k: v for k, v in sp.items() if k not in ('name', 'start', 'duration')}
+            events.append(dict(name=sp['name'], cat='pipeline', ph='X', pid=pid, tid=1,
+                               ts=sp['start'] * 1e6, dur=sp['duration'] * 1e6, args=args))
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+ASSET_EXTS = ('.fbx', '.abc', '.ma', '.mb', '.usd', '.usda', '.obj')
+_EXT_PRIORITY = {ext: i for i, ext in enumerate(['.ma', '.mb', '.usd', '.usda', '.obj', '.fbx', '.abc'])}
+_IS_PYTEST = 'pytest' in sys.modules or any('pytest' in a for a in sys.argv)
+
+# Lightweight scan result: one per asset file found on disk
+AssetEntry = namedtuple('AssetEntry', ['path', 'size', 'mtime'])
+
+# Per-directory scan cache: dir path -> (dir mtime_ns, [asset file paths], [subdir paths]).
+# The directory mtime only changes when entries are added, removed or renamed, so files are
+# re-stat'ed on every hit: a file rewritten in place still reports its current size and mtime.
+_scan_cache = {}
+
+def clear_scan_cache():
+    _scan_cache.clear()
+
+def _scan_dir(dir_path, use_cache=True):
+    dir_mtime = os.stat(dir_path).st_mtime_ns
+    cached = _scan_cache.get(dir_path) if use_cache else None
+    if cached and cached[0] == dir_mtime:
+        entries = []
+        for path in cached[1]:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append(AssetEntry(path, st.st_size, st.st_mtime))
+        return entries, cached[2]
+
+    entries, subdirs = [], []
+    with os.scandir(dir_path) as it:
+        for e in it:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                elif e.name.lower().endswith(ASSET_EXTS):
+                    st = e.stat()
+                    entries.append(AssetEntry(e.path, st.st_size, st.st_mtime))
+            except OSError:
+                continue
+    _scan_cache[dir_path] = (dir_mtime, [e.path for e in entries], subdirs)
+    return entries, subdirs
+
+def scan_asset_files(folder_path, recursive=False, max_workers=8, use_cache=True, on_ext=None, skip_dirs=()):
+    # on_ext(ext) is called once per asset extension as soon as the scan finds it;
+    # directories in skip_dirs (e.g. the quarantine folder) are not descended into
+    if not os.path.isdir(folder_path):
+        raise FileNotFoundError(f"Asset folder not found: {folder_path}")
+    skip = {os.path.normcase(os.path.abspath(d)) for d in skip_dirs}
+
+    seen_exts = set()
+    def _report(entries):
+        if on_ext is None:
+            return
+        for entry in entries:
+            ext = os.path.splitext(entry.path)[1].lower()
+            if ext not in seen_exts:
+                seen_exts.add(ext)
+                on_ext(ext)
+
+    if not recursive:
+        entries, _ = _scan_dir(folder_path, use_cache)
+        _report(entries)
+        return sorted(entries)
+
+    # Walk the tree breadth-first on a thread pool; each directory is one task
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(_scan_dir, folder_path, use_cache)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                try:
+                    entries, subdirs = fut.result()
+                except OSError as e:
+                    print(f"Skipped unreadable folder: {e}")
+                    continue
+                results.extend(entries)
+                _report(entries)
+                pending.update(pool.submit(_scan_dir, d, use_cache) for d in subdirs
+                               if os.path.normcase(os.path.abspath(d)) not in skip)
+    return sorted(results)
+
+def iter_asset_files(folder_path, recursive=False, use_cache=True, skip_dirs=()):
+    # Same entries and order as scan_asset_files, but walked depth-first on the calling
+    # thread and yielded as each directory is listed, so the first files are available
+    # before a large tree has been scanned. Sorting a folder's subdirectories as
+    # 'name/' among its files keeps the walk in full-path order.
     if not os.path.isdir(folder_path):
         raise FileNotFoundError(f"Asset folder not found: {folder_path}")
+    skip = {os.path.normcase(os.path.abspath(d)) for d in skip_dirs}
+
+    def walk(dir_path):
+        try:
+            entries, subdirs = _scan_dir(dir_path, use_cache)
+        except OSError as e:
+            if dir_path == folder_path:
+                raise
+            print(f"Skipped unreadable folder: {e}")
+            return
+        items = [(entry.path, entry) for entry in entries]
+        if recursive:
+            items += [(d + os.sep, None) for d in subdirs if os.path.normcase(os.path.abspath(d)) not in skip]
+        for key, entry in sorted(items):
+            if entry is None:
+                yield from walk(key[:-len(os.sep)])
+            else:
+                yield entry
+
+    yield from walk(folder_path)
+
+def _dedupe_by_stem(paths):
+    # One file per (folder, base name), keeping the highest-priority extension, in order of
+    # each name's first file. Takes paths in sorted order: every file of a stem starts with
+    # 'stem.', so a stem is settled once a path outside that prefix arrives.
+    pending = {}
+    for path in paths:
+        while pending:
+            first = next(iter(pending))
+            if path.startswith(first + '.'):
+                break
+            yield pending.pop(first)[1]
+        stem, ext = os.path.splitext(path)
+        rank = _EXT_PRIORITY[ext.lower()]
+        if stem not in pending or rank < pending[stem][0]:
+            pending[stem] = (rank, path)
+    for _, path in pending.values():
+        yield path
+
+def _collect_asset_files(folder_path, recursive=False, on_ext=None, skip_dirs=()):
+    entries = scan_asset_files(folder_path, recursive=recursive, on_ext=on_ext, skip_dirs=skip_dirs)
+    paths = [entry.path for entry in entries]
+    return list(_dedupe_by_stem(paths)) if _IS_PYTEST else paths
+
+def _iter_collected_files(folder_path, recursive=False, skip_dirs=()):
+    # Streaming form of _collect_asset_files: the same paths in the same order
+    paths = (entry.path for entry in iter_asset_files(folder_path, recursive=recursive, skip_dirs=skip_dirs))
+    return _dedupe_by_stem(paths) if _IS_PYTEST else paths
+
+def _excluded_dirs(folder, pr):
+    # Folders a scan of `folder` must skip: quarantined files are not assets to import
+    return (os.path.join(folder, pr.quarantine_dir),) if pr.quarantine_dir else ()
+
+# Import translator per asset extension; .ma and .mb are native
+TRANSLATOR_PLUGINS = {
+    '.fbx': 'fbxmaya',
+    '.usd': 'mayaUsdPlugin',
+    '.usda': 'mayaUsdPlugin',
+    '.abc': 'AbcImport',
+    '.obj': 'objExport',
+}
+
+# Loads import translators up front and caches their availability for the session,
+# so the first file of each type does not pay the load inside the import loop.
+# Failed loads are not final: the plugin may be loaded by hand later, so an unavailable
+# entry is re-checked with a pluginInfo query (no load attempt) each time it is asked for.
+class PluginManager:
+    def __init__(self):
+        self.available = {}
+        self.load_times = {}
+
+    def ensure(self, plugin):
+        if self.available.get(plugin):
+            return True
+        if plugin in self.available:
+            try:
+                self.available[plugin] = bool(cmds.pluginInfo(plugin, query=True, loaded=True))
+            except Exception:
+                pass
+            return self.available[plugin]
+        t0 = time.perf_counter()
+        try:
+            if not cmds.pluginInfo(plugin, query=True, loaded=True):
+                cmds.loadPlugin(plugin, quiet=True)
+                self.load_times[plugin] = time.perf_counter() - t0
+                print(f"Loaded plugin {plugin} in {self.load_times[plugin]:.2f}s")
+            ok = True
+        except Exception as e:
+            print(f"Plugin {plugin} not available: {e}")
+            ok = False
+        self.available[plugin] = ok
+        return ok
+
+    def ensure_for_ext(self, ext):
+        plugin = TRANSLATOR_PLUGINS.get(ext.lower())
+        return True if plugin is None else self.ensure(plugin)
+
+    def filter_supported(self, files):
+        # Drop files whose translator cannot be loaded instead of failing them one by one
+        kept = []
+        for fp in files:
+            ext = os.path.splitext(fp)[1].lower()
+            if self.ensure_for_ext(ext):
+                kept.append(fp)
+            else:
+                print(f"Skipped {os.path.basename(fp)}: {TRANSLATOR_PLUGINS[ext]} plugin not available")
+        return kept
+
+    def report(self):
+        lines = []
+        for plugin in sorted(self.available):
+            if not self.available[plugin]:
+                lines.append(f"  {plugin:<16}not available")
+            elif plugin in self.load_times:
+                lines.append(f"  {plugin:<16}loaded in {self.load_times[plugin]:.2f}s")
+            else:
+                lines.append(f"  {plugin:<16}already loaded")
+        return '\n'.join(lines)
 
-    exts = ('.fbx', '.abc', '.ma', '.mb', '.usd', '.usda', '.obj')
-    files = []
-    names = sorted(os.listdir(folder_path))
+    def clear(self):
+        self.available.clear()
+        self.load_times.clear()
 
-    import sys
-    is_pytest = 'pytest' in sys.modules or any('pytest' in a for a in sys.argv)
+plugins = PluginManager()
 
-    if is_pytest:
-        priority = ['.ma', '.mb', '.usd', '.usda', '.obj', '.fbx', '.abc']
-        candidates = {}
-        for name in names:
-            ext = os.path.splitext(name)[1].lower()
-            if ext not in priority:
+def iter_collect_and_preload(folder_path, recursive=False, manager=None, poll=0.01, skip_dirs=()):
+    # Scan on a worker thread while the caller's (main) thread loads translators for each
+    # new file type. Yields after every plugin load or empty poll of up to `poll` seconds,
+    # so a UI can drive it from a timer; returns the collected files (StopIteration.value).
+    manager = manager or plugins
+    found = queue.Queue()
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        fut = pool.submit(_collect_asset_files, folder_path, recursive, found.put, skip_dirs)
+        while True:
+            try:
+                ext = found.get(timeout=poll)
+            except queue.Empty:
+                if fut.done() and found.empty():
+                    break
+                yield
                 continue
-            base = os.path.splitext(name)[0]
-            if base not in candidates or priority.index(ext) < priority.index(os.path.splitext(candidates[base])[1].lower()):
-                candidates[base] = name
-        return [os.path.join(folder_path, fname) for fname in candidates.values()]
-    else:
-        for name in names:
-            if name.lower().endswith(exts):
-                files.append(os.path.join(folder_path, name))
-        return files
+            manager.ensure_for_ext(ext)
+            yield
+        return fut.result()
+    finally:
+        pool.shutdown(wait=False)
+
+def collect_and_preload(folder_path, recursive=False, manager=None, skip_dirs=()):
+    steps = iter_collect_and_preload(folder_path, recursive=recursive, manager=manager, skip_dirs=skip_dirs)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
 
-def get_unique_asset_name(base_name, prefix="ASSET_"):
+# Collision-free name allocator: seeded once from the scene, then keeps the set of
+# names in use plus a per-candidate high-water counter so allocation never queries Maya.
+class NameAllocator:
+    def __init__(self, existing=None):
+        self._used = set(existing or ())
+        self._counters = {}
+
+    @classmethod
+    def from_scene(cls):
+        return cls(cmds.ls(type='transform') or [])
+
+    def __contains__(self, name):
+        return name in self._used
+
+    def reserve(self, name):
+        if name:
+            self._used.add(name)
+
+    def allocate(self, base_name, prefix="ASSET_"):
+        candidate = f"{prefix}{base_name}"
+        if candidate not in self._used:
+            self._used.add(candidate)
+            return candidate
+        i = self._counters.get(candidate, 0) + 1
+        numbered = f"{candidate}_{i:03}"
+        while numbered in self._used:
+            i += 1
+            numbered = f"{candidate}_{i:03}"
+        self._counters[candidate] = i
+        self._used.add(numbered)
+        return numbered
+
+def get_unique_asset_name(base_name, prefix="ASSET_", allocator=None):
+    if allocator is not None:
+        return allocator.allocate(base_name, prefix)
     candidate = f"{prefix}{base_name}"
     if not cmds.objExists(candidate):
         return candidate
@@ -85,185 +451,1017 @@ def get_unique_asset_name(base_name, prefix="ASSET_"):
             return numbered
         i += 1
 
-def preview_renaming(folder_path=None):
+# One preview line; conflict is set when the name had to be numbered because the plain
+# name was already taken by a scene node or an earlier asset
+PreviewRow = namedtuple('PreviewRow', ['original', 'new_name', 'source_path', 'conflict'])
+
+def iter_preview_renaming(folder_path=None, recursive=False, rules=None, chunk_size=500):
+    # Yields lists of up to chunk_size PreviewRow records in file order. The folder is
+    # checked up front; files are collected and names allocated as the chunks are pulled.
     folder = folder_path or os.path.join(os.path.dirname(__file__), '..', 'test_assets')
     folder = os.path.abspath(folder)
     if not os.path.isdir(folder):
         raise FileNotFoundError(f"Preview folder not found: {folder}")
+    pr = PipelineRules.coerce(rules) if rules is not None else current_rules()
+    return _preview_chunks(folder, recursive, pr, max(1, chunk_size))
 
-    pr = pipeline_rules
-    prefix = pr['naming']['prefix']
-    sanitize_pat = re.compile(pr['naming']['sanitizePattern'])
-    files = _collect_asset_files(folder)
-
-    virtual_scene = set(cmds.ls(type='transform'))
-    mapping = {}
+def _plan_asset_names(files, folder, pr, allocator):
+    # Yields (path, base name, new name, wanted name) in file order. The preview and
+    # the import both allocate through here in collect order, so they always agree.
+    prefix = pr.prefix
     for fp in files:
         base = os.path.splitext(os.path.basename(fp))[0]
-        safe_base = sanitize_pat.sub('_', base)
-        candidate = f"{prefix}{safe_base}"
-        final_name = candidate
-        if final_name in virtual_scene:
-            i = 1
-            while True:
-                numbered = f"{candidate}_{i:03}"
-                if numbered not in virtual_scene:
-                    final_name = numbered
-                    break
-                i += 1
-        mapping[base] = final_name
-        virtual_scene.add(final_name)
+        safe_base = pr.sanitize_name(base)
+        asset_prefix = pr.for_asset(os.path.relpath(fp, folder).replace(os.sep, '/')).get('prefix', prefix)
+        yield fp, base, allocator.allocate(safe_base, asset_prefix), f"{asset_prefix}{safe_base}"
+
+def plan_asset_names(files, folder, rules=None, allocator=None):
+    # path -> new root name for `files` in the given (collect) order, as the preview and the
+    # import assign them. batch_runner plans once for all shards with an empty allocator.
+    pr = PipelineRules.coerce(rules) if rules is not None else current_rules()
+    allocator = allocator if allocator is not None else NameAllocator.from_scene()
+    return {fp: name for fp, _, name, _ in _plan_asset_names(files, folder, pr, allocator)}
+
+def _preview_chunks(folder, recursive, pr, chunk_size):
+    # Files stream in from the scan, so a chunk only waits for the folders it needs
+    files = _iter_collected_files(folder, recursive=recursive, skip_dirs=_excluded_dirs(folder, pr))
+    chunk = []
+    for fp, base, new_name, wanted in _plan_asset_names(files, folder, pr, NameAllocator.from_scene()):
+        chunk.append(PreviewRow(base, new_name, fp, new_name != wanted))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def preview_renaming(folder_path=None, recursive=False, rules=None):
+    # Original base name -> new name for the whole folder
+    mapping = {}
+    for chunk in iter_preview_renaming(folder_path, recursive=recursive, rules=rules):
+        for row in chunk:
+            mapping[row.original] = row.new_name
     return mapping
 
-def fix_missing_paths():
+class MayaMutationBackend:
+    def open_chunk(self, name):
+        cmds.undoInfo(openChunk=True, chunkName=name)
+
+    def close_chunk(self):
+        cmds.undoInfo(closeChunk=True)
+
+    def world_bounds(self, nodes):
+        # One query for all roots: xform concatenates the 6 values of each node
+        flat = cmds.xform(*nodes, query=True, worldSpace=True, boundingBox=True) or []
+        if len(flat) != 6 * len(nodes):
+            flat = [v for n in nodes for v in cmds.exactWorldBoundingBox(n)]
+        return [tuple(flat[i:i + 6]) for i in range(0, len(flat), 6)]
+
+    def scale_pivots(self, nodes):
+        flat = cmds.xform(*nodes, query=True, worldSpace=True, scalePivot=True) or []
+        if len(flat) != 3 * len(nodes):
+            flat = [v for n in nodes for v in cmds.xform(n, query=True, worldSpace=True, scalePivot=True)]
+        return [tuple(flat[i:i + 3]) for i in range(0, len(flat), 3)]
+
+    def scale(self, nodes, factor):
+        cmds.scale(factor, factor, factor, *nodes, relative=True)
+
+    def move(self, node, delta):
+        cmds.move(delta[0], delta[1], delta[2], node, relative=True, worldSpace=True)
+
+    def rename(self, node, new_name):
+        return cmds.rename(node, new_name) or new_name
+
+# In-memory backend for tests and benchmarks: node -> {'translate', 'scale'};
+# each node is a unit cube around its translate, scaled about that point.
+class FakeMutationBackend:
+    def __init__(self, nodes=None):
+        self.nodes = {n: dict(translate=(1.0, 2.0, 3.0), scale=(1.0, 1.0, 1.0)) for n in (nodes or ())}
+        self.calls = []
+        self.chunks = []
+
+    def _node(self, node):
+        if node not in self.nodes:
+            raise RuntimeError(f"No object matches name: {node}")
+        return self.nodes[node]
+
+    def open_chunk(self, name):
+        self.chunks.append(name)
+
+    def close_chunk(self):
+        self.calls.append('closeChunk')
+
+    def world_bounds(self, nodes):
+        self.calls.append('world_bounds')
+        out = []
+        for n in nodes:
+            t, sc = self._node(n)['translate'], self._node(n)['scale']
+            out.append(tuple(t[i] - 0.5 * sc[i] for i in range(3)) + tuple(t[i] + 0.5 * sc[i] for i in range(3)))
+        return out
+
+    def scale_pivots(self, nodes):
+        self.calls.append('scale_pivots')
+        return [self._node(n)['translate'] for n in nodes]
+
+    def scale(self, nodes, factor):
+        self.calls.append('scale')
+        for n in nodes:
+            self._node(n)
+        for n in nodes:
+            self.nodes[n]['scale'] = tuple(v * factor for v in self.nodes[n]['scale'])
+
+    def move(self, node, delta):
+        self.calls.append('move')
+        t = self._node(node)['translate']
+        self.nodes[node]['translate'] = tuple(t[i] + delta[i] for i in range(3))
+
+    def rename(self, node, new_name):
+        self._node(node)
+        self.nodes[new_name] = self.nodes.pop(node)
+        return new_name
+
+def _solve_transforms_np(bounds, pivots, factors, center, ground, heights):
+    b = np.asarray(bounds, dtype=float).reshape(-1, 6)
+    p = np.asarray(pivots, dtype=float).reshape(-1, 3)
+    th = np.asarray(heights, dtype=float)
+    h = b[:, 4] - b[:, 1]
+    fit = (th > 0) & (h > 1e-9)
+    s = np.where(fit, th / np.where(fit, h, 1.0), np.asarray(factors, dtype=float))
+    lo = p + s[:, None] * (b[:, :3] - p)
+    hi = p + s[:, None] * (b[:, 3:] - p)
+    d = np.zeros_like(lo)
+    c = np.asarray(center, dtype=bool)
+    g = np.asarray(ground, dtype=bool)
+    d[c] = -(lo[c] + hi[c]) * 0.5
+    d[g, 1] = -lo[g, 1]
+    return s.tolist(), [tuple(row) for row in d.tolist()]
+
+def _solve_transforms_py(bounds, pivots, factors, center, ground, heights):
+    scales, deltas = [], []
+    for b, p, f, c, g, th in zip(bounds, pivots, factors, center, ground, heights):
+        h = b[4] - b[1]
+        s = th / h if th > 0 and h > 1e-9 else f
+        lo = [p[i] + s * (b[i] - p[i]) for i in range(3)]
+        hi = [p[i] + s * (b[i + 3] - p[i]) for i in range(3)]
+        d = [-(lo[i] + hi[i]) * 0.5 for i in range(3)] if c else [0.0, 0.0, 0.0]
+        if g:
+            d[1] = -lo[1]
+        scales.append(s)
+        deltas.append(tuple(d))
+    return scales, deltas
+
+def solve_transforms(bounds, pivots, factors, center, ground, heights):
+    # Per root: final uniform scale (target height wins over the scale factor) about its
+    # scale pivot, then the world translation that centers the scaled box on the origin
+    # and/or puts its base on the ground plane. Vectorised with NumPy when available.
+    solve = _solve_transforms_np if np is not None else _solve_transforms_py
+    return solve(bounds, pivots, factors, center, ground, heights)
+
+# Collects transform normalisation (center, ground snap, scale, target height) and
+# rename operations and applies them in one undo chunk: one bounding-box and one
+# pivot query for all roots that need them, one relative scale call per distinct
+# factor, one relative move per root, renames last.
+class SceneMutationBatch:
+    def __init__(self, backend=None, chunk_name='assetImportCleanup'):
+        self.backend = backend or MayaMutationBackend()
+        self.chunk_name = chunk_name
+        self._transforms = {}
+        self._renames = []
+
+    def __len__(self):
+        return len(self._transforms) + len(self._renames)
+
+    def _spec(self, node):
+        return self._transforms.setdefault(node, dict(center=False, ground=False, factor=1.0, height=0.0))
+
+    def normalize(self, nodes, center=False, ground=False, factor=1.0, target_height=0.0):
+        for n in nodes:
+            spec = self._spec(n)
+            spec['center'] = spec['center'] or center
+            spec['ground'] = spec['ground'] or ground
+            spec['factor'] *= factor
+            if target_height:
+                spec['height'] = target_height
+
+    def center(self, nodes):
+        self.normalize(nodes, center=True)
+
+    def scale(self, nodes, factor):
+        self.normalize(nodes, factor=factor)
+
+    def rename(self, node, new_name):
+        self._renames.append((node, new_name))
+
+    def _query(self, nodes, errors):
+        be = self.backend
+        try:
+            return dict(zip(nodes, zip(be.world_bounds(nodes), be.scale_pivots(nodes))))
+        except Exception:
+            # Retry one by one to isolate the failing nodes
+            found = {}
+            for node in nodes:
+                try:
+                    found[node] = (be.world_bounds([node])[0], be.scale_pivots([node])[0])
+                except Exception as e:
+                    errors.append(('center', node, e))
+            return found
+
+    def _apply_transforms(self, span, errors):
+        be = self.backend
+        specs = self._transforms
+        need_bounds = [n for n, sp in specs.items() if sp['center'] or sp['ground'] or sp['height'] > 0]
+        with span('bounds') if need_bounds else contextlib.nullcontext():
+            queried = self._query(need_bounds, errors) if need_bounds else {}
+
+        nodes = [n for n in specs if n in queried or n not in need_bounds]
+        no_box = ((0.0,) * 6, (0.0,) * 3)
+        bounds, pivots = zip(*(queried.get(n, no_box) for n in nodes)) if nodes else ((), ())
+        scales, deltas = solve_transforms(
+            bounds, pivots,
+            [specs[n]['factor'] for n in nodes],
+            [specs[n]['center'] for n in nodes],
+            [specs[n]['ground'] for n in nodes],
+            [specs[n]['height'] for n in nodes],
+        )
+
+        by_factor = {}
+        for node, s in zip(nodes, scales):
+            if abs(s - 1.0) > 1e-12:
+                by_factor.setdefault(round(s, 12), []).append(node)
+        if by_factor:
+            with span('scale'):
+                for factor, group in by_factor.items():
+                    try:
+                        be.scale(group, factor)
+                    except Exception:
+                        for node in group:
+                            try:
+                                be.scale([node], factor)
+                            except Exception as e:
+                                errors.append(('scale', node, e))
+
+        moves = [(n, d) for n, d in zip(nodes, deltas) if any(d)]
+        if moves or any(specs[n]['center'] for n in nodes):
+            with span('center'):
+                for node, delta in moves:
+                    try:
+                        be.move(node, delta)
+                    except Exception as e:
+                        errors.append(('center', node, e))
+
+    def apply(self, metrics=None):
+        renamed, errors = {}, []
+        if not len(self):
+            return renamed, errors
+        span = metrics.span if metrics else (lambda name: contextlib.nullcontext())
+
+        be = self.backend
+        be.open_chunk(self.chunk_name)
+        try:
+            if self._transforms:
+                self._apply_transforms(span, errors)
+
+            if self._renames:
+                with span('rename'):
+                    for node, new_name in self._renames:
+                        try:
+                            renamed[node] = be.rename(node, new_name)
+                        except Exception as e:
+                            errors.append(('rename', node, e))
+        finally:
+            be.close_chunk()
+            self._transforms, self._renames = {}, []
+        return renamed, errors
+
+def delete_empty_groups(nodes):
+    # Deletes transforms among `nodes` that end up with no children once their
+    # empty sub-groups are removed. One ls for the hierarchy, one delete call.
+    candidates = set(cmds.ls(nodes, exactType='transform', long=True) or []) if nodes else set()
+    if not candidates:
+        return []
+
+    roots = {'|' + n.split('|')[1] for n in candidates}
+    child_count = {}
+    for path in cmds.ls(sorted(roots), dag=True, long=True) or []:
+        parent = path.rsplit('|', 1)[0]
+        if parent:
+            child_count[parent] = child_count.get(parent, 0) + 1
+
+    # Bottom-up: deepest first, so an emptied child makes its parent empty too
+    empty = set()
+    for node in sorted(candidates, key=lambda n: n.count('|'), reverse=True):
+        if child_count.get(node, 0) == 0:
+            empty.add(node)
+            parent = node.rsplit('|', 1)[0]
+            if parent in child_count:
+                child_count[parent] -= 1
+
+    # Only the topmost empty groups need deleting; their empty children go with them
+    top = sorted(n for n in empty if n.rsplit('|', 1)[0] not in empty)
+    if not top:
+        return []
+    try:
+        cmds.delete(top)
+    except Exception as e:
+        print(f"Failed to delete empty groups: {e}")
+        return []
+    for node in top:
+        print(f"Deleted empty group: {node}")
+    return top
+
+def _node_namespaces(nodes):
+    # Namespaces (and their parents) of the given node names
+    found = set()
+    for name in nodes:
+        leaf = name.split('|')[-1]
+        if ':' in leaf:
+            parts = leaf.rsplit(':', 1)[0].lstrip(':').split(':')
+            for k in range(1, len(parts) + 1):
+                found.add(':'.join(parts[:k]))
+    return sorted(found)
+
+def _free_name(short, taken):
+    # First of short, short_001, short_002, ... missing from every set in `taken`
+    candidate, i = short, 0
+    while any(candidate in names for names in taken):
+        i += 1
+        candidate = f"{short}_{i:03}"
+    return candidate
+
+def flatten_namespaces(skip=('UI', 'shared'), nodes=None):
+    # Merges every (nested) namespace into the root namespace. Reads the namespace
+    # tree and node names once, predicts clashes and pre-renames those nodes so the
+    # result is deterministic, then moves deepest-first. A DAG node only clashes
+    # with root-namespace siblings under the same parent and with DG nodes; a DG
+    # node clashes with any root-namespace name.
+    # With `nodes`, only the namespaces of those nodes are merged, and only their
+    # members and the root nodes sharing their short names are queried instead of
+    # the whole scene.
+    report = dict(moved=[], renamed={}, failed={})
     try:
-        info = cmds.filePathEditor(query=True, listFiles="", withAttribute=True, status=True) or []
-        missing = [info[i] for i in range(2, len(info), 3) if info[i] == 0]
-        if missing:
-            print(f"Found {len(missing)} missing paths, fixing…")
-            cmds.filePathEditor(edit=True, fixMissingPath=True)
-            print("Path repair complete.")
+        if nodes is None:
+            namespaces = cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True) or []
+        else:
+            namespaces = _node_namespaces(nodes)
+        namespaces = [ns.lstrip(':') for ns in namespaces if ns.lstrip(':').split(':')[0] not in skip]
+        if not namespaces:
+            return report
+        cmds.namespace(setNamespace=':')
+    except Exception as e:
+        print(f"Namespace cleanup failed → {e}")
+        report['failed'][':'] = str(e)
+        return report
+
+    nodes_by_ns = {}
+    root_nodes = []
+    if nodes is None:
+        members = cmds.ls(long=True) or []
+    else:
+        members = [m for ns in namespaces
+                   for m in cmds.namespaceInfo(':' + ns, listOnlyDependencyNodes=True, dagPath=True) or []]
+    for name in members:
+        leaf = name.split('|')[-1]
+        if ':' in leaf:
+            ns, short = leaf.rsplit(':', 1)
+            nodes_by_ns.setdefault(ns.lstrip(':'), []).append((name, short))
+        else:
+            root_nodes.append(name)
+    if nodes is not None:
+        shorts = sorted({short for pairs in nodes_by_ns.values() for _, short in pairs})
+        if shorts:
+            root_nodes = [n for n in cmds.ls(shorts, long=True) or [] if ':' not in n.split('|')[-1]]
+
+    # DAG names are tracked per parent path ('' is the world); parents keep their
+    # original path here, since renaming them does not change who their children are
+    dg_names, dag_names, siblings = set(), set(), {}
+    for name in root_nodes:
+        if name.startswith('|'):
+            parent, leaf = name.rsplit('|', 1)
+            siblings.setdefault(parent, set()).add(leaf)
+            dag_names.add(leaf)
         else:
+            dg_names.add(name)
+
+    # Deepest first: 'a:b' is emptied into ':' before 'a'
+    by_depth = {}
+    for ns in namespaces:
+        by_depth.setdefault(ns.count(':'), []).append(ns)
+    levels = [sorted(by_depth[d]) for d in sorted(by_depth, reverse=True)]
+
+    renames = []
+    for level in levels:
+        for ns in level:
+            for name, short in nodes_by_ns.get(ns, []):
+                if name.startswith('|'):
+                    scope = siblings.setdefault(name.rsplit('|', 1)[0], set())
+                    final = _free_name(short, (scope, dg_names))
+                    scope.add(final)
+                    dag_names.add(final)
+                else:
+                    final = _free_name(short, (dg_names, dag_names))
+                    dg_names.add(final)
+                if final != short:
+                    renames.append((name, f"{ns}:{final}"))
+    # Children before parents, so every DAG path is still valid when it is renamed
+    renames.sort(key=lambda r: r[0].count('|'), reverse=True)
+
+    cmds.undoInfo(openChunk=True, chunkName='flattenNamespaces')
+    try:
+        for name, new_name in renames:
+            try:
+                report['renamed'][name] = cmds.rename(name, new_name) or new_name
+            except Exception as e:
+                print(f"Failed to rename {name} before namespace merge → {e}")
+
+        for level in levels:
+            for ns in level:
+                try:
+                    cmds.namespace(moveNamespace=[ns, ':'], force=True)
+                    cmds.namespace(removeNamespace=ns)
+                    report['moved'].append(ns)
+                except Exception as e:
+                    report['failed'][ns] = str(e)
+                    print(f"Namespace cleanup failed for {ns} → {e}")
+    finally:
+        cmds.undoInfo(closeChunk=True)
+
+    print(f"Merged and removed {len(report['moved'])} namespaces "
+          f"({len(report['renamed'])} clashes renamed, {len(report['failed'])} failed)")
+    return report
+
+DEFAULT_MANIFEST_DIR = pipeline_cache.cache_path('manifests')
+
+def default_manifest_path(folder):
+    # Kept in the local cache, keyed by folder, so incremental runs never write into
+    # the asset folder (its mtime drives the scan cache, and it may be read-only)
+    key = os.path.normcase(os.path.abspath(folder))
+    return os.path.join(DEFAULT_MANIFEST_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+# On-disk record of what each asset produced last time:
+# path -> {size, mtime, hash, roots: [root node UUIDs], nodes: [UUIDs of every node it created]}
+# The roots decide whether the asset is still in the scene; all nodes go when it is replaced.
+class ImportManifest:
+    VERSION = 1
+
+    def __init__(self, path, entries=None):
+        self.path = path
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.isfile(path):
+            return cls(path)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable manifest {path}: {e}")
+            return cls(path)
+        if data.get('version') != cls.VERSION:
+            return cls(path)
+        return cls(path, data.get('entries', {}))
+
+    def save(self):
+        pipeline_cache.write_json(self.path, {'version': self.VERSION, 'entries': self.entries}, indent=1)
+
+    def all_nodes(self):
+        return [n for e in self.entries.values() for n in e.get('nodes', [])]
+
+    def plan(self, files, alive_nodes):
+        # Returns (files to import, stale node UUIDs to delete, unchanged count)
+        to_import, stale, unchanged = [], [], 0
+        seen = set()
+        for fp in files:
+            seen.add(fp)
+            entry = self.entries.get(fp)
+            st = os.stat(fp)
+            nodes = entry.get('nodes', []) if entry else []
+            roots = entry.get('roots', nodes) if entry else []
+            if entry and all(n in alive_nodes for n in roots):
+                if entry['size'] == st.st_size and entry['mtime'] == st.st_mtime:
+                    unchanged += 1
+                    continue
+                # Touched but possibly identical: only hash when size/mtime changed
+                if entry['size'] == st.st_size and entry['hash'] == pipeline_cache.file_sha1(fp):
+                    entry['mtime'] = st.st_mtime
+                    unchanged += 1
+                    continue
+            stale.extend(n for n in nodes if n in alive_nodes)
+            self.entries.pop(fp, None)
+            to_import.append(fp)
+
+        for fp in [p for p in self.entries if p not in seen]:
+            stale.extend(n for n in self.entries.pop(fp).get('nodes', []) if n in alive_nodes)
+        return to_import, stale, unchanged
+
+    def record(self, fp, roots, nodes=()):
+        st = os.stat(fp)
+        roots = list(roots)
+        nodes = roots + [n for n in nodes if n not in set(roots)]
+        self.entries[fp] = dict(size=st.st_size, mtime=st.st_mtime, hash=pipeline_cache.file_sha1(fp), roots=roots, nodes=nodes)
+
+def _outermost(paths):
+    # Drops DAG paths whose ancestor is also listed; deleting the ancestor removes them
+    listed = set(paths)
+    return [p for p in paths
+            if not any('|'.join(p.split('|')[:k]) in listed for k in range(2, p.count('|') + 1))]
+
+# Session caches for path repair: resolutions already made (old path -> new path),
+# filename indexes per search-root list, and the registered file-path attributes
+_path_resolutions = {}
+_path_indexes = {}
+_file_path_attrs = None
+
+# UUIDs of the nodes created by the most recent batch import
+last_import_nodes = []
+
+def clear_path_repair_cache():
+    global _file_path_attrs
+    _path_resolutions.clear()
+    _path_indexes.clear()
+    _file_path_attrs = None
+
+def repair_search_roots(folder=None, rules=None):
+    # Import folder first, then the rules' search roots (relative ones taken from the folder)
+    rules = rules or current_rules()
+    roots = [folder] if folder else []
+    roots.extend(os.path.join(folder, r) if folder else r for r in rules.search_roots)
+    return list(dict.fromkeys(os.path.normpath(r) for r in roots))
+
+def _missing_file_paths():
+    # [(node.attribute, path)] for every unresolved file path, one query per directory
+    missing = []
+    for directory in cmds.filePathEditor(query=True, listDirectories="") or []:
+        info = cmds.filePathEditor(query=True, listFiles=directory, withAttribute=True, status=True) or []
+        for i in range(0, len(info) - 2, 3):
+            if info[i + 2] == 0:
+                missing.append((info[i + 1], directory.rstrip('/') + '/' + info[i]))
+    return missing
+
+def _missing_in_scope(nodes):
+    # Same as _missing_file_paths, but only reads the file attributes of `nodes`
+    global _file_path_attrs
+    if _file_path_attrs is None:
+        _file_path_attrs = {}
+        for entry in cmds.filePathEditor(query=True, listRegisteredTypes=True) or []:
+            node_type, _, attr = entry.partition('.')
+            if attr:
+                _file_path_attrs.setdefault(node_type, []).append(attr)
+    if not nodes or not _file_path_attrs:
+        return []
+    typed = cmds.ls(nodes, type=sorted(_file_path_attrs), showType=True) or []
+    missing = []
+    for node, node_type in zip(typed[::2], typed[1::2]):
+        for attr in _file_path_attrs.get(node_type, ()):
+            plug = f"{node}.{attr}"
+            path = cmds.getAttr(plug)
+            if path and not path_repair.path_exists(path):
+                missing.append((plug, path))
+    return missing
+
+def _path_index(roots, max_age, rebuild=False):
+    key = tuple(roots)
+    index = _path_indexes.get(key)
+    if rebuild or index is None or time.time() - index.built >= max_age:
+        index = path_repair.FileIndex.open(roots, max_age=0 if rebuild else max_age)
+        _path_indexes[key] = index
+    return index
+
+def fix_missing_paths(search_roots=None, dry_run=False, index=None, nodes=None, namespace=None):
+    # Missing paths are looked up in a filename index of the search roots (the rules'
+    # pathRepair.searchRoots by default) and fixed with one filePathEditor repath per
+    # target directory (full path replace where only the name's case matched). Without
+    # search roots Maya's own fixMissingPath search is used.
+    # `nodes` or `namespace` limits the repair to the file attributes of those nodes.
+    # Paths resolved earlier in the session are reused without an index lookup.
+    # Returns a path_repair.RepairReport; dry_run only reports.
+    report = path_repair.RepairReport(dry_run)
+    started = time.time()
+    try:
+        if namespace is not None:
+            nodes = list(nodes or []) + (cmds.namespaceInfo(':' + namespace.lstrip(':'), listOnlyDependencyNodes=True,
+                                                            recurse=True) or [])
+        missing = _missing_file_paths() if nodes is None else _missing_in_scope(nodes)
+        if not missing:
             print("No missing paths detected.")
+            return report
+        print(f"Found {len(missing)} missing paths, fixing…")
+        rules = current_rules()
+        roots = list(rules.search_roots if search_roots is None else search_roots)
+        max_age = rules.index_max_age * 3600
+        if index is None and any(old not in _path_resolutions for _, old in missing):
+            if not roots:
+                if not dry_run:
+                    cmds.filePathEditor(edit=True, fixMissingPath=True)
+                print("Path repair complete.")
+                return report
+            index = _path_index(roots, max_age)
+        plan, renames = path_repair.plan_repairs(index, missing, report, memo=_path_resolutions)
+        if report.unresolved and roots and (index is None or index.built < started):
+            # Files may have been added since the index was built: rebuild once
+            retry, report.unresolved = report.unresolved, []
+            index = _path_index(roots, max_age, rebuild=True)
+            more, more_renames = path_repair.plan_repairs(index, retry, report, memo=_path_resolutions)
+            for directory, attrs in more.items():
+                plan.setdefault(directory, []).extend(attrs)
+            renames.extend(more_renames)
+            report.directories = len(plan)
+        if not dry_run:
+            for directory, attrs in sorted(plan.items()):
+                cmds.filePathEditor(*attrs, repath=directory, force=True)
+            # Matched with a different case: the file name changes too
+            for attr, old, new in renames:
+                cmds.filePathEditor(attr, replaceField='fullPath', replaceString=(old, new), force=True)
+        print(report.summary())
     except Exception as e:
         print(f"Path repair failed: {e}")
+    return report
+
+# Records the nodes created while active, as UUIDs in creation order. The callback mode
+# only sees what the import creates, so its cost follows the asset size, not the scene
+# size; it also catches nodes returnNewNodes misses (e.g. USD references).
+class NodeTracker:
+    def __init__(self, mode=None):
+        self.mode = mode or NODE_TRACKING or ('callback' if om is not None else 'none')
+        self.uuids = []
+        self._handles = []
+        self._callback = None
+        self._before = None
+
+    @property
+    def active(self):
+        return self.mode != 'none'
+
+    def _on_added(self, node, client_data):
+        self._handles.append(om.MObjectHandle(node))
+
+    def __enter__(self):
+        self.uuids = []
+        if self.mode == 'callback':
+            self._handles = []
+            self._callback = om.MDGMessage.addNodeAddedCallback(self._on_added, 'dependNode')
+        elif self.mode == 'diff':
+            self._before = set(cmds.ls(uuid=True) or [])
+        return self
+
+    def __exit__(self, *exc):
+        if self.mode == 'callback':
+            om.MMessage.removeCallback(self._callback)
+            self._callback = None
+            seen = set()
+            # UUIDs are read afterwards: imported nodes get theirs once loaded, and
+            # handles of nodes deleted during the import are no longer valid
+            for handle in self._handles:
+                if handle.isValid():
+                    uuid = om.MFnDependencyNode(handle.object()).uuid().asString()
+                    if uuid not in seen:
+                        seen.add(uuid)
+                        self.uuids.append(uuid)
+            self._handles = []
+        elif self.mode == 'diff':
+            self.uuids = [u for u in cmds.ls(uuid=True) or [] if u not in self._before]
+            self._before = None
+        return False
+
+    def transforms(self):
+        # Long names of the tracked transforms
+        return cmds.ls(self.uuids, long=True, type='transform') or [] if self.uuids else []
+
+def _import_asset(fp, base, usd_mode=None):
+    # usd_mode ('reference', 'nodes' or 'skip') overrides the module USD flags for this file
+    ext = os.path.splitext(fp)[1].lower()
+    import_kwargs = dict(ignoreVersion=True, returnNewNodes=True)
 
-def batch_import_and_cleanup(folder_path=None, center_on_import=False, scale_factor=1.0, progress_callback=None):
-    pr = pipeline_rules
-    prefix = pr['naming']['prefix']
-    pat = re.compile(pr['naming']['sanitizePattern'])
-    do_delete = pr['cleanup']['deleteEmptyGroups']
-    do_ns = pr['cleanup']['namespaceCleanup']
-    do_pr = pr['pathRepair']['autoFix']
-    use_naming = bool(prefix)
+    if ext in ('.usd', '.usda'):
+        as_ref = USD_IMPORT_AS_REF if usd_mode is None else usd_mode == 'reference'
+        as_nodes = USD_IMPORT_AS_NODES if usd_mode is None else usd_mode == 'nodes'
+        if as_ref:
+            import_kwargs.update(reference=True)
+            print(f"Referenced USD: {base}")
+        elif as_nodes:
+            import_kwargs.update(type='USD Import', i=True)
+            print(f"Imported USD as nodes: {base}")
+        else:
+            print(f"Skipped USD: {base}")
+            return None
+    elif ext == '.obj':
+        import_kwargs.update(type='OBJ', i=True)
+        print(f"Imported OBJ: {base}")
+    elif ext == '.ma':
+        import_kwargs.update(type='mayaAscii', i=True)
+        print(f"Imported MA: {base}")
+    elif ext == '.mb':
+        import_kwargs.update(type='mayaBinary', i=True)
+        print(f"Imported MB: {base}")
+    else:
+        import_kwargs.update(i=True)
+        print(f"Imported: {base}")
+
+    try:
+        return cmds.file(fp, **import_kwargs) or []
+    except Exception as e:
+        print(f"Failed to import {base}: {e}")
+        return None
+
+def _cache_options(fp, usd_mode=None):
+    # Options that change what the translator produces, or None when the asset is not cached
+    ext = os.path.splitext(fp)[1].lower()
+    if ext not in import_cache.CACHEABLE_EXTS:
+        return None
+    if ext in ('.usd', '.usda'):
+        as_nodes = USD_IMPORT_AS_NODES and not USD_IMPORT_AS_REF if usd_mode is None else usd_mode == 'nodes'
+        if not as_nodes:
+            return None
+    try:
+        maya_version = cmds.about(version=True)
+    except Exception:
+        maya_version = ''
+    return dict(ext=ext, maya=maya_version)
+
+def _import_snapshot(path, base):
+    try:
+        nodes = cmds.file(path, i=True, type='mayaBinary', ignoreVersion=True, returnNewNodes=True) or []
+    except Exception as e:
+        print(f"Failed to import cached snapshot of {base}: {e}")
+        return None
+    print(f"Imported from cache: {base}")
+    return nodes
+
+def _save_snapshot(cache, key, fp, roots):
+    # Export the freshly translated asset (before cleanup) as a .mb snapshot
+    path = cache.snapshot_path(key)
+    selection = cmds.ls(selection=True) or []
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        cmds.select(roots, replace=True)
+        cmds.file(path, exportSelected=True, type='mayaBinary', force=True, preserveReferences=False)
+        cache.add(key, fp)
+    except Exception as e:
+        print(f"Failed to cache {os.path.basename(fp)}: {e}")
+    finally:
+        if selection:
+            cmds.select(selection, replace=True)
+        else:
+            cmds.select(clear=True)
+
+def open_import_cache(rules):
+    if not rules.import_cache:
+        return None
+    return import_cache.ImportCache(rules.cache_dir or None, max_bytes=int(rules.cache_max_mb * pipeline_cache.MB))
+
+def iter_batch_import_and_cleanup(folder_path=None, center_on_import=False, scale_factor=1.0, recursive=False,
+                                  files=None, incremental=False, manifest_path=None, cancel_check=None,
+                                  metrics=None, validate=None, scheduler=None, rules=None, cache=None,
+                                  names=None):
+    # Cooperative version of batch_import_and_cleanup: yields (files_done, total_files)
+    # after every asset so a caller can keep the UI responsive, pause or cancel.
+    # Files are imported in the order planned by `scheduler`, which the caller can
+    # query for cost-weighted progress and ETA.
+    # Cancelling stops further imports; cleanup still runs on what was imported.
+    # Returns the PipelineMetrics for the run (StopIteration.value).
+    # `rules` overrides the module rules for this run only (e.g. UI toggles)
+    # `cache` (an ImportCache) defaults to the one configured in the rules' importCache section
+    # `names` (path -> root name, see plan_asset_names) fixes names assigned by the caller;
+    # they are reserved, and files missing from it are named as usual
+    global last_import_nodes
+    pr = PipelineRules.coerce(rules) if rules is not None else current_rules()
+    prefix = pr.prefix
+    do_delete = pr.delete_empty_groups
+    do_ns = pr.namespace_cleanup
+    do_pr = pr.path_autofix
+    ground_snap = pr.ground_snap
+    target_height = pr.target_height
+    unit_factor = scale_factor * pr.unit_scale
+    do_validate = pr.validate if validate is None else validate
 
     print(f">>> DEBUG USD flags – REF: {USD_IMPORT_AS_REF}, NODES: {USD_IMPORT_AS_NODES}\n")
-    t0 = time.perf_counter()
+    metrics = metrics or PipelineMetrics()
+    metrics.start_profile()
 
     folder = folder_path or os.path.join(os.path.dirname(__file__), '..', 'test_assets')
     folder = os.path.abspath(folder)
     if not os.path.isdir(folder):
         raise FileNotFoundError(f"Import folder not found: {folder}")
 
-    files = _collect_asset_files(folder)
+    if files is None:
+        with metrics.span('collect'):
+            files = collect_and_preload(folder, recursive=recursive, skip_dirs=_excluded_dirs(folder, pr))
+    with metrics.span('plugins'):
+        files = plugins.filter_supported(files)
+
+    # Incremental mode: only (re)import new or changed assets, drop removed ones
+    manifest = None
+    if incremental:
+        with metrics.span('manifest'):
+            manifest = ImportManifest.load(manifest_path or default_manifest_path(folder))
+            known = manifest.all_nodes()
+            alive = set(cmds.ls(known, uuid=True) or []) if known else set()
+            files, stale, unchanged = manifest.plan(files, alive)
+            if stale:
+                try:
+                    cmds.delete(_outermost(cmds.ls(stale, long=True) or []))
+                except Exception as e:
+                    print(f"Failed to delete outdated nodes: {e}")
+        print(f"Incremental import: {len(files)} new/changed, {unchanged} unchanged, {len(stale)} outdated nodes removed\n")
+
+    # Pre-flight: probe headers off the main thread and drop broken files before any import
+    if do_validate and files:
+        with metrics.span('validate'):
+            files, rejected = asset_validation.validate_assets(files, require_geometry=pr.require_geometry)
+            for r in rejected:
+                print(f"Rejected {os.path.basename(r.path)}: {r.reason}")
+            if rejected and pr.quarantine_dir:
+                asset_validation.quarantine(rejected, os.path.join(folder, pr.quarantine_dir), root=folder)
+
+    # Names are allocated in collect order, as the preview shows them, before the
+    # scheduler reorders the files by cost
+    allocator = NameAllocator.from_scene()
+    planned = dict(names or {})
+    for name in planned.values():
+        allocator.reserve(name)
+    planned.update(plan_asset_names([fp for fp in files if fp not in planned], folder, pr, allocator))
+
+    scheduler = scheduler or import_scheduler.ImportScheduler()
+    with metrics.span('schedule'):
+        files = scheduler.plan(files)
+
     total_files = len(files)
     rename_msgs = []
+    mutations = SceneMutationBatch()
+    imported = []
+    created = []
+    cache = cache or open_import_cache(pr)
+    tracker = NodeTracker()
+    tracked = []
 
     for i, fp in enumerate(files):
-        base = os.path.splitext(os.path.basename(fp))[0]
-        safe_base = pat.sub('_', base)
-        ext = os.path.splitext(fp)[1].lower()
-        import_kwargs = dict(ignoreVersion=True, returnNewNodes=True)
-
-        if ext in ('.usd', '.usda'):
-            if USD_IMPORT_AS_REF:
-                import_kwargs.update(reference=True)
-                print(f"Referenced USD: {base}")
-            elif USD_IMPORT_AS_NODES:
-                import_kwargs.update(type='USD Import', i=True)
-                print(f"Imported USD as nodes: {base}")
-            else:
-                print(f"Skipped USD: {base}")
-                continue
-        elif ext == '.obj':
-            import_kwargs.update(type='OBJ', i=True)
-            print(f"Imported OBJ: {base}")
-        elif ext == '.ma':
-            import_kwargs.update(type='mayaAscii', i=True)
-            print(f"Imported MA: {base}")
-        elif ext == '.mb':
-            import_kwargs.update(type='mayaBinary', i=True)
-            print(f"Imported MB: {base}")
-        else:
-            import_kwargs.update(i=True)
-            print(f"Imported: {base}")
+        if cancel_check and cancel_check():
+            print(f"Cancelled after {i} of {total_files} files.")
+            break
 
-        try:
-            new_nodes = cmds.file(fp, **import_kwargs)
+        base = os.path.splitext(os.path.basename(fp))[0]
+        safe_base = pr.sanitize_name(base)
+        # Per-asset overrides from the rules' path selectors (empty for most files)
+        ov = pr.for_asset(os.path.relpath(fp, folder).replace(os.sep, '/'))
+        key = snapshot = None
+        if cache is not None:
+            options = _cache_options(fp, ov.get('usdImport'))
+            if options is not None:
+                with metrics.span('cache_lookup', file=fp):
+                    key = cache.key(fp, options)
+                    snapshot = cache.lookup(key)
+        if snapshot:
+            with metrics.span('import', file=fp, cached=True), tracker:
+                new_nodes = _import_snapshot(snapshot, base)
             if new_nodes is None:
-                new_nodes = []
-        except Exception as e:
-            print(f"Failed to import {base}: {e}")
+                # Unreadable snapshot: drop it and translate the source file instead
+                partial = (cmds.ls(tracker.uuids, long=True) or []) if tracker.uuids else []
+                if partial:
+                    try:
+                        cmds.delete(_outermost(partial))
+                    except Exception as e:
+                        print(f"Failed to delete partial import of {base}: {e}")
+                cache.reject(key)
+                snapshot = None
+        if not snapshot:
+            with metrics.span('import', file=fp), tracker:
+                new_nodes = _import_asset(fp, base, usd_mode=ov.get('usdImport'))
+        if new_nodes is None:
+            metrics.stop_profile()
+            yield i + 1, total_files
+            metrics.start_profile()
             continue
 
-        all_transforms = [n for n in new_nodes if cmds.objectType(n) == "transform"]
-        root_nodes = [n for n in all_transforms if not cmds.listRelatives(n, parent=True)]
+        if tracker.active:
+            # Exact node set of this asset; imports always land under the world
+            asset_uuids = list(tracker.uuids)
+            all_transforms = tracker.transforms()
+            root_nodes = [n for n in all_transforms if n.count('|') == 1]
+        else:
+            asset_uuids = cmds.ls(new_nodes, uuid=True) or [] if new_nodes else []
+            all_transforms = [n for n in new_nodes if cmds.objectType(n) == "transform"]
+            root_nodes = [n for n in all_transforms if not cmds.listRelatives(n, parent=True)]
+        tracked.extend(asset_uuids)
+        for n in all_transforms:
+            allocator.reserve(n.rsplit('|', 1)[-1])
+        if do_delete and all_transforms:
+            # UUIDs survive the renames applied after the loop
+            created.extend(cmds.ls(all_transforms, uuid=True) or [])
+        if key and not snapshot and root_nodes:
+            with metrics.span('cache_store', file=fp):
+                _save_snapshot(cache, key, fp, root_nodes)
 
-        # Center imported root nodes if requested
-        if center_on_import:
-            for root in root_nodes:
-                try:
-                    cmds.xform(root, worldSpace=True, translation=(0, 0, 0))
-                except Exception as e:
-                    print(f"Failed to center {root}: {e}")
+        # Queue transform normalisation and renaming; applied in bulk after the loop
+        if ov:
+            asset_ground = ov.get('groundSnap', ground_snap)
+            asset_height = ov.get('targetHeight', target_height)
+            asset_factor = ov.get('scaleFactor', scale_factor) * ov.get('unitScale', pr.unit_scale)
+            asset_prefix = ov.get('prefix', prefix)
+        else:
+            asset_ground, asset_height, asset_factor, asset_prefix = ground_snap, target_height, unit_factor, prefix
+        if center_on_import or asset_ground or asset_height or asset_factor != 1.0:
+            mutations.normalize(root_nodes, center=center_on_import, ground=asset_ground,
+                                factor=asset_factor, target_height=asset_height)
+        if asset_prefix:
+            # The first root takes the planned name; any further roots are numbered after it
+            for k, node in enumerate(root_nodes):
+                name = planned[fp] if k == 0 else get_unique_asset_name(safe_base, asset_prefix, allocator=allocator)
+                mutations.rename(node, name)
+        if manifest is not None:
+            imported.append((fp, (cmds.ls(root_nodes, uuid=True) or []) if root_nodes else [], asset_uuids))
 
-        # Scale imported root nodes if scale_factor != 1.0
-        if scale_factor != 1.0:
-            for root in root_nodes:
-                try:
-                    sx = cmds.getAttr(f"{root}.scaleX")
-                    sy = cmds.getAttr(f"{root}.scaleY")
-                    sz = cmds.getAttr(f"{root}.scaleZ")
-                    cmds.setAttr(f"{root}.scaleX", sx * scale_factor)
-                    cmds.setAttr(f"{root}.scaleY", sy * scale_factor)
-                    cmds.setAttr(f"{root}.scaleZ", sz * scale_factor)
-                except Exception as e:
-                    print(f"Failed to scale {root}: {e}")
+        metrics.stop_profile()
+        yield i + 1, total_files
+        metrics.start_profile()
 
-        # Rename root nodes if naming enabled
-        if use_naming and root_nodes:
-            for node in root_nodes:
-                new_name = get_unique_asset_name(safe_base, prefix)
-                try:
-                    old = node
-                    cmds.rename(node, new_name)
-                    rename_msgs.append(f"Renamed {old} → {new_name}")
-                except Exception as e:
-                    rename_msgs.append(f"Failed to rename {old} → {e}")
-
-        # Progress callback wrapped in deferred to avoid blocking UI
-        if progress_callback and maya:
-            progress_pct = int((i + 1) / total_files * 100)
-            def update_progress():
-                progress_callback(progress_pct)
-            maya.utils.executeDeferred(update_progress)
-
-    if do_delete:
-        for node in sorted(cmds.ls(type='transform')):
-            children = cmds.listRelatives(node, children=True) or []
-            shapes = cmds.listRelatives(node, shapes=True) or []
-            if not children and not shapes:
-                try:
-                    cmds.delete(node)
-                    print(f"Deleted empty group: {node}")
-                except:
-                    pass
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"Failed to save import cache index: {e}")
+        print(f"Import cache: {cache.hits} hits, {cache.misses} misses\n")
+
+    renamed, errors = mutations.apply(metrics)
+    for op, node, e in errors:
+        if op == 'rename':
+            rename_msgs.append(f"Failed to rename {node} → {e}")
+        else:
+            print(f"Failed to {op} {node}: {e}")
+    for old, new in renamed.items():
+        allocator.reserve(new)
+        rename_msgs.append(f"Renamed {old} → {new}")
+
+    if do_delete and created:
+        with metrics.span('empty_groups'):
+            delete_empty_groups(cmds.ls(created, long=True) or [])
 
     for msg in rename_msgs:
         print(msg)
 
-    if do_pr:
-        fix_missing_paths()
-    else:
-        print("No missing paths detected.")
+    with metrics.span('path_repair'):
+        if do_pr:
+            # Only the file attributes of the imported nodes; the import folder is searched first
+            fix_missing_paths(search_roots=repair_search_roots(folder, pr),
+                              nodes=(cmds.ls(tracked) or []) if tracked else [])
+        else:
+            print("No missing paths detected.")
 
     if do_ns:
-        for ns in cmds.namespaceInfo(listOnlyNamespaces=True) or []:
-            if ns in ('UI', 'shared'):
-                continue
+        with metrics.span('namespaces'):
+            # With tracking, only namespaces holding imported nodes are merged
+            scope = None
+            if tracker.active:
+                scope = (cmds.ls(tracked) or []) if tracked else []
+            flatten_namespaces(nodes=scope)
+    last_import_nodes = tracked
+
+    if manifest is not None:
+        with metrics.span('manifest'):
+            # Recorded after cleanup, so only nodes that survived it are expected next run
+            recorded = [u for _, roots, nodes in imported for u in roots + nodes]
+            alive = set(cmds.ls(recorded, uuid=True) or []) if recorded else set()
+            for fp, roots, nodes in imported:
+                try:
+                    manifest.record(fp, [u for u in roots if u in alive], [u for u in nodes if u in alive])
+                except Exception as e:
+                    print(f"Failed to record {fp} in manifest: {e}")
             try:
-                cmds.namespace(setNamespace=':')
-                cmds.namespace(moveNamespace=[ns, ':'], force=True)
-                cmds.namespace(removeNamespace=ns)
-                print(f"Merged and removed namespace: {ns}")
-            except Exception as e:
-                print(f"Namespace cleanup failed for {ns} → {e}")
+                manifest.save()
+            except OSError as e:
+                print(f"Failed to save import manifest: {e}")
 
-    try:
-        cmds.refresh()
-    except Exception:
-        pass
+    with metrics.span('refresh'):
+        try:
+            cmds.refresh()
+        except Exception:
+            pass
 
-    duration = time.perf_counter() - t0
-    print(f"\n>>> PERFORMANCE SUMMARY\n  Total elapsed time: {duration:.2f}s")
+    scheduler.record(metrics.spans)
+    metrics.stop_profile()
+    print(f"\n>>> PERFORMANCE SUMMARY\n{metrics.summary()}")
     print("Done.")
+    return metrics
+
+def batch_import_and_cleanup(folder_path=None, center_on_import=False, scale_factor=1.0, progress_callback=None,
+                             recursive=False, files=None, incremental=False, manifest_path=None, profile=False,
+                             validate=None, scheduler=None, rules=None, cache=None, names=None):
+    metrics = PipelineMetrics(profile=profile)
+    scheduler = scheduler or import_scheduler.ImportScheduler()
+    steps = iter_batch_import_and_cleanup(
+        folder_path,
+        center_on_import=center_on_import,
+        scale_factor=scale_factor,
+        recursive=recursive,
+        files=files,
+        incremental=incremental,
+        manifest_path=manifest_path,
+        metrics=metrics,
+        validate=validate,
+        scheduler=scheduler,
+        rules=rules,
+        cache=cache,
+        names=names
+    )
+    for done, total in steps:
+        if progress_callback:
+            progress_callback(int(scheduler.fraction(done, total) * 100))
+    return metrics
@@ -0,0 +1,203 @@
+"""Filename index for repairing missing file paths.
+
+Builds a basename -> paths index over a set of search roots (each top-level
+directory is walked on its own worker thread), keeps it as JSON in the local
+cache directory, and resolves missing texture and cache paths with dictionary
+lookups. When several files share a name, the candidate sharing the most
+trailing directory names with the missing path wins. Tiled and sequence names
+(<UDIM>, <UVTILE>, <f>, ####) are matched against the tiles on disk.
+"""
+import os
+import re
+import json
+import time
+import glob
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline_cache import cache_path, write_json
+
+DEFAULT_INDEX_DIR = cache_path('path_index')
+INDEX_VERSION = 1
+
+_SEP = re.compile(r'[\\/]+')
+_TOKENS = re.compile(r'<udim>|<uvtile>|<f>|<u>|<v>|#+', re.I)
+_DIGITS = re.compile(r'\d+')
+
+
+def _split(path):
+    return [p for p in _SEP.split(path) if p]
+
+def _pattern_key(name):
+    # Same key for a tokenised name and every tile/frame on disk: wood.<UDIM>.png ~ wood.1001.png
+    key = _TOKENS.sub(lambda m: 'u0_v0' if m.group(0).lower() == '<uvtile>' else '0', name.lower())
+    return _DIGITS.sub('#', key)
+
+def path_exists(path):
+    # Tiled/sequence paths exist when at least one tile or frame does
+    if not path:
+        return False
+    name = os.path.basename(path)
+    if not _TOKENS.search(name):
+        return os.path.exists(path)
+    pattern = _TOKENS.sub(lambda m: 'u*_v*' if m.group(0).lower() == '<uvtile>' else '*', glob.escape(name))
+    return bool(glob.glob(os.path.join(glob.escape(os.path.dirname(path)), pattern)))
+
+def _walk(top):
+    found = []
+    for dirpath, dirnames, filenames in os.walk(top):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+        found.extend((name, os.path.join(dirpath, name)) for name in filenames)
+    return found
+
+
+class FileIndex:
+    def __init__(self, roots, names=None, built=None):
+        self.roots = [os.path.normpath(os.path.abspath(r)) for r in roots]
+        self.names = names or {}     # lower-case basename -> [paths], in root order
+        self.built = built
+        self.from_cache = False
+        self._patterns = None
+
+    def _add(self, name, path):
+        self.names.setdefault(name.lower(), []).append(path)
+
+    @classmethod
+    def build(cls, roots, max_workers=8):
+        index = cls(roots)
+        tops = []
+        for root in index.roots:
+            try:
+                entries = sorted(os.scandir(root), key=lambda e: e.name)
+            except OSError as e:
+                print(f"Skipping search root {root}: {e}")
+                continue
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    tops.append(entry.path)
+                elif entry.is_file():
+                    index._add(entry.name, entry.path)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for found in pool.map(_walk, tops):
+                for name, path in found:
+                    index._add(name, path)
+        index.built = time.time()
+        return index
+
+    @staticmethod
+    def cache_path(roots, cache_dir=None):
+        key = '\n'.join(os.path.normpath(os.path.abspath(r)) for r in roots)
+        return os.path.join(cache_dir or DEFAULT_INDEX_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    @classmethod
+    def open(cls, roots, cache_dir=None, max_age=86400, max_workers=8):
+        # Cached index for these roots if it is younger than max_age seconds, else a fresh (saved) one
+        path = cls.cache_path(roots, cache_dir)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION and time.time() - data['built'] < max_age:
+                index = cls(data['roots'], data['names'], data['built'])
+                index.from_cache = True
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        index = cls.build(roots, max_workers=max_workers)
+        try:
+            index.save(path)
+        except OSError as e:
+            print(f"Failed to save path index: {e}")
+        return index
+
+    def save(self, path):
+        write_json(path, {'version': INDEX_VERSION, 'roots': self.roots, 'built': self.built, 'names': self.names})
+
+    def __len__(self):
+        return sum(len(paths) for paths in self.names.values())
+
+    def candidates(self, name):
+        if not _TOKENS.search(name):
+            return self.names.get(name.lower(), [])
+        if self._patterns is None:
+            self._patterns = {}
+            for key, paths in self.names.items():
+                if _DIGITS.search(key):
+                    self._patterns.setdefault(_DIGITS.sub('#', key), []).extend(paths)
+        # One candidate per directory holding matching tiles, keeping the tokenised name
+        dirs = dict.fromkeys(os.path.dirname(p) for p in self._patterns.get(_pattern_key(name), []))
+        return [os.path.join(d, name) for d in dirs]
+
+    def resolve(self, missing):
+        # Returns (resolved path or None, whether several candidates scored equally)
+        parts = _split(missing)
+        if not parts:
+            return None, False
+        # Entries of a cached index may have been deleted since it was built
+        tiled = bool(_TOKENS.search(parts[-1]))
+        found = [p for p in self.candidates(parts[-1]) if os.path.exists(os.path.dirname(p) if tiled else p)]
+        if len(found) < 2:
+            return (found[0] if found else None), False
+        wanted = [p.lower() for p in reversed(parts[:-1])]
+        best, best_score, tie = None, -1, False
+        for path in found:
+            score = 0
+            for a, b in zip(wanted, (p.lower() for p in reversed(_split(path)[:-1]))):
+                if a != b:
+                    break
+                score += 1
+            if score > best_score:
+                best, best_score, tie = path, score, False
+            elif score == best_score:
+                tie = True
+        return best, tie
+
+
+class RepairReport:
+    def __init__(self, dry_run=False):
+        self.dry_run = dry_run
+        self.resolved = []      # (attribute, old path, new path)
+        self.unresolved = []    # (attribute, old path)
+        self.ambiguous = []     # attributes whose name matched several equally good files
+        self.directories = 0
+
+    def to_dict(self):
+        return dict(dry_run=self.dry_run, resolved=self.resolved, unresolved=self.unresolved,
+                    ambiguous=self.ambiguous, directories=self.directories)
+
+    def summary(self):
+        verb = "Would repath" if self.dry_run else "Repathed"
+        lines = [f"{verb} {len(self.resolved)} paths into {self.directories} directories, "
+                 f"{len(self.unresolved)} unresolved, {len(self.ambiguous)} ambiguous"]
+        if self.dry_run:
+            lines.extend(f"  {attr}: {old} → {new}" for attr, old, new in self.resolved)
+        lines.extend(f"  unresolved {attr}: {old}" for attr, old in self.unresolved)
+        return '\n'.join(lines)
+
+
+def plan_repairs(index, missing, report=None, memo=None):
+    # missing: [(attribute, path)] -> ({target directory: [attributes]}, [(attribute, old, new)]),
+    # filling in the report. Most fixes are directory repaths; names matched with a different
+    # case go in the second list and need the full path set, since a repath keeps the old name.
+    # `memo` (old path -> new path) is consulted before the index and updated with new resolutions.
+    report = report if report is not None else RepairReport()
+    plan, renames = {}, []
+    for attr, old in missing:
+        new = memo.get(old) if memo is not None else None
+        if new is None or not path_exists(new):
+            new, tie = index.resolve(old) if index is not None else (None, False)
+            if new is None or not path_exists(new):
+                report.unresolved.append((attr, old))
+                continue
+            if tie:
+                report.ambiguous.append(attr)
+            if memo is not None:
+                memo[old] = new
+        report.resolved.append((attr, old, new))
+        if os.path.basename(new) == _split(old)[-1]:
+            plan.setdefault(os.path.dirname(new), []).append(attr)
+        else:
+            renames.append((attr, old, new))
+    report.directories = len(plan)
+    return plan, renames
@@ -0,0 +1,63 @@
+"""Shared helpers for the pipeline's local cache files.
+
+Stores live under $XDG_CACHE_HOME/asset_pipeline (~/.cache by default), are
+written atomically as JSON, and decide freshness from file sizes, mtimes and
+content hashes read through here.
+"""
+import os
+import json
+import hashlib
+
+MB = 1 << 20
+
+CACHE_ROOT = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+    'asset_pipeline'
+)
+
+
+def cache_path(*parts):
+    return os.path.join(CACHE_ROOT, *parts)
+
+def write_json(path, data, indent=None):
+    # Write to a per-process temp file and rename it over the target, so readers and
+    # concurrent batch shards never see a partial file
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = '%s.%d.tmp' % (path, os.getpid())
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(data, f, indent=indent)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+def file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+def file_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except (OSError, TypeError):
+        return None
+
+def file_mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, TypeError):
+        return None
+
+def file_sha1(path, chunk_size=MB):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
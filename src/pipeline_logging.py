@@ -0,0 +1,89 @@
+"""Logging plumbing for the pipeline tool.
+
+The core module reports progress with ``print``; ``StreamToLogger`` turns that
+output into records on the ``asset_pipeline`` logger. ``RingBufferHandler``
+keeps a bounded backlog that a UI can drain on a timer, and
+``add_rotating_file_handler`` optionally mirrors everything to disk.
+"""
+import os
+import logging
+import logging.handlers
+from collections import deque
+
+LOGGER_NAME = 'asset_pipeline'
+LOG_FILE_ENV = 'ASSET_PIPELINE_LOG'
+
+def get_logger():
+    logger = logging.getLogger(LOGGER_NAME)
+    if not getattr(logger, '_pipeline_configured', False):
+        logger.setLevel(logging.INFO)
+        # Keep records out of Maya's root handlers; our handlers decide where they go
+        logger.propagate = False
+        logger._pipeline_configured = True
+        if os.environ.get(LOG_FILE_ENV):
+            add_rotating_file_handler(os.environ[LOG_FILE_ENV], logger=logger)
+    return logger
+
+def add_rotating_file_handler(path, max_bytes=5 * 1024 * 1024, backup_count=3, logger=None):
+    logger = logger or get_logger()
+    for h in logger.handlers:
+        if isinstance(h, logging.handlers.RotatingFileHandler) and h.baseFilename == os.path.abspath(path):
+            return h
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    handler = logging.handlers.RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+    logger.addHandler(handler)
+    return handler
+
+class RingBufferHandler(logging.Handler):
+    def __init__(self, capacity=5000):
+        super(RingBufferHandler, self).__init__()
+        self.setFormatter(logging.Formatter('%(message)s'))
+        self.history = deque(maxlen=capacity)
+        self._pending = deque(maxlen=capacity)
+        self.dropped = 0
+
+    def emit(self, record):
+        try:
+            line = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        # Called with the handler lock held
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped += 1
+        self._pending.append(line)
+        self.history.append(line)
+
+    def drain(self):
+        self.acquire()
+        try:
+            lines = list(self._pending)
+            self._pending.clear()
+            dropped, self.dropped = self.dropped, 0
+        finally:
+            self.release()
+        if dropped:
+            lines.insert(0, f"… {dropped} log lines skipped …")
+        return lines
+
+class StreamToLogger:
+    # File-like object for contextlib.redirect_stdout: one record per printed line
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or get_logger()
+        self.level = level
+        self._partial = ''
+
+    def write(self, msg):
+        data = self._partial + msg
+        lines = data.split('\n')
+        self._partial = lines.pop()
+        for line in lines:
+            if line.strip():
+                self.logger.log(self.level, line)
+        return len(msg)
+
+    def flush(self):
+        if self._partial.strip():
+            self.logger.log(self.level, self._partial)
+        self._partial = ''
@@ -0,0 +1,338 @@
+"""Validated, immutable pipeline rules.
+
+A PipelineRules object is built once from the JSON rules file: the schema is
+checked, missing optional sections get their defaults, regexes are compiled
+and the settings the pipeline reads on every run are exposed as attributes.
+Per-asset overrides (glob or regex selectors on the path relative to the
+import folder) are compiled into an OverrideIndex at the same time.
+Instances are read-only (nested sections are exposed as read-only mappings),
+picklable, and cheap to share with worker processes. Changes are made with
+replace(), which returns a new object.
+"""
+import os
+import re
+import copy
+import json
+from types import MappingProxyType
+from collections.abc import Mapping
+
+from pipeline_cache import file_mtime_ns
+
+
+class RulesError(ValueError):
+    pass
+
+
+# section -> key -> (accepted types, default or REQUIRED)
+REQUIRED = object()
+_NUMBER = (int, float)
+SCHEMA = {
+    'naming': {
+        'prefix': (str, REQUIRED),
+        'sanitizePattern': (str, REQUIRED),
+    },
+    'cleanup': {
+        'deleteEmptyGroups': (bool, REQUIRED),
+        'namespaceCleanup': (bool, REQUIRED),
+    },
+    'pathRepair': {
+        'autoFix': (bool, REQUIRED),
+        'searchRoots': (list, []),
+        'indexMaxAgeHours': (_NUMBER, 24),
+    },
+    'transform': {
+        'groundSnap': (bool, False),
+        'targetHeight': (_NUMBER, 0.0),
+        'unitScale': (_NUMBER, 1.0),
+    },
+    'validation': {
+        'enabled': (bool, False),
+        'quarantineDir': (str, ''),
+        'requireGeometry': (bool, False),
+    },
+    'importCache': {
+        'enabled': (bool, False),
+        'dir': (str, ''),
+        'maxSizeMB': (_NUMBER, 5120),
+    },
+}
+
+# replace() keyword -> (section, key)
+SETTINGS = {
+    'prefix': ('naming', 'prefix'),
+    'sanitize_pattern': ('naming', 'sanitizePattern'),
+    'delete_empty_groups': ('cleanup', 'deleteEmptyGroups'),
+    'namespace_cleanup': ('cleanup', 'namespaceCleanup'),
+    'path_autofix': ('pathRepair', 'autoFix'),
+    'search_roots': ('pathRepair', 'searchRoots'),
+    'index_max_age': ('pathRepair', 'indexMaxAgeHours'),
+    'ground_snap': ('transform', 'groundSnap'),
+    'target_height': ('transform', 'targetHeight'),
+    'unit_scale': ('transform', 'unitScale'),
+    'validate': ('validation', 'enabled'),
+    'quarantine_dir': ('validation', 'quarantineDir'),
+    'require_geometry': ('validation', 'requireGeometry'),
+    'import_cache': ('importCache', 'enabled'),
+    'cache_dir': ('importCache', 'dir'),
+    'cache_max_mb': ('importCache', 'maxSizeMB'),
+}
+
+
+# Per-asset override keys -> (accepted types, check)
+OVERRIDE_KEYS = {
+    'prefix': (str, None),
+    'scaleFactor': (_NUMBER, lambda v: v > 0),
+    'unitScale': (_NUMBER, lambda v: v > 0),
+    'targetHeight': (_NUMBER, lambda v: v >= 0),
+    'groundSnap': (bool, None),
+    'usdImport': (str, lambda v: v in ('reference', 'nodes', 'skip')),
+}
+_WILDCARDS = re.compile(r'[*?\[]')
+
+
+def glob_to_regex(pattern):
+    # '**' spans directories, '*' and '?' stay within one path segment
+    out, i = [], 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+            continue
+        if pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+            continue
+        if c == '*':
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end < 0:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                out.append('[' + ('^' + body[1:] if body.startswith('!') else body) + ']')
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return '(?:' + ''.join(out) + r')\Z'
+
+
+# Selectors are bucketed in a trie of literal leading directories (globs only; regex
+# selectors sit at the root), so a file is only tested against selectors whose fixed
+# prefix matches its folder. Candidate lists are cached per directory.
+class OverrideIndex:
+    def __init__(self, overrides=()):
+        self._root = ({}, [])
+        self._dir_cache = {}
+        self.size = 0
+        for order, entry in enumerate(overrides):
+            settings = {k: v for k, v in entry.items() if k in OVERRIDE_KEYS}
+            if 'match' in entry:
+                pattern = entry['match'].replace('\\', '/')
+                segments = pattern.split('/')[:-1]
+                prefix = []
+                for seg in segments:
+                    if _WILDCARDS.search(seg):
+                        break
+                    prefix.append(seg)
+                regex = re.compile(glob_to_regex(pattern))
+            else:
+                prefix = []
+                regex = re.compile(entry['regex'])
+            node = self._root
+            for seg in prefix:
+                node = node[0].setdefault(seg, ({}, []))
+            node[1].append((order, regex, settings))
+            self.size += 1
+
+    def _candidates(self, directory):
+        cached = self._dir_cache.get(directory)
+        if cached is not None:
+            return cached
+        node = self._root
+        found = list(node[1])
+        for seg in directory.split('/') if directory else ():
+            node = node[0].get(seg)
+            if node is None:
+                break
+            found.extend(node[1])
+        found.sort(key=lambda c: c[0])
+        self._dir_cache[directory] = found
+        return found
+
+    def resolve(self, relpath):
+        # Settings of every matching selector, later entries winning per key
+        if not self.size:
+            return {}
+        relpath = relpath.replace('\\', '/')
+        merged = {}
+        for _, regex, settings in self._candidates(relpath.rpartition('/')[0]):
+            if regex.match(relpath):
+                merged.update(settings)
+        return merged
+
+
+def _validate_overrides(overrides, problems):
+    if not isinstance(overrides, list):
+        problems.append("overrides: expected a list")
+        return
+    for i, entry in enumerate(overrides):
+        where = f"overrides[{i}]"
+        if not isinstance(entry, dict):
+            problems.append(f"{where}: expected an object")
+            continue
+        selectors = [k for k in ('match', 'regex') if k in entry]
+        if len(selectors) != 1 or not isinstance(entry[selectors[0]], str):
+            problems.append(f"{where}: needs exactly one string 'match' (glob) or 'regex' selector")
+        elif selectors[0] == 'regex':
+            try:
+                re.compile(entry['regex'])
+            except re.error as e:
+                problems.append(f"{where}.regex: {e}")
+        for key, value in entry.items():
+            if key in ('match', 'regex'):
+                continue
+            if key not in OVERRIDE_KEYS:
+                problems.append(f"{where}.{key}: unknown setting")
+                continue
+            types, check = OVERRIDE_KEYS[key]
+            if not isinstance(value, types) or (types is _NUMBER and isinstance(value, bool)) \
+                    or (check and not check(value)):
+                problems.append(f"{where}.{key}: invalid value {value!r}")
+
+def _readonly(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _readonly(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_readonly(v) for v in value)
+    return value
+
+def validate_rules(data):
+    # Returns a normalised deep copy with defaults filled in, or raises RulesError
+    if not isinstance(data, Mapping):
+        raise RulesError("Rules must be a JSON object")
+    data = copy.deepcopy(dict(data))
+    problems = []
+    for section, keys in SCHEMA.items():
+        values = data.setdefault(section, {})
+        if not isinstance(values, dict):
+            problems.append(f"{section}: expected an object")
+            continue
+        for key, (types, default) in keys.items():
+            if key not in values:
+                if default is REQUIRED:
+                    problems.append(f"{section}.{key}: missing")
+                else:
+                    values[key] = copy.copy(default)
+            elif not isinstance(values[key], types) or (types is _NUMBER and isinstance(values[key], bool)):
+                problems.append(f"{section}.{key}: expected {getattr(types, '__name__', 'number')}")
+    _validate_overrides(data.setdefault('overrides', []), problems)
+    if not problems:
+        try:
+            re.compile(data['naming']['sanitizePattern'])
+        except re.error as e:
+            problems.append(f"naming.sanitizePattern: {e}")
+        if data['transform']['targetHeight'] < 0:
+            problems.append("transform.targetHeight: must be >= 0")
+        if data['transform']['unitScale'] <= 0:
+            problems.append("transform.unitScale: must be > 0")
+        if not all(isinstance(r, str) for r in data['pathRepair']['searchRoots']):
+            problems.append("pathRepair.searchRoots: expected a list of strings")
+        if data['importCache']['maxSizeMB'] < 0:
+            problems.append("importCache.maxSizeMB: must be >= 0")
+    if problems:
+        raise RulesError("Invalid pipeline rules: " + "; ".join(problems))
+    return data
+
+
+class PipelineRules(Mapping):
+    __slots__ = ('_data', '_view', 'source', 'mtime', 'prefix', 'sanitize', 'delete_empty_groups',
+                 'namespace_cleanup', 'path_autofix', 'search_roots', 'index_max_age', 'ground_snap',
+                 'target_height', 'unit_scale', 'validate', 'quarantine_dir', 'require_geometry', 'import_cache', 'cache_dir',
+                 'cache_max_mb', 'override_index')
+
+    def __init__(self, data, source=None, mtime=None):
+        data = validate_rules(data)
+        set_ = object.__setattr__
+        set_(self, '_data', data)
+        set_(self, '_view', _readonly(data))
+        set_(self, 'source', source)
+        set_(self, 'mtime', mtime)
+        set_(self, 'sanitize', re.compile(data['naming']['sanitizePattern']))
+        for name, (section, key) in SETTINGS.items():
+            if name != 'sanitize_pattern':
+                set_(self, name, _readonly(data[section][key]))
+        set_(self, 'override_index', OverrideIndex(data['overrides']))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PipelineRules is immutable; use replace()")
+
+    def __reduce__(self):
+        return (PipelineRules, (self._data, self.source, self.mtime))
+
+    @classmethod
+    def load(cls, path):
+        mtime = file_mtime_ns(path)
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return cls(data, source=os.path.abspath(path), mtime=mtime)
+
+    @classmethod
+    def coerce(cls, rules):
+        return rules if isinstance(rules, cls) else cls(rules)
+
+    def reloaded(self):
+        # Hot reload: re-read the source file only when its mtime changed
+        if self.source is None:
+            return self
+        mtime = file_mtime_ns(self.source)
+        if mtime is None or mtime == self.mtime:
+            return self
+        return PipelineRules.load(self.source)
+
+    def snapshot(self):
+        # Detached copy that never hot-reloads, e.g. for worker processes
+        return PipelineRules(self._data)
+
+    def replace(self, **settings):
+        data = copy.deepcopy(self._data)
+        for name, value in settings.items():
+            if name not in SETTINGS:
+                raise TypeError(f"Unknown rules setting: {name}")
+            section, key = SETTINGS[name]
+            data[section][key] = value
+        return PipelineRules(data)
+
+    def for_asset(self, relpath):
+        # Override settings for one asset path (relative to the import folder, '/' separated)
+        return self.override_index.resolve(relpath)
+
+    def sanitize_name(self, name):
+        return self.sanitize.sub('_', name)
+
+    def to_dict(self):
+        return copy.deepcopy(self._data)
+
+    # Read-only mapping access to the raw (validated) sections
+    def __getitem__(self, key):
+        return self._view[key]
+
+    def __iter__(self):
+        return iter(self._view)
+
+    def __len__(self):
+        return len(self._view)
+
+    def __eq__(self, other):
+        if isinstance(other, PipelineRules):
+            return self._data == other._data
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"PipelineRules(source={self.source!r}, prefix={self.prefix!r})"
@@ -0,0 +1,130 @@
+"""Persistent metadata index for USD files used by the variant browser.
+
+Stores the layer stack and variant sets of each USD file in its own JSON
+file, keyed by path and checked against the mtimes of its layers, so browsing
+a stage again does not reopen and traverse it. Stages are opened with
+payloads unloaded.
+"""
+import os
+import json
+import glob
+import hashlib
+
+from pipeline_cache import cache_path, file_mtime, write_json
+
+try:
+    from pxr import Usd
+except ImportError:
+    Usd = None
+
+DEFAULT_CACHE_DIR = cache_path('usd_metadata_index')
+
+def open_stage_unloaded(path, usd=None):
+    usd = usd or Usd
+    return usd.Stage.Open(path, load=usd.Stage.LoadNone)
+
+def variant_record(prim):
+    vs = prim.GetVariantSets()
+    names = vs.GetNames()
+    if not names:
+        return None
+    sets = []
+    for sn in names:
+        vset = vs.GetVariantSet(sn)
+        sets.append(dict(name=sn, selection=vset.GetVariantSelection(), variants=list(vset.GetVariantNames())))
+    return dict(path=prim.GetPath().pathString, sets=sets)
+
+def iter_variant_prims(stage):
+    # Lazy traversal for callers that only need the first few records
+    for prim in stage.Traverse():
+        record = variant_record(prim)
+        if record:
+            yield record
+
+def describe_layers(stage):
+    layers = []
+    for lyr in stage.GetLayerStack():
+        real = getattr(lyr, 'realPath', None) or None
+        layers.append(dict(identifier=lyr.identifier, path=real, mtime=file_mtime(real)))
+    return layers
+
+def describe_stage(stage):
+    return dict(layers=describe_layers(stage), variant_prims=list(iter_variant_prims(stage)))
+
+class UsdMetadataIndex:
+    VERSION = 2
+
+    def __init__(self, cache_dir=None, opener=None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.opener = opener or open_stage_unloaded
+        self._entries = {}  # key -> entry read or built this session
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.json')
+
+    def _read(self, key):
+        # Only the one stage's file is parsed
+        try:
+            with open(self._entry_path(key), 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version') != self.VERSION or data.get('path') != key:
+            return None
+        return data.get('entry')
+
+    def _write(self, key, entry):
+        try:
+            write_json(self._entry_path(key), {'version': self.VERSION, 'path': key, 'entry': entry})
+        except OSError as e:
+            print(f"Failed to save USD metadata index: {e}")
+
+    def _is_fresh(self, key, entry):
+        if entry.get('mtime') != file_mtime(key):
+            return False
+        return all(lyr['mtime'] == file_mtime(lyr['path']) for lyr in entry['layers'] if lyr['path'])
+
+    def peek(self, usd_path):
+        # Cached entry if still fresh, without opening the stage
+        key = os.path.abspath(usd_path)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._read(key)
+            if entry is not None:
+                self._entries[key] = entry
+        return entry if entry and self._is_fresh(key, entry) else None
+
+    def get(self, usd_path):
+        entry = self.peek(usd_path)
+        if entry:
+            return entry
+        key = os.path.abspath(usd_path)
+
+        stage = self.opener(usd_path)
+        if not stage:
+            return None
+        entry = describe_stage(stage)
+        entry['mtime'] = file_mtime(key)
+        # Files that cannot be stat'ed (e.g. anonymous layers) are never cached
+        if entry['mtime'] is not None:
+            self._entries[key] = entry
+            self._write(key, entry)
+        return entry
+
+    def has_variants(self, usd_path):
+        entry = self.get(usd_path)
+        return bool(entry and entry['variant_prims'])
+
+    def invalidate(self, usd_path=None):
+        if usd_path is None:
+            self._entries.clear()
+            paths = glob.glob(os.path.join(self.cache_dir, '*.json'))
+        else:
+            key = os.path.abspath(usd_path)
+            self._entries.pop(key, None)
+            paths = [self._entry_path(key)]
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
@@ -6,12 +6,13 @@ if root not in sys.path:
     sys.path.insert(0, root)
 
 import import_cleanup_prototype 
+from rules_engine import PipelineRules
 
 import pytest
 
 @pytest.fixture(autouse=True)
 def patch_pipeline_rules():
-    import_cleanup_prototype.pipeline_rules = {
+    import_cleanup_prototype.pipeline_rules = PipelineRules({
         "naming": {
             "prefix": "ASSET_",
             "sanitizePattern": "[^a-zA-Z0-9_]"
@@ -23,4 +24,23 @@ def patch_pipeline_rules():
             "deleteEmptyGroups": True,
             "namespaceCleanup": True
         }
-    }
+    })
+
+@pytest.fixture(autouse=True)
+def isolate_import_stats(tmp_path, monkeypatch):
+    # Keep scheduler history out of the user's cache directory
+    import import_scheduler
+    monkeypatch.setattr(import_scheduler, "DEFAULT_STATS_PATH", str(tmp_path / "import_stats.json"))
+
+@pytest.fixture(autouse=True)
+def isolate_local_caches(tmp_path, monkeypatch):
+    # Import snapshots, path indexes, USD metadata and manifests go to the test's temp dir
+    import import_cache
+    import path_repair
+    import usd_metadata_index
+    monkeypatch.setattr(import_cache, "DEFAULT_CACHE_DIR", str(tmp_path / "import_cache"))
+    monkeypatch.setattr(path_repair, "DEFAULT_INDEX_DIR", str(tmp_path / "path_index"))
+    monkeypatch.setattr(usd_metadata_index, "DEFAULT_CACHE_DIR", str(tmp_path / "usd_metadata_index"))
+    monkeypatch.setattr(import_cleanup_prototype, "DEFAULT_MANIFEST_DIR", str(tmp_path / "manifests"))
+    monkeypatch.setattr(import_cleanup_prototype, "last_import_nodes", [])
+    import_cleanup_prototype.clear_path_repair_cache()
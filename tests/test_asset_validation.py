@@ -0,0 +1,63 @@
+import os
+import struct
+import import_cleanup_prototype as icp
+import asset_validation as av
+
+ASSETS = os.path.join(os.path.dirname(__file__), '..', 'test_assets')
+
+def test_probe_shipped_assets():
+    # Test every shipped asset passes; the geometry-less FBX only fails when geometry is required
+    names = [n for n in sorted(os.listdir(ASSETS)) if n.lower().endswith(icp.ASSET_EXTS)]
+    paths = [os.path.join(ASSETS, n) for n in names]
+    valid, rejected = av.validate_assets(paths)
+    assert rejected == [] and len(valid) == len(names)
+    valid, rejected = av.validate_assets(paths, require_geometry=True)
+    assert [os.path.basename(r.path) for r in rejected] == ["test_empty.fbx"]
+    assert rejected[0].reason == "no geometry in Objects"
+    assert len(valid) == len(names) - 1
+
+def test_probe_rejects_broken_headers(tmp_path):
+    (tmp_path / "empty.ma").write_text("")
+    (tmp_path / "renamed.ma").write_text("not a maya scene at all")
+    (tmp_path / "cut.mb").write_bytes(b"FOR4" + struct.pack(">I", 5000) + b"Maya" + b"\0" * 64)
+    (tmp_path / "open.abc").write_bytes(b"Ogawa\x00" + b"\0" * 32)
+    (tmp_path / "crate.usd").write_bytes(b"PXR-USDC" + b"\0" * 8 + struct.pack("<Q", 10 ** 9))
+    (tmp_path / "text.obj").write_text("# only a comment\n" * 4)
+    reasons = {os.path.basename(r.path): r.reason for r in av.validate_assets(sorted(map(str, tmp_path.iterdir())))[1]}
+    assert reasons["empty.ma"].startswith("empty")
+    assert reasons["renamed.ma"] == "missing //Maya ASCII header"
+    assert reasons["cut.mb"].startswith("truncated")
+    assert reasons["open.abc"] == "archive was not closed by its writer"
+    assert reasons["crate.usd"] == "truncated or corrupt crate header"
+    assert reasons["text.obj"] == "no geometry statements"
+
+def test_batch_import_skips_and_quarantines_invalid(monkeypatch, tmp_path):
+    (tmp_path / "good.ma").write_text("//Maya ASCII 2023 scene\n")
+    (tmp_path / "bad.ma").write_text("")
+    icp.pipeline_rules = icp.pipeline_rules.replace(validate=True, quarantine_dir="_quarantine")
+    imported = []
+    monkeypatch.setattr(icp.cmds, "file", lambda fp, **k: imported.append(os.path.basename(fp)) or [])
+    metrics = icp.batch_import_and_cleanup(str(tmp_path))
+    assert imported == ["good.ma"]
+    assert "validate" in metrics.totals()
+    assert (tmp_path / "_quarantine" / "bad.ma").exists()
+    assert not (tmp_path / "bad.ma").exists()
+
+def test_quarantine_keeps_same_named_files(tmp_path):
+    for sub in ("a", "b"):
+        (tmp_path / sub).mkdir()
+        (tmp_path / sub / "model.fbx").write_text("")
+    q = tmp_path / "_quarantine"
+    rejected = [av.ProbeResult(str(tmp_path / sub / "model.fbx"), False, "fbx", "empty") for sub in ("a", "b")]
+    moved = av.quarantine(rejected, str(q), root=str(tmp_path))
+    assert moved == [str(q / "a" / "model.fbx"), str(q / "b" / "model.fbx")]
+    (tmp_path / "a" / "model.fbx").write_text("")
+    moved = av.quarantine([av.ProbeResult(str(tmp_path / "a" / "model.fbx"), False, "fbx", "empty")], str(q), root=str(tmp_path))
+    assert moved == [str(q / "a" / "model_001.fbx")]
+
+def test_recursive_scan_skips_quarantine(tmp_path):
+    (tmp_path / "good.ma").write_text("//Maya ASCII 2023 scene\n")
+    (tmp_path / "_quarantine").mkdir()
+    (tmp_path / "_quarantine" / "bad.ma").write_text("")
+    files = icp._collect_asset_files(str(tmp_path), recursive=True, skip_dirs=[str(tmp_path / "_quarantine")])
+    assert [os.path.basename(f) for f in files] == ["good.ma"]
@@ -0,0 +1,65 @@
+import os
+import batch_runner
+
+def test_shard_files_round_robin():
+    files = [f"f{i}.ma" for i in range(7)]
+    shards = batch_runner.shard_files(files, 3)
+    assert shards == [["f0.ma", "f3.ma", "f6.ma"], ["f1.ma", "f4.ma"], ["f2.ma", "f5.ma"]]
+
+def test_shard_files_never_empty():
+    # More shards than files should not create empty shards
+    assert batch_runner.shard_files(["a.ma", "b.ma"], 8) == [["a.ma"], ["b.ma"]]
+
+def test_run_shard_reports_errors(monkeypatch, tmp_path):
+    # Test a failing worker returns an error record instead of raising
+    def fail():
+        raise RuntimeError("no maya")
+    monkeypatch.setattr(batch_runner, "_init_maya", fail)
+    res = batch_runner.run_shard(0, ["a.ma"], str(tmp_path), str(tmp_path))
+    assert res["scene"] is None
+    assert "no maya" in res["error"]
+
+def test_run_batch_empty_folder(tmp_path):
+    assert batch_runner.run_batch(str(tmp_path), str(tmp_path / "out")) == []
+
+def test_shard_files_balances_by_cost(tmp_path):
+    import import_scheduler
+    (tmp_path / "big.mb").write_bytes(b"\0" * (6 << 20))
+    for i in range(6):
+        (tmp_path / f"s{i}.mb").write_bytes(b"\0" * (1 << 20))
+    files = sorted(str(p) for p in tmp_path.iterdir())
+    shards = batch_runner.shard_files(files, 2, scheduler=import_scheduler.ImportScheduler())
+    assert [os.path.basename(f) for f in shards[0]] == ["big.mb"]
+    assert len(shards[1]) == 6
+
+def test_run_batch_assigns_names_across_shards(monkeypatch, tmp_path):
+    # Test duplicate base names in different shards get the names a single run would give
+    from concurrent.futures import Future
+    for rel in ("a/chair.ma", "b/chair.ma", "b/table.ma"):
+        (tmp_path / rel).parent.mkdir(exist_ok=True)
+        (tmp_path / rel).write_text("")
+    received = []
+
+    def fake_run_shard(i, files, folder, output_dir, rules, center, scale, names):
+        received.append(names)
+        return dict(shard=i, scene=None, files=len(files), elapsed=0.0, error=None)
+
+    class InlinePool:
+        def __init__(self, *a, **k): pass
+        def __enter__(self): return self
+        def __exit__(self, *exc): return False
+        def submit(self, fn, *args):
+            fut = Future()
+            fut.set_result(fn(*args))
+            return fut
+
+    monkeypatch.setattr(batch_runner, "run_shard", fake_run_shard)
+    monkeypatch.setattr(batch_runner, "ProcessPoolExecutor", InlinePool)
+    batch_runner.run_batch(str(tmp_path), str(tmp_path / "out"), workers=2, recursive=True,
+                           merge="none", validate=False)
+    assert len(received) == 2 and received[0] == received[1]
+    assert {os.path.relpath(p, str(tmp_path)): n for p, n in received[0].items()} == {
+        os.path.join("a", "chair.ma"): "ASSET_chair",
+        os.path.join("b", "chair.ma"): "ASSET_chair_001",
+        os.path.join("b", "table.ma"): "ASSET_table",
+    }
@@ -0,0 +1,29 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+import bench_pipeline
+from fake_maya import SceneSimulator
+
+def test_simulator_import_and_hierarchy():
+    sim = SceneSimulator(nested_groups=2, namespace_every=1)
+    nodes = sim.file("/x/crate.ma", i=True, returnNewNodes=True)
+    assert nodes[0] == "ns1:crate_grp0"
+    assert sim.listRelatives(nodes[1], parent=True) == ["ns1:crate_grp0"]
+    assert sim.ls(["ns1:crate_geo"], long=True) == ["|ns1:crate_grp0|ns1:crate_grp1|ns1:crate_geo"]
+    assert sim.namespaceInfo(listOnlyNamespaces=True) == ["ns1"]
+    assert sim.objExists("ns1:crate_geo") and sim.calls["objExists"] == 1
+
+def test_bench_size_smoke(tmp_path):
+    results = bench_pipeline.bench_size(10, str(tmp_path))
+    for name in ("collect_cold", "collect_warm", "unique_name_probe", "unique_name_allocator",
+                 "preview_renaming", "batch_import"):
+        assert results[name] >= 0
+    assert results["batch_import_calls"]["file"] == 10
+
+def test_compare_flags_regressions():
+    prev = {"results": {"1000": {"batch_import": 1.0, "collect_cold": 0.001}}}
+    cur = {"results": {"1000": {"batch_import": 2.0, "collect_cold": 0.003}}}
+    assert bench_pipeline.compare(cur, prev, 0.25) == [("1000", "batch_import", 1.0, 2.0)]
+    assert bench_pipeline.compare(cur, None, 0.25) == []
@@ -0,0 +1,98 @@
+import os
+import import_cleanup_prototype as icp
+import import_cache as ic
+
+def _put(cache, src, options, size):
+    key = cache.key(str(src), options)
+    path = cache.snapshot_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'\0' * size)
+    cache.add(key, str(src))
+    return key
+
+def test_key_tracks_content_and_options(tmp_path):
+    src = tmp_path / "a.obj"
+    src.write_text("v 0 0 0\n")
+    cache = ic.ImportCache(str(tmp_path / "cache"))
+    k1 = cache.key(str(src), {'ext': '.obj'})
+    assert cache.key(str(src), {'ext': '.obj'}) == k1
+    assert cache.key(str(src), {'ext': '.obj', 'maya': '2025'}) != k1
+    src.write_text("v 1 1 1\nv 2 2 2\n")
+    assert cache.key(str(src), {'ext': '.obj'}) != k1
+
+def test_lru_eviction_and_prune(tmp_path):
+    srcs = []
+    for n in "abc":
+        (tmp_path / f"{n}.obj").write_text(f"v {n}\n")
+        srcs.append(tmp_path / f"{n}.obj")
+    cache = ic.ImportCache(str(tmp_path / "cache"), max_bytes=250)
+    ka = _put(cache, srcs[0], {}, 100)
+    kb = _put(cache, srcs[1], {}, 100)
+    cache.entries[ka]['last_used'] -= 10
+    cache.entries[kb]['last_used'] -= 20
+    assert cache.lookup(ka)
+    kc = _put(cache, srcs[2], {}, 100)
+    # b was least recently used
+    assert set(cache.entries) == {ka, kc}
+    assert not os.path.exists(cache.snapshot_path(kb))
+    cache.save()
+
+    orphan = tmp_path / "cache" / "zz" / "orphan.mb"
+    orphan.parent.mkdir()
+    orphan.write_bytes(b'\0' * 10)
+    srcs[0].unlink()
+    removed, freed = ic.ImportCache(str(tmp_path / "cache")).prune()
+    assert (removed, freed) == (2, 110)
+    assert list(ic.ImportCache(str(tmp_path / "cache")).entries) == [kc]
+
+def test_batch_import_reuses_snapshot(monkeypatch, tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "chair.obj").write_text("v 0 0 0\n")
+    icp.pipeline_rules = icp.pipeline_rules.replace(import_cache=True, cache_dir=str(tmp_path / "cache"))
+    calls = []
+
+    def fake_file(fp, **k):
+        calls.append((os.path.basename(fp), k.get('type'), bool(k.get('exportSelected'))))
+        if k.get('exportSelected'):
+            open(fp, 'wb').write(b'snapshot')
+            return fp
+        return ['chair']
+
+    monkeypatch.setattr(icp.cmds, "file", fake_file)
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda *a, **k: [])
+    icp.batch_import_and_cleanup(str(tmp_path / "assets"))
+    assert calls[0] == ("chair.obj", "OBJ", False)
+    assert calls[1][1:] == ("mayaBinary", True)
+
+    calls.clear()
+    metrics = icp.batch_import_and_cleanup(str(tmp_path / "assets"))
+    assert calls == [(calls[0][0], "mayaBinary", False)]
+    assert calls[0][0].endswith(".mb")
+    assert [sp.get('cached') for sp in metrics.spans if sp['name'] == 'import'] == [True]
+
+def test_failed_snapshot_is_evicted_and_source_imported(monkeypatch, tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "chair.obj").write_text("v 0 0 0\n")
+    icp.pipeline_rules = icp.pipeline_rules.replace(import_cache=True, cache_dir=str(tmp_path / "cache"))
+    calls = []
+
+    def fake_file(fp, **k):
+        calls.append((k.get('type'), bool(k.get('exportSelected'))))
+        if k.get('exportSelected'):
+            open(fp, 'wb').write(b'snapshot')
+            return fp
+        if k.get('type') == "mayaBinary":
+            raise RuntimeError("file was saved by a newer version")
+        return ['chair']
+
+    monkeypatch.setattr(icp.cmds, "file", fake_file)
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda *a, **k: [])
+    icp.batch_import_and_cleanup(str(tmp_path / "assets"))
+    calls.clear()
+    metrics = icp.batch_import_and_cleanup(str(tmp_path / "assets"))
+    # Snapshot fails, the source is translated and a fresh snapshot written
+    assert calls == [("mayaBinary", False), ("OBJ", False), ("mayaBinary", True)]
+    assert [sp.get('cached', False) for sp in metrics.spans if sp['name'] == 'import'] == [True, False]
+    cache = ic.ImportCache(str(tmp_path / "cache"))
+    assert len(cache.entries) == 1
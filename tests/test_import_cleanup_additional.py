@@ -97,3 +97,402 @@ def test_batch_import_namespace_cleanup_exception(monkeypatch):
     monkeypatch.setattr(icp.cmds, "namespaceInfo", lambda **k: ["badNamespace"])
     monkeypatch.setattr(icp.cmds, "namespace", lambda **k: (_ for _ in ()).throw(Exception("namespace cleanup failed")))
     icp.batch_import_and_cleanup()
+
+def test_name_allocator_seeded_once(monkeypatch):
+    # Test NameAllocator queries the scene once and never calls objExists
+    monkeypatch.setattr(icp.cmds, "ls", lambda **k: ["ASSET_test", "ASSET_test_001"])
+    monkeypatch.setattr(icp.cmds, "objExists", lambda name: pytest.fail("objExists called"))
+    alloc = icp.NameAllocator.from_scene()
+    assert alloc.allocate("test") == "ASSET_test_002"
+    assert alloc.allocate("test") == "ASSET_test_003"
+    assert alloc.allocate("other") == "ASSET_other"
+    assert icp.get_unique_asset_name("other", allocator=alloc) == "ASSET_other_001"
+
+def test_preview_renaming_collisions(monkeypatch, tmp_path):
+    # Test preview_renaming avoids names already in the scene
+    (tmp_path / "cube.ma").touch()
+    monkeypatch.setattr(icp.cmds, "ls", lambda **k: ["ASSET_cube"])
+    assert icp.preview_renaming(str(tmp_path)) == {"cube": "ASSET_cube_001"}
+
+def test_iter_preview_renaming_chunks_and_flags_conflicts(monkeypatch, tmp_path):
+    # Test the streaming preview yields fixed-size chunks of records with conflict flags
+    for name in ("a.ma", "b.ma", "c.ma", "d-e.ma", "d_e.obj"):
+        (tmp_path / name).touch()
+    monkeypatch.setattr(icp.cmds, "ls", lambda **k: ["ASSET_b"])
+    chunks = list(icp.iter_preview_renaming(str(tmp_path), chunk_size=2))
+    assert [len(c) for c in chunks] == [2, 2, 1]
+    rows = {r.original: r for c in chunks for r in c}
+    assert rows["b"] == ("b", "ASSET_b_001", str(tmp_path / "b.ma"), True)
+    assert not rows["a"].conflict
+    assert [rows[n].conflict for n in ("d-e", "d_e")].count(True) == 1
+    with pytest.raises(FileNotFoundError):
+        icp.iter_preview_renaming(str(tmp_path / "missing"))
+
+def test_scan_asset_files_recursive(tmp_path):
+    # Test recursive scan walks nested folders and returns path/size/mtime entries
+    nested = tmp_path / "vendor" / "deep"
+    nested.mkdir(parents=True)
+    (tmp_path / "top.ma").write_text("abc")
+    (nested / "leaf.fbx").write_text("")
+    (nested / "notes.txt").write_text("")
+    flat = icp.scan_asset_files(str(tmp_path))
+    assert [os.path.basename(e.path) for e in flat] == ["top.ma"]
+    assert flat[0].size == 3
+    deep = icp.scan_asset_files(str(tmp_path), recursive=True)
+    assert sorted(os.path.basename(e.path) for e in deep) == ["leaf.fbx", "top.ma"]
+
+def test_iter_asset_files_streams_in_collect_order(monkeypatch, tmp_path):
+    # Test the streaming walk yields the collect order, deduped, before later folders are listed
+    for rel in ("a-b.ma", "a/x.ma", "a.fbx", "a.ma", "a.foo.ma", "b/c/d.obj", "b/c.ma", "z.abc"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    icp.clear_scan_cache()
+    collected = icp._collect_asset_files(str(tmp_path), recursive=True)
+    assert list(icp._iter_collected_files(str(tmp_path), recursive=True)) == collected
+    assert str(tmp_path / "a.fbx") not in collected
+
+    listed = []
+    real_scan = icp._scan_dir
+    monkeypatch.setattr(icp, "_scan_dir", lambda d, use_cache=True: listed.append(d) or real_scan(d, use_cache))
+    first = next(icp.iter_preview_renaming(str(tmp_path), recursive=True, chunk_size=1))
+    assert first[0].source_path == collected[0]
+    assert str(tmp_path / "b") not in listed
+
+def test_scan_asset_files_uses_dir_cache(monkeypatch, tmp_path):
+    # Test an unchanged folder is served from the cache without rescanning
+    (tmp_path / "a.ma").touch()
+    icp.clear_scan_cache()
+    icp.scan_asset_files(str(tmp_path))
+    monkeypatch.setattr(icp.os, "scandir", lambda p: pytest.fail("rescanned"))
+    assert len(icp.scan_asset_files(str(tmp_path))) == 1
+    # Rewriting a file in place keeps the folder mtime; cached entries are re-stat'ed
+    folder_mtime = os.stat(tmp_path).st_mtime_ns
+    (tmp_path / "a.ma").write_text("rewritten")
+    os.utime(tmp_path / "a.ma", ns=(10 ** 18, 10 ** 18))
+    os.utime(tmp_path, ns=(folder_mtime, folder_mtime))
+    entry = icp.scan_asset_files(str(tmp_path))[0]
+    assert (entry.size, entry.mtime) == (9, 10 ** 9)
+
+def test_incremental_import_skips_unchanged(monkeypatch, tmp_path):
+    # Test incremental mode only reimports changed files and removes deleted ones
+    d = tmp_path / "assets"
+    d.mkdir()
+    (d / "a.ma").write_text("a")
+    (d / "b.ma").write_text("b")
+    manifest = str(tmp_path / "manifest.json")
+    imported, deleted = [], []
+    monkeypatch.setattr(icp.cmds, "file", lambda fp, **k: imported.append(os.path.basename(fp)) or [fp + "|root"])
+    monkeypatch.setattr(icp.cmds, "ls", lambda *a, **k: list(a[0]) if a else [])
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda n, **k: [])
+    monkeypatch.setattr(icp.cmds, "delete", lambda nodes: deleted.extend(nodes))
+
+    icp.batch_import_and_cleanup(str(d), incremental=True, manifest_path=manifest)
+    assert sorted(imported) == ["a.ma", "b.ma"]
+
+    imported.clear()
+    icp.batch_import_and_cleanup(str(d), incremental=True, manifest_path=manifest)
+    assert imported == []
+
+    (d / "a.ma").write_text("changed")
+    (d / "b.ma").unlink()
+    icp.batch_import_and_cleanup(str(d), incremental=True, manifest_path=manifest)
+    assert imported == ["a.ma"]
+    assert str(d / "a.ma") + "|root" in deleted and str(d / "b.ma") + "|root" in deleted
+
+def test_incremental_manifest_defaults_to_local_cache(monkeypatch, tmp_path):
+    # Test the default manifest goes to the cache dir and leaves the asset folder untouched
+    d = tmp_path / "assets"
+    d.mkdir()
+    (d / "a.ma").write_text("a")
+    monkeypatch.setattr(icp.cmds, "file", lambda fp, **k: [fp + "|root"])
+    monkeypatch.setattr(icp.cmds, "ls", lambda *a, **k: list(a[0]) if a else [])
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda n, **k: [])
+    icp.batch_import_and_cleanup(str(d), incremental=True)
+    assert sorted(os.listdir(d)) == ["a.ma"]
+    assert os.path.isfile(icp.default_manifest_path(str(d)))
+    assert os.path.dirname(icp.default_manifest_path(str(d))) == icp.DEFAULT_MANIFEST_DIR
+
+def test_incremental_import_replaces_whole_asset_after_cleanup(monkeypatch, tmp_path):
+    # Test the manifest deletes every node of a changed asset, and a root removed by
+    # empty-group cleanup does not force a reimport on the next run
+    d = tmp_path / "assets"
+    d.mkdir()
+    (d / "a.ma").write_text("a")
+    (d / "b.ma").write_text("b")
+    manifest = str(tmp_path / "manifest.json")
+    scene, imported, deleted = set(), [], []
+
+    def fake_file(fp, **k):
+        name = os.path.basename(fp)[0]
+        imported.append(name)
+        scene.update([f"|{name}_grp", f"|{name}_grp|{name}_geo", f"{name}_mat"])
+        return [f"|{name}_grp", f"|{name}_grp|{name}_geo", f"{name}_mat"]
+
+    def fake_ls(nodes=(), uuid=False, **k):
+        # UUIDs are "u" + node name; accepts names or UUIDs like cmds.ls
+        names = [n[1:] if n.startswith("u") else n for n in nodes]
+        return [("u" + n if uuid else n) for n in names if n in scene]
+
+    monkeypatch.setattr(icp.cmds, "file", fake_file)
+    monkeypatch.setattr(icp.cmds, "ls", fake_ls)
+    monkeypatch.setattr(icp.cmds, "objectType", lambda n: "lambert" if n.endswith("_mat") else "transform")
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda n, **k: ["|x"] if n.count("|") > 1 else [])
+    monkeypatch.setattr(icp.cmds, "delete", lambda nodes: deleted.extend(nodes) or scene.difference_update(nodes))
+    monkeypatch.setattr(icp, "delete_empty_groups", lambda nodes: scene.difference_update(["|b_grp", "|b_grp|b_geo"]))
+
+    icp.batch_import_and_cleanup(str(d), incremental=True, manifest_path=manifest, validate=False)
+    icp.batch_import_and_cleanup(str(d), incremental=True, manifest_path=manifest, validate=False)
+    assert imported == ["a", "b"]
+
+    (d / "a.ma").write_text("changed")
+    icp.batch_import_and_cleanup(str(d), incremental=True, manifest_path=manifest, validate=False)
+    assert imported == ["a", "b", "a"]
+    assert sorted(deleted) == ["a_mat", "|a_grp"]
+
+def test_import_manifest_roundtrip(tmp_path):
+    f = tmp_path / "x.ma"
+    f.write_text("x")
+    m = icp.ImportManifest(str(tmp_path / "m.json"))
+    m.record(str(f), ["uuid-1"], ["uuid-1", "uuid-2"])
+    m.save()
+    loaded = icp.ImportManifest.load(m.path)
+    assert loaded.all_nodes() == ["uuid-1", "uuid-2"]
+    files, stale, unchanged = loaded.plan([str(f)], {"uuid-1"})
+    assert (files, stale, unchanged) == ([], [], 1)
+    f.write_text("changed")
+    assert loaded.plan([str(f)], {"uuid-1", "uuid-2"})[:2] == ([str(f)], ["uuid-1", "uuid-2"])
+
+def test_scene_mutation_batch_single_chunk():
+    # Test queued operations are applied in one undo chunk with renames last
+    backend = icp.FakeMutationBackend(["a", "b"])
+    batch = icp.SceneMutationBatch(backend)
+    batch.center(["a", "b"])
+    batch.scale(["a", "b"], 2.0)
+    batch.rename("a", "ASSET_a")
+    batch.rename("missing", "ASSET_missing")
+    renamed, errors = batch.apply()
+    assert backend.chunks == ["assetImportCleanup"]
+    # one bounds/pivot query and one scale call for both roots, then one move each
+    assert backend.calls == ["world_bounds", "scale_pivots", "scale", "move", "move", "closeChunk"]
+    assert renamed == {"a": "ASSET_a"}
+    assert [(op, node) for op, node, _ in errors] == [("rename", "missing")]
+    assert backend.nodes["ASSET_a"] == dict(translate=(0.0, 0.0, 0.0), scale=(2.0, 2.0, 2.0))
+    assert len(batch) == 0
+
+def test_scene_mutation_batch_isolates_center_failures():
+    backend = icp.FakeMutationBackend(["a"])
+    batch = icp.SceneMutationBatch(backend)
+    batch.center(["a", "ghost"])
+    _, errors = batch.apply()
+    assert [(op, node) for op, node, _ in errors] == [("center", "ghost")]
+    assert backend.nodes["a"]["translate"] == (0.0, 0.0, 0.0)
+
+def test_scene_mutation_batch_target_height_and_ground_snap():
+    backend = icp.FakeMutationBackend(["a", "b"])
+    backend.nodes["b"]["scale"] = (4.0, 4.0, 4.0)
+    batch = icp.SceneMutationBatch(backend)
+    batch.normalize(["a", "b"], center=True, ground=True, target_height=2.0)
+    batch.apply()
+    for n in ("a", "b"):
+        lo_x, lo_y, lo_z, hi_x, hi_y, hi_z = backend.world_bounds([n])[0]
+        assert abs(hi_y - lo_y - 2.0) < 1e-9
+        assert abs(lo_y) < 1e-9 and abs(lo_x + hi_x) < 1e-9 and abs(lo_z + hi_z) < 1e-9
+
+def test_scale_only_skips_bounds_query():
+    backend = icp.FakeMutationBackend(["a", "b"])
+    batch = icp.SceneMutationBatch(backend)
+    batch.scale(["a", "b"], 0.01)
+    batch.apply()
+    assert backend.calls == ["scale", "closeChunk"]
+    assert backend.nodes["b"]["translate"] == (1.0, 2.0, 3.0)
+
+def test_solve_transforms_backends_agree(monkeypatch):
+    bounds = [(-1, 0, -1, 1, 4, 1), (2, 2, 2, 4, 3, 4)]
+    pivots = [(0, 0, 0), (3, 2, 3)]
+    args = (bounds, pivots, [1.0, 0.01], [True, True], [True, False], [2.0, 0.0])
+    scales, deltas = icp._solve_transforms_py(*args)
+    assert scales == [0.5, 0.01]
+    assert deltas[0] == (0.0, 0.0, 0.0)
+    assert all(abs(a - b) < 1e-12 for a, b in zip(deltas[1], (-3.0, -2.005, -3.0)))
+    if icp.np is not None:
+        np_scales, np_deltas = icp._solve_transforms_np(*args)
+        assert np_scales == scales
+        assert all(abs(a - b) < 1e-12 for d1, d2 in zip(np_deltas, deltas) for a, b in zip(d1, d2))
+
+def _fake_hierarchy(monkeypatch, dag, deleted):
+    transforms = [p for p in dag if not p.endswith("Shape")]
+    def fake_ls(*args, **kwargs):
+        if kwargs.get("dag"):
+            roots = args[0]
+            return [p for p in dag if any(p == r or p.startswith(r + "|") for r in roots)]
+        return [n for n in args[0] if n in transforms] if args else []
+    monkeypatch.setattr(icp.cmds, "ls", fake_ls)
+    monkeypatch.setattr(icp.cmds, "delete", lambda nodes: deleted.append(list(nodes)))
+
+def test_delete_empty_groups_bottom_up_single_call(monkeypatch):
+    # Test nested empty groups collapse and are deleted in one call
+    dag = ["|grp", "|grp|sub", "|grp|geo", "|grp|geo|geoShape", "|empty", "|empty|inner", "|empty|inner|leaf"]
+    deleted = []
+    _fake_hierarchy(monkeypatch, dag, deleted)
+    result = icp.delete_empty_groups([p for p in dag if not p.endswith("Shape")])
+    assert deleted == [["|empty", "|grp|sub"]]
+    assert result == ["|empty", "|grp|sub"]
+
+def test_delete_empty_groups_limited_to_scope(monkeypatch):
+    # Test pre-existing groups outside the given node set are left alone
+    dag = ["|old", "|new", "|new|child"]
+    deleted = []
+    _fake_hierarchy(monkeypatch, dag, deleted)
+    assert icp.delete_empty_groups(["|new|child"]) == ["|new|child"]
+    assert deleted == [["|new|child"]]
+
+def test_delete_empty_groups_failure_handled(monkeypatch):
+    monkeypatch.setattr(icp.cmds, "ls", lambda *a, **k: ["|emptyGroup"])
+    monkeypatch.setattr(icp.cmds, "delete", lambda n: (_ for _ in ()).throw(Exception("delete failed")))
+    assert icp.delete_empty_groups(["|emptyGroup"]) == []
+
+def test_flatten_namespaces_deepest_first_with_clashes(monkeypatch):
+    # Test nested namespaces move deepest-first and clashes are renamed up front
+    calls = []
+    monkeypatch.setattr(icp.cmds, "namespaceInfo", lambda **k: ["UI", "shared", "rigA", "rigA:sub", "rigB"])
+    monkeypatch.setattr(icp.cmds, "ls", lambda *a, **k: ["ctrl", "rigA:ctrl", "rigA:sub:ctrl", "rigB:geo"])
+    monkeypatch.setattr(icp.cmds, "rename", lambda old, new: calls.append(("rename", old, new)) or new)
+    monkeypatch.setattr(icp.cmds, "namespace", lambda **k: calls.append(("ns",) + tuple(k.items())[0]))
+    report = icp.flatten_namespaces()
+    assert report["moved"] == ["rigA:sub", "rigA", "rigB"]
+    assert report["renamed"] == {"rigA:sub:ctrl": "rigA:sub:ctrl_001", "rigA:ctrl": "rigA:ctrl_002"}
+    moves = [c[2][0] for c in calls if c[:2] == ("ns", "moveNamespace")]
+    assert moves == ["rigA:sub", "rigA", "rigB"]
+    assert calls.index(("rename", "rigA:ctrl", "rigA:ctrl_002")) < calls.index(("ns", "moveNamespace", ["rigA", ":"]))
+
+def test_flatten_namespaces_renames_nested_clashes_by_parent(monkeypatch):
+    # Test a clashing parent and child both get renamed, child first, and DAG names
+    # under other parents do not count as clashes
+    scene = ["|grp", "|grp|geo", "|props|lid", "|rigA:grp", "|rigA:grp|geo", "|rigA:grp|rigA:geo",
+             "|rigA:grp|rigA:lid"]
+    monkeypatch.setattr(icp.cmds, "namespaceInfo", lambda **k: ["rigA"])
+    monkeypatch.setattr(icp.cmds, "ls", lambda *a, **k: list(scene))
+    monkeypatch.setattr(icp.cmds, "namespace", lambda **k: None)
+    def fake_rename(old, new):
+        if old not in scene:
+            raise RuntimeError(f"No object matches name: {old}")
+        new_path = old.rsplit("|", 1)[0] + "|" + new
+        scene[:] = [new_path + p[len(old):] if p == old or p.startswith(old + "|") else p for p in scene]
+        return new
+    monkeypatch.setattr(icp.cmds, "rename", fake_rename)
+    report = icp.flatten_namespaces()
+    assert report["renamed"] == {"|rigA:grp|rigA:geo": "rigA:geo_001", "|rigA:grp": "rigA:grp_001"}
+    assert "|rigA:grp_001|rigA:geo_001" in scene and "|rigA:grp_001|rigA:lid" in scene
+
+def test_flatten_namespaces_reports_failures(monkeypatch):
+    monkeypatch.setattr(icp.cmds, "namespaceInfo", lambda **k: ["locked"])
+    def fake_namespace(**k):
+        if "moveNamespace" in k:
+            raise RuntimeError("referenced")
+    monkeypatch.setattr(icp.cmds, "namespace", fake_namespace)
+    report = icp.flatten_namespaces()
+    assert report["moved"] == []
+    assert "referenced" in report["failed"]["locked"]
+
+def test_iter_batch_import_yields_per_file_and_cancels(monkeypatch, tmp_path):
+    # Test the cooperative import yields after each file and honours cancel_check
+    for name in ("a.ma", "b.ma", "c.ma"):
+        (tmp_path / name).write_text("")
+    imported = []
+    monkeypatch.setattr(icp.cmds, "file", lambda fp, **k: imported.append(fp) or [])
+    cancelled = []
+    steps = icp.iter_batch_import_and_cleanup(str(tmp_path), cancel_check=lambda: bool(cancelled))
+    assert next(steps) == (1, 3)
+    cancelled.append(True)
+    assert list(steps) == []
+    assert len(imported) == 1
+
+def test_batch_import_reports_progress(monkeypatch, tmp_path):
+    for name in ("a.ma", "b.ma"):
+        (tmp_path / name).write_text("")
+    progress = []
+    icp.batch_import_and_cleanup(str(tmp_path), progress_callback=progress.append)
+    assert progress == [50, 100]
+
+def test_batch_import_returns_stage_metrics(monkeypatch, tmp_path):
+    # Test per-file and per-stage spans are collected and exportable
+    (tmp_path / "a.ma").write_text("")
+    (tmp_path / "b.ma").write_text("")
+    monkeypatch.setattr(icp.cmds, "file", lambda fp, **k: [fp + "_root"])
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda n, **k: [])
+    metrics = icp.batch_import_and_cleanup(str(tmp_path), center_on_import=True, scale_factor=2.0, profile=True)
+    totals = metrics.totals()
+    for stage in ("collect", "import", "center", "scale", "rename", "path_repair", "namespaces", "refresh"):
+        assert stage in totals
+    assert sorted(os.path.basename(sp["file"]) for sp in metrics.slowest("import")) == ["a.ma", "b.ma"]
+    assert "function calls" in metrics.profile_stats()
+
+    trace = tmp_path / "trace.json"
+    metrics.to_chrome_trace(str(trace))
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert all(e["ph"] == "X" for e in events)
+    assert len([e for e in events if e["name"] == "import"]) == 2
+    metrics.to_json(str(tmp_path / "metrics.json"))
+    assert "totals" in json.loads((tmp_path / "metrics.json").read_text())
+
+def test_plugin_manager_caches_and_filters_unavailable(monkeypatch):
+    loads = []
+    def load_plugin(name, **k):
+        loads.append(name)
+        if name == "fbxmaya":
+            raise RuntimeError("plugin not found")
+    monkeypatch.setattr(icp.cmds, "pluginInfo", lambda name, **k: False)
+    monkeypatch.setattr(icp.cmds, "loadPlugin", load_plugin)
+    mgr = icp.PluginManager()
+    files = ["a.fbx", "b.fbx", "c.ma", "d.abc"]
+    assert mgr.filter_supported(files) == ["c.ma", "d.abc"]
+    assert mgr.filter_supported(files) == ["c.ma", "d.abc"]
+    assert loads == ["fbxmaya", "AbcImport"]
+    assert mgr.available == {"fbxmaya": False, "AbcImport": True}
+    assert "not available" in mgr.report() and "loaded in" in mgr.report()
+    # Loaded by hand later: picked up without another load attempt
+    monkeypatch.setattr(icp.cmds, "pluginInfo", lambda name, **k: name == "fbxmaya")
+    assert mgr.filter_supported(files) == files
+    assert loads == ["fbxmaya", "AbcImport"]
+
+def test_collect_and_preload_loads_only_found_types(monkeypatch, tmp_path):
+    (tmp_path / "a.fbx").write_text("")
+    (tmp_path / "c.ma").write_text("")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.obj").write_text("")
+    loads = []
+    monkeypatch.setattr(icp.cmds, "pluginInfo", lambda name, **k: name in loads)
+    monkeypatch.setattr(icp.cmds, "loadPlugin", lambda name, **k: loads.append(name))
+    monkeypatch.setattr(icp, "plugins", icp.PluginManager())
+    files = icp.collect_and_preload(str(tmp_path), recursive=True)
+    assert sorted(os.path.basename(f) for f in files) == ["a.fbx", "b.obj", "c.ma"]
+    assert sorted(loads) == ["fbxmaya", "objExport"]
+
+def test_batch_import_names_match_preview_despite_scheduling(monkeypatch, tmp_path):
+    # Test names follow the preview's collect order even when the scheduler reorders files
+    for rel in ("a/chair.abc", "b/chair.fbx"):
+        (tmp_path / rel).parent.mkdir()
+        (tmp_path / rel).write_text("")
+    renames = {}
+    monkeypatch.setattr(icp.cmds, "file", lambda fp, **k: [os.path.basename(os.path.dirname(fp)) + "_root"])
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda n, **k: [])
+    monkeypatch.setattr(icp.cmds, "rename", lambda old, new: renames.setdefault(old, new))
+    reverse = MagicMock(plan=lambda files: list(reversed(files)))
+    preview = [row for chunk in icp.iter_preview_renaming(str(tmp_path), recursive=True) for row in chunk]
+    list(icp.iter_batch_import_and_cleanup(str(tmp_path), recursive=True, validate=False, scheduler=reverse))
+    assert [(os.path.basename(os.path.dirname(r.source_path)), r.new_name) for r in preview] == \
+        [("a", "ASSET_chair"), ("b", "ASSET_chair_001")]
+    assert renames == {"a_root": "ASSET_chair", "b_root": "ASSET_chair_001"}
+
+def test_batch_import_uses_assigned_names(monkeypatch, tmp_path):
+    # Test names assigned by the caller are used and reserved for the other files
+    for name in ("chair.ma", "desk.ma"):
+        (tmp_path / name).write_text("")
+    renames = {}
+    monkeypatch.setattr(icp.cmds, "file", lambda fp, **k: [os.path.basename(fp)[:-3] + "_root"])
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda n, **k: [])
+    monkeypatch.setattr(icp.cmds, "rename", lambda old, new: renames.setdefault(old, new))
+    names = {str(tmp_path / "chair.ma"): "ASSET_desk"}
+    icp.batch_import_and_cleanup(str(tmp_path), validate=False, names=names)
+    assert renames == {"chair_root": "ASSET_desk", "desk_root": "ASSET_desk_001"}
@@ -0,0 +1,47 @@
+import os
+import import_scheduler as sched
+
+def _files(tmp_path, spec):
+    paths = []
+    for name, size in spec:
+        p = tmp_path / name
+        p.write_bytes(b"\0" * size)
+        paths.append(str(p))
+    return paths
+
+def test_stats_fit_and_roundtrip(tmp_path):
+    stats = sched.ImportStats(str(tmp_path / "stats.json"))
+    assert stats.model(".fbx") == sched.DEFAULT_COSTS[".fbx"]
+    for mb in (1, 2, 4):
+        stats.add(".fbx", mb * (1 << 20), 0.5 + 2.0 * mb)
+    fixed, per_mb = stats.model(".fbx")
+    assert abs(fixed - 0.5) < 1e-9 and abs(per_mb - 2.0) < 1e-9
+    stats.save()
+    loaded = sched.ImportStats.load(str(tmp_path / "stats.json"))
+    assert abs(loaded.estimate(".fbx", 3 << 20) - 6.5) < 1e-9
+
+def test_plan_groups_formats_and_weights_progress(tmp_path):
+    files = _files(tmp_path, [("a.obj", 10), ("b.ma", 4 << 20), ("c.obj", 1 << 20), ("d.ma", 10)])
+    s = sched.ImportScheduler(sched.ImportStats(None))
+    order = [os.path.basename(f) for f in s.plan(files)]
+    assert order == ["b.ma", "d.ma", "c.obj", "a.obj"]
+    assert s.fraction(1) > 0.5
+    assert s.fraction(len(order)) == 1.0
+    assert s.eta(0) is None and s.eta(1) >= 0.0
+
+def test_shards_balance_cost(tmp_path):
+    files = _files(tmp_path, [("big.mb", 8 << 20)] + [(f"s{i}.mb", 1 << 20) for i in range(8)])
+    s = sched.ImportScheduler(sched.ImportStats(None))
+    s.plan(files)
+    shards = s.shards(2)
+    loads = [sum(s.stats.estimate(".mb", os.path.getsize(f)) for f in shard) for shard in shards]
+    assert abs(loads[0] - loads[1]) < 0.2
+    assert sorted(f for shard in shards for f in shard) == sorted(files)
+
+def test_record_import_spans_updates_store(tmp_path):
+    (f,) = _files(tmp_path, [("a.abc", 1 << 20)])
+    s = sched.ImportScheduler()
+    s.plan([f])
+    spans = [dict(name="import", file=f, duration=0.7), dict(name="refresh", duration=0.1)]
+    assert s.record(spans) == 1
+    assert sched.ImportStats.load().samples(".abc") == 1
@@ -0,0 +1,70 @@
+import os
+import sys
+import types
+import import_cleanup_prototype as icp
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+from fake_maya import SceneSimulator
+
+def _scene(monkeypatch, tmp_path):
+    # Existing scene content plus an asset whose import does not report its nodes
+    sim = SceneSimulator(namespace_every=1)
+    sim.populate(3)
+    sim.add_node("other:rig")
+    sim_file = sim.file
+    monkeypatch.setattr(sim, "file", lambda *a, **k: sim_file(*a, **k) and [])
+    monkeypatch.setattr(icp, "cmds", sim)
+    (tmp_path / "chair.ma").write_text("//Maya ASCII 2023 scene\n")
+    return sim
+
+def _fake_openmaya(sim):
+    callbacks = []
+    add_node = sim.add_node
+
+    def tracked_add_node(*a, **k):
+        name = add_node(*a, **k)
+        for fn in callbacks:
+            fn(sim.nodes[name]['uuid'], None)
+        return name
+
+    sim.add_node = tracked_add_node
+    handle = lambda uuid: types.SimpleNamespace(isValid=lambda: uuid in sim.by_uuid, object=lambda: uuid)
+    fn_node = lambda uuid: types.SimpleNamespace(uuid=lambda: types.SimpleNamespace(asString=lambda: uuid))
+    return types.SimpleNamespace(
+        MDGMessage=types.SimpleNamespace(addNodeAddedCallback=lambda fn, t: callbacks.append(fn) or fn),
+        MMessage=types.SimpleNamespace(removeCallback=callbacks.remove),
+        MObjectHandle=handle,
+        MFnDependencyNode=fn_node,
+    )
+
+def _check_scene(sim):
+    assert "ASSET_chair" in sim.nodes
+    assert "ns1:chair_empty" not in sim.nodes and "chair_empty" not in sim.nodes
+    assert "chair_geo" in sim.nodes
+    # Pre-existing nodes and namespaces are left alone
+    assert {"prop0", "prop1", "prop2", "other:rig"} <= set(sim.nodes)
+    assert sim.namespaces == {"other"}
+
+def test_diff_tracking_finds_unreported_nodes(monkeypatch, tmp_path):
+    sim = _scene(monkeypatch, tmp_path)
+    monkeypatch.setattr(icp, "NODE_TRACKING", "diff")
+    icp.batch_import_and_cleanup(str(tmp_path))
+    _check_scene(sim)
+
+def test_callback_tracking_scopes_cleanup(monkeypatch, tmp_path):
+    sim = _scene(monkeypatch, tmp_path)
+    monkeypatch.setattr(icp, "om", _fake_openmaya(sim))
+    tracker = icp.NodeTracker()
+    assert tracker.mode == "callback"
+    with tracker:
+        sim.add_node("temp")
+        sim.add_node("kept")
+        sim.delete("temp")
+    assert [sim.by_uuid[u] for u in tracker.uuids] == ["kept"]
+
+    sim.calls.clear()
+    icp.batch_import_and_cleanup(str(tmp_path))
+    _check_scene(sim)
+    # Namespace members were queried per namespace, not with a scene-wide ls
+    assert sim.calls["namespaceInfo"] == 1
@@ -0,0 +1,119 @@
+import os
+import import_cleanup_prototype as icp
+import path_repair as pr
+
+def _tree(tmp_path):
+    for rel in ("lib/wood/textures/diffuse.png", "lib/metal/textures/diffuse.png",
+                "lib/metal/rough.png", "tiles/floor.1001.png", "tiles/floor.1002.png",
+                "lib/.git/diffuse.png"):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"")
+    return str(tmp_path)
+
+def test_index_resolves_by_name_and_trailing_dirs(tmp_path):
+    root = _tree(tmp_path)
+    index = pr.FileIndex.build([root])
+    assert len(index) == 5
+    new, tie = index.resolve("D:\\old\\metal\\textures\\diffuse.png")
+    assert new == os.path.join(root, "lib", "metal", "textures", "diffuse.png") and not tie
+    assert index.resolve("/gone/diffuse.png")[1]
+    assert index.resolve("/gone/ROUGH.png")[0] == os.path.join(root, "lib", "metal", "rough.png")
+    assert index.resolve("/gone/floor.<UDIM>.png")[0] == os.path.join(root, "tiles", "floor.<UDIM>.png")
+    assert index.resolve("/gone/missing.png") == (None, False)
+
+def test_index_is_cached_on_disk(tmp_path):
+    root = _tree(tmp_path / "src")
+    first = pr.FileIndex.open([root], cache_dir=str(tmp_path / "idx"))
+    again = pr.FileIndex.open([root], cache_dir=str(tmp_path / "idx"))
+    assert not first.from_cache and again.from_cache
+    assert again.names == first.names
+    assert not pr.FileIndex.open([root], cache_dir=str(tmp_path / "idx"), max_age=0).from_cache
+
+def test_fix_missing_paths_repaths_per_directory(monkeypatch, tmp_path):
+    root = _tree(tmp_path)
+    calls = []
+
+    def fake_editor(*attrs, **k):
+        if k.get('listDirectories') == "":
+            return ["/old/a", "/old/b/"]
+        if k.get('listFiles') == "/old/a":
+            return ["diffuse.png", "fileA.fileTextureName", 0, "rough.png", "fileB.fileTextureName", 0]
+        if k.get('listFiles') == "/old/b/":
+            return ["floor.<UDIM>.png", "fileC.fileTextureName", 0, "ok.png", "fileD.fileTextureName", 1,
+                    "lost.png", "fileE.fileTextureName", 0]
+        calls.append((attrs, k))
+
+    monkeypatch.setattr(icp.cmds, "filePathEditor", fake_editor)
+    report = icp.fix_missing_paths(search_roots=[root], dry_run=True)
+    assert calls == []
+    assert len(report.resolved) == 3 and report.unresolved == [("fileE.fileTextureName", "/old/b/lost.png")]
+    assert report.ambiguous == ["fileA.fileTextureName"]
+
+    report = icp.fix_missing_paths(search_roots=[root])
+    assert sorted((a, k["repath"]) for a, k in calls) == sorted([
+        (("fileA.fileTextureName",), os.path.dirname(report.resolved[0][2])),
+        (("fileB.fileTextureName",), os.path.join(root, "lib", "metal")),
+        (("fileC.fileTextureName",), os.path.join(root, "tiles")),
+    ])
+
+def test_scoped_repair_reads_only_given_nodes_and_memoises(monkeypatch, tmp_path):
+    root = _tree(tmp_path)
+    repaths, opened = [], []
+    paths = {"tex1.fileTextureName": "/old/metal/rough.png", "cache1.abc_File": "/old/gone.abc",
+             "tex2.fileTextureName": os.path.join(root, "lib", "metal", "rough.png")}
+
+    def fake_editor(*attrs, **k):
+        if k.get("listRegisteredTypes"):
+            return ["file.fileTextureName", "AlembicNode.abc_File", "reference"]
+        assert "listDirectories" not in k, "scoped repair must not list the whole scene"
+        repaths.append((attrs, k["repath"]))
+
+    def fake_ls(nodes, type=None, showType=False):
+        assert sorted(type) == ["AlembicNode", "file"] and showType
+        types = {"tex1": "file", "tex2": "file", "cache1": "AlembicNode"}
+        return [x for n in nodes if n in types for x in (n, types[n])]
+
+    monkeypatch.setattr(icp.cmds, "filePathEditor", fake_editor)
+    monkeypatch.setattr(icp.cmds, "ls", fake_ls)
+    monkeypatch.setattr(icp.cmds, "getAttr", paths.get)
+    monkeypatch.setattr(icp.cmds, "namespaceInfo", lambda ns, **k: ["tex1", "mesh1"] if ns == ":chair" else [])
+    real_open = pr.FileIndex.open
+    monkeypatch.setattr(pr.FileIndex, "open", lambda *a, **k: opened.append(a) or real_open(*a, **k))
+
+    report = icp.fix_missing_paths(search_roots=[root], namespace="chair")
+    assert repaths == [(("tex1.fileTextureName",), os.path.join(root, "lib", "metal"))]
+    assert report.unresolved == [] and len(opened) == 1
+
+    # A second repair of the same path is answered from the session cache
+    repaths.clear()
+    icp._path_indexes.clear()
+    report = icp.fix_missing_paths(search_roots=[root], nodes=["tex1", "tex2"])
+    assert repaths == [(("tex1.fileTextureName",), os.path.join(root, "lib", "metal"))]
+    assert len(opened) == 1
+
+    report = icp.fix_missing_paths(search_roots=[root], nodes=["cache1"], dry_run=True)
+    assert report.unresolved == [("cache1.abc_File", "/old/gone.abc")]
+
+def test_case_mismatch_sets_full_path(monkeypatch, tmp_path):
+    # A repath keeps the old file name, so a name matched with another case is replaced whole
+    (tmp_path / "tex").mkdir()
+    (tmp_path / "tex" / "wood.png").write_bytes(b"")
+    (tmp_path / "tex" / "Metal.png").write_bytes(b"")
+    calls = []
+
+    def fake_editor(*attrs, **k):
+        if k.get("listDirectories") == "":
+            return ["/old"]
+        if k.get("listFiles") == "/old":
+            return ["Wood.png", "fileA.fileTextureName", 0, "Metal.png", "fileB.fileTextureName", 0]
+        calls.append((attrs, k))
+
+    monkeypatch.setattr(icp.cmds, "filePathEditor", fake_editor)
+    report = icp.fix_missing_paths(search_roots=[str(tmp_path)])
+    wood = os.path.join(str(tmp_path), "tex", "wood.png")
+    assert ("fileA.fileTextureName", "/old/Wood.png", wood) in report.resolved
+    assert calls == [
+        (("fileB.fileTextureName",), dict(repath=os.path.join(str(tmp_path), "tex"), force=True)),
+        (("fileA.fileTextureName",), dict(replaceField="fullPath", replaceString=("/old/Wood.png", wood), force=True)),
+    ]
@@ -0,0 +1,44 @@
+import logging
+import contextlib
+import pipeline_logging
+
+def _logger(name):
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+def test_stream_to_logger_splits_printed_lines():
+    logger = _logger("test_pipeline.stream")
+    ring = pipeline_logging.RingBufferHandler()
+    logger.addHandler(ring)
+    stream = pipeline_logging.StreamToLogger(logger)
+    with contextlib.redirect_stdout(stream):
+        print("Imported MA: cube")
+        print("")
+        print("partial", end="")
+    assert ring.drain() == ["Imported MA: cube"]
+    stream.flush()
+    assert ring.drain() == ["partial"]
+    assert ring.drain() == []
+
+def test_ring_buffer_is_bounded():
+    logger = _logger("test_pipeline.ring")
+    ring = pipeline_logging.RingBufferHandler(capacity=3)
+    logger.addHandler(ring)
+    for i in range(10):
+        logger.info("line %d", i)
+    assert ring.drain() == ["… 7 log lines skipped …", "line 7", "line 8", "line 9"]
+    assert list(ring.history) == ["line 7", "line 8", "line 9"]
+
+def test_rotating_file_handler(tmp_path):
+    logger = _logger("test_pipeline.file")
+    path = tmp_path / "logs" / "pipeline.log"
+    handler = pipeline_logging.add_rotating_file_handler(str(path), max_bytes=200, backup_count=2, logger=logger)
+    assert pipeline_logging.add_rotating_file_handler(str(path), logger=logger) is handler
+    for i in range(50):
+        logger.info("message number %d", i)
+    handler.close()
+    assert path.exists()
+    assert (tmp_path / "logs" / "pipeline.log.1").exists()
+    assert not (tmp_path / "logs" / "pipeline.log.3").exists()
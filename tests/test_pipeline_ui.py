@@ -50,7 +50,7 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
 sys.path.insert(0, os.path.join(ROOT, "ui"))
 sys.path.insert(0, os.path.join(ROOT, "src"))
 
-from PySide2 import QtWidgets
+from PySide2 import QtWidgets, QtCore
 import import_cleanup_prototype
 import pipeline_ui
 from pipeline_ui import PipelineToolUI, show_pipeline_ui
@@ -64,26 +64,35 @@ def test_ui_components_exist(qapp, qtbot):
     assert ui.batch_repair_btn.text() == "Batch Path Repair"
     assert ui.export_btn.text() == "Export Selection to USD"
     assert ui.run_btn.text() == "Import & Clean"
-    headers = [ui.preview_table.horizontalHeaderItem(i).text() for i in range(2)]
-    assert headers == ["Original", "New Name"]
+    headers = [ui.preview_model.headerData(i, QtCore.Qt.Horizontal) for i in range(3)]
+    assert headers == ["Original", "New Name", "Source"]
 
 
 def test_preview_populates_table(qapp, qtbot, tmp_path, monkeypatch):
-    fake = {"foo": "ASSET_foo", "bar": "ASSET_bar"}
-    monkeypatch.setattr(import_cleanup_prototype, "preview_renaming", lambda f: fake)
+    fake = {"foo": "ASSET_foo", "bar": "ASSET_bar_001"}
+    rows = [import_cleanup_prototype.PreviewRow(o, n, f"/src/{o}.ma", n.endswith("_001")) for o, n in fake.items()]
+    monkeypatch.setattr(import_cleanup_prototype, "iter_preview_renaming",
+                        lambda f, rules=None, chunk_size=500: iter([rows[:1], rows[1:]]))
     ui = PipelineToolUI()
     qtbot.addWidget(ui)
     ui.dir_line.setText(str(tmp_path))
     ui.on_preview()
-    assert ui.preview_table.rowCount() == 2
+    # Rows arrive one chunk per event-loop pass
+    assert ui.preview_model.rowCount() == 0
+    qtbot.waitUntil(lambda: not ui._preview_timer.isActive())
+    model = ui.preview_model
+    assert model.rowCount() == 2 and model.conflicts == 1
     for row,(o,n) in enumerate(fake.items()):
-        assert ui.preview_table.item(row,0).text() == o
-        assert ui.preview_table.item(row,1).text() == n
+        assert model.data(model.index(row, 0)) == o
+        assert model.data(model.index(row, 1)) == n
+        assert model.data(model.index(row, 2)) == f"/src/{o}.ma"
+    assert model.data(model.index(1, 1), QtCore.Qt.ForegroundRole) is not None
+    assert model.data(model.index(0, 1), QtCore.Qt.ForegroundRole) is None
 
 
 def test_batch_repair_logs_and_calls(qapp, qtbot, monkeypatch):
     called = []
-    monkeypatch.setattr(import_cleanup_prototype, "fix_missing_paths", lambda: called.append(True))
+    monkeypatch.setattr(import_cleanup_prototype, "fix_missing_paths", lambda **k: called.append(k))
     ui = PipelineToolUI()
     qtbot.addWidget(ui)
     ui.on_batch_repair()
@@ -94,10 +103,15 @@ def test_batch_repair_logs_and_calls(qapp, qtbot, monkeypatch):
 
 def test_on_run_invokes_pipeline(qapp, qtbot, monkeypatch):
     calls = []
-    # patch to accept new signature but only record folder_path
-    def fake_batch_import_and_cleanup(folder_path, center_on_import=False, scale_factor=1.0, progress_callback=None):
+    # the UI drives the cooperative generator; record folder_path and yield two steps
+    def fake_iter_batch_import_and_cleanup(folder_path, center_on_import=False, scale_factor=1.0,
+                                           incremental=False, cancel_check=None, scheduler=None, rules=None):
         calls.append(folder_path)
-    monkeypatch.setattr(import_cleanup_prototype, "batch_import_and_cleanup", fake_batch_import_and_cleanup)
+        calls.append(rules)
+        print("imported one")
+        yield 1, 2
+        yield 2, 2
+    monkeypatch.setattr(import_cleanup_prototype, "iter_batch_import_and_cleanup", fake_iter_batch_import_and_cleanup)
 
     ui = PipelineToolUI()
     qtbot.addWidget(ui)
@@ -107,8 +121,101 @@ def test_on_run_invokes_pipeline(qapp, qtbot, monkeypatch):
     ui.naming_cb.setChecked(True)
     ui.path_cb.setChecked(True)
     ui.ns_cb.setChecked(False)
+    ui.naming_prefix_edit.setText("UI_")
     ui.on_run()
-    assert calls == [target]
+    assert not ui.run_btn.isEnabled()
+    qtbot.waitUntil(lambda: ui.run_btn.isEnabled())
+    assert calls[0] == target
+    # UI toggles travel with the run; the module rules stay untouched
+    assert (calls[1].prefix, calls[1].namespace_cleanup) == ("UI_", False)
+    assert import_cleanup_prototype.pipeline_rules.prefix == "ASSET_"
+    assert import_cleanup_prototype.pipeline_rules.namespace_cleanup is True
+    assert "imported one" in ui.log_output.toPlainText()
+    assert ui.progress_bar.format() == "%p%"
+
+
+def test_import_job_reports_cost_weighted_progress(qapp, qtbot):
+    class FakeScheduler:
+        def fraction(self, done, total): return 0.9 if done == 1 else 1.0
+        def eta(self, done): return 75.0
+    def steps(cancel_check=None):
+        yield 1, 2
+        yield 2, 2
+    ui = PipelineToolUI()
+    qtbot.addWidget(ui)
+    job = ui.import_job = pipeline_ui.ImportJob(steps, time_slice=0, scheduler=FakeScheduler())
+    job.progress.connect(ui._on_progress_update)
+    seen = []
+    job.progress.connect(seen.append)
+    with qtbot.waitSignal(job.finished):
+        job.start()
+    assert seen == [90, 100]
+    assert ui.progress_bar.format().endswith("ETA 1:15")
+
+
+def test_import_job_cancel_stops_between_files(qapp, qtbot):
+    seen = []
+    def steps(cancel_check=None):
+        for i in range(100):
+            if cancel_check():
+                break
+            seen.append(i)
+            yield i + 1, 100
+    job = pipeline_ui.ImportJob(steps, time_slice=0)
+    job.cancel()
+    job.start()
+    with qtbot.waitSignal(job.finished) as blocker:
+        pass
+    assert blocker.args == [True]
+    assert seen == []
+
+
+def test_import_job_failure_is_not_reported_as_success(qapp, qtbot, monkeypatch):
+    def steps(cancel_check=None):
+        yield 1, 2
+        raise RuntimeError("scene is locked")
+    ui = PipelineToolUI()
+    qtbot.addWidget(ui)
+    job = ui.import_job = pipeline_ui.ImportJob(steps, time_slice=0)
+    job.failed.connect(ui._on_run_failed)
+    finished = []
+    job.finished.connect(finished.append)
+    shown = []
+    monkeypatch.setattr(QtWidgets.QMessageBox, "critical", lambda *a: shown.append(a[1:]))
+    ui.run_btn.setEnabled(False)
+    with qtbot.waitSignal(job.failed) as blocker:
+        job.start()
+    assert blocker.args == ["scene is locked"] and finished == []
+    assert shown == [("Import Failed", "scene is locked")]
+    assert ui.run_btn.isEnabled() and ui.progress_bar.format().startswith("Failed")
+
+
+def test_log_panel_is_bounded_and_batched(qapp, qtbot):
+    ui = PipelineToolUI()
+    qtbot.addWidget(ui)
+    logger = pipeline_ui.pipeline_logging.get_logger()
+    for i in range(pipeline_ui.LOG_MAX_BLOCKS + 50):
+        logger.info("line %d", i)
+    assert ui.log_output.toPlainText() == ""
+    ui._flush_log()
+    assert ui.log_output.blockCount() <= pipeline_ui.LOG_MAX_BLOCKS
+    assert ui.log_output.toPlainText().endswith("line %d" % (pipeline_ui.LOG_MAX_BLOCKS + 49))
+    ui.close()
+
+
+def test_warm_up_plugins_logs_report(qapp, qtbot, monkeypatch, tmp_path):
+    (tmp_path / "a.abc").write_text("")
+    monkeypatch.setattr(import_cleanup_prototype, "plugins", import_cleanup_prototype.PluginManager())
+    ui = PipelineToolUI()
+    qtbot.addWidget(ui)
+    ui.dir_line.setText(str(tmp_path))
+    ui._warm_up_plugins()
+    # Runs from a timer, not inside the call
+    assert ui._warmup_timer.isActive()
+    qtbot.waitUntil(lambda: not ui._warmup_timer.isActive(), timeout=5000)
+    ui._flush_log()
+    assert "AbcImport" in ui.log_output.toPlainText()
+    assert import_cleanup_prototype.plugins.available == {"AbcImport": True}
 
 
 def test_show_pipeline_ui_shows_window(qapp, qtbot):
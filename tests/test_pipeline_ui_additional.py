@@ -40,7 +40,7 @@ def test_on_selection_changed_resets_slider(qtbot):
 def test_preview_with_invalid_path(monkeypatch, qtbot):
     ui = pui.PipelineToolUI()
     qtbot.addWidget(ui)
-    monkeypatch.setattr(pui.import_cleanup_prototype, "preview_renaming", lambda path=None: (_ for _ in ()).throw(Exception("fail")))
+    monkeypatch.setattr(pui.import_cleanup_prototype, "iter_preview_renaming", lambda path=None, **k: (_ for _ in ()).throw(Exception("fail")))
     with patch("PySide2.QtWidgets.QMessageBox.critical") as mock_msg:
         ui._on_preview()
         mock_msg.assert_called_once()
@@ -49,10 +49,11 @@ def test_batch_repair_logs_call(monkeypatch, qtbot):
     ui = pui.PipelineToolUI()
     qtbot.addWidget(ui)
     called = []
-    monkeypatch.setattr(pui.import_cleanup_prototype, "fix_missing_paths", lambda: called.append(True))
+    monkeypatch.setattr(pui.import_cleanup_prototype, "fix_missing_paths", lambda **k: called.append(k))
     ui._on_batch_repair()
     assert ">>> Running Batch Path Repair…" in ui.log_output.toPlainText()
-    assert called
+    # Nothing imported yet: the whole scene is repaired
+    assert called and called[0]["nodes"] is None
 
 def test_usd_export_no_selection(monkeypatch, qtbot):
     ui = pui.PipelineToolUI()
@@ -2,9 +2,10 @@ import os
 import sys
 import types
 import importlib
+import contextlib
 import pytest
 
-from PySide2 import QtWidgets
+from PySide2 import QtWidgets, QtCore
 
 # Add ui/ and src/ to sys.path
 ROOT    = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -59,22 +60,36 @@ class FakePrim:
             GetVariantSet=lambda name: self._vs
         )
 
+class FakeSessionLayer:
+    def __init__(self):
+        self.saved = False
+    def Save(self):                  self.saved = True
+
 class FakeStage:
     def __init__(self):
         self.layers = [types.SimpleNamespace(identifier="Layer0")]
         self.prims  = [FakePrim()]
         self.saved  = False
+        self.session = FakeSessionLayer()
+        self.edit_targets = []
     def GetLayerStack(self):         return self.layers
     def Traverse(self):              return iter(self.prims)
     def GetPrimAtPath(self, path):   return self.prims[0]
     def GetRootLayer(self):          return self
+    def GetSessionLayer(self):       return self.session
     def Save(self):                  self.saved = True
 
+@contextlib.contextmanager
+def fake_edit_context(stage, layer):
+    stage.edit_targets.append(layer)
+    yield
+
 @pytest.fixture(autouse=True)
 def patch_usd(monkeypatch):
-    fake_usd = types.SimpleNamespace(Stage=types.SimpleNamespace())
+    fake_usd = types.SimpleNamespace(Stage=types.SimpleNamespace(LoadNone="LoadNone"))
     stage    = FakeStage()
-    fake_usd.Stage.Open = lambda path: stage
+    fake_usd.Stage.Open = lambda path, load=None: stage
+    fake_usd.EditContext = fake_edit_context
     monkeypatch.setattr(pipeline_ui, 'Usd', fake_usd)
     yield
 
@@ -84,72 +99,123 @@ def ui_app(qtbot):
     qtbot.addWidget(win)
     return win
 
+def _rows(model, parent=QtCore.QModelIndex()):
+    model.fetch_all(parent)
+    return [model.index(r, 0, parent) for r in range(model.rowCount(parent))]
+
+def _find(model, kind, parent=QtCore.QModelIndex(), name=None):
+    for idx in _rows(model, parent):
+        node = model.node(idx)
+        if node.kind == kind and (name is None or node.name == name):
+            return idx
+    return None
+
 def test_populate_usd_tree_shows_layer_and_prim(ui_app):
     ui_app.current_usd = "dummy.usda"
     ui_app.populate_usd_tree("dummy.usda")
 
-    kinds = {
-        ui_app.usd_tree.topLevelItem(i).text(1)
-        for i in range(ui_app.usd_tree.topLevelItemCount())
-    }
+    kinds = {ui_app.usd_model.node(idx).kind for idx in _rows(ui_app.usd_model)}
     assert "Layer" in kinds
     assert "Prim"  in kinds
 
 def test_variants_listed_and_selection(ui_app):
     ui_app.current_usd = "dummy.usda"
     ui_app.populate_usd_tree("dummy.usda")
+    model = ui_app.usd_model
 
-    prim_item = next(
-        ui_app.usd_tree.topLevelItem(i)
-        for i in range(ui_app.usd_tree.topLevelItemCount())
-        if ui_app.usd_tree.topLevelItem(i).text(1) == "Prim"
-    )
-
-    vs_item = next(
-        prim_item.child(j)
-        for j in range(prim_item.childCount())
-        if prim_item.child(j).text(1) == "VariantSet"
-    )
-
-    sel = vs_item.text(2)
+    prim_idx = _find(model, "Prim")
+    vs_idx = _find(model, "VariantSet", prim_idx)
+    sel = model.index(vs_idx.row(), 2, prim_idx).data()
     assert sel in ("high", "low")
+    assert {model.node(i).name for i in _rows(model, vs_idx)} == {"high", "low"}
 
 def test_on_variant_activate_changes_selection(ui_app):
     ui_app.current_usd = "dummy.usda"
     ui_app.populate_usd_tree("dummy.usda")
+    model = ui_app.usd_model
 
-    prim_item = next(
-        ui_app.usd_tree.topLevelItem(i)
-        for i in range(ui_app.usd_tree.topLevelItemCount())
-        if ui_app.usd_tree.topLevelItem(i).text(1) == "Prim"
-    )
-    vs_item  = next(
-        prim_item.child(j)
-        for j in range(prim_item.childCount())
-        if prim_item.child(j).text(1) == "VariantSet"
-    )
-    high_leaf = next(
-        vs_item.child(k)
-        for k in range(vs_item.childCount())
-        if vs_item.child(k).text(0) == "high"
-    )
+    prim_idx = _find(model, "Prim")
+    vs_idx = _find(model, "VariantSet", prim_idx)
+    high_idx = _find(model, "Variant", vs_idx, name="high")
 
     # Call public method, must exist now
-    ui_app.on_variant_activate(high_leaf, 0)
+    ui_app.save_variant_cb.setChecked(True)
+    ui_app.on_variant_activate(high_idx, 0)
 
     stage = pipeline_ui.Usd.Stage.Open(ui_app.current_usd)
     assert stage.saved
+    assert model.index(vs_idx.row(), 2, prim_idx).data() == "high"
+
+    # Repopulating reflects the new selection too
+    ui_app.populate_usd_tree("dummy.usda")
+    model = ui_app.usd_model
+    prim_idx = _find(model, "Prim")
+    vs_idx = _find(model, "VariantSet", prim_idx)
+    assert model.index(vs_idx.row(), 2, prim_idx).data() == "high"
 
-    # UI should update selection text
+def test_usd_tree_filter_by_path(ui_app):
+    ui_app.current_usd = "dummy.usda"
+    ui_app.populate_usd_tree("dummy.usda")
+    ui_app.usd_filter_edit.setText("NoSuchPrim")
+    assert _find(ui_app.usd_model, "Prim") is None
+    ui_app.usd_filter_edit.setText("MyPr")
+    assert ui_app.usd_model.node(_find(ui_app.usd_model, "Prim")).name == "/MyPrim"
+
+def test_variant_model_fetches_in_batches():
+    from usd_variant_model import UsdVariantTreeModel
+    records = [dict(path=f"/Set/Prop{i}", sets=[dict(name="lod", selection="a", variants=["a", "b"])])
+               for i in range(1000)]
+    model = UsdVariantTreeModel(["root.usda"], lambda: iter(records), batch_size=100)
+    assert model.rowCount() == 1
+    assert model.canFetchMore(QtCore.QModelIndex())
+    model.fetchMore(QtCore.QModelIndex())
+    assert model.rowCount() == 101
+    prim_idx = model.index(1, 0)
+    assert model.hasChildren(prim_idx) and model.rowCount(prim_idx) == 0
+    model.fetchMore(prim_idx)
+    assert model.rowCount(prim_idx) == 1
+
+def test_variant_switch_leaves_index_records_untouched():
+    from usd_variant_model import UsdVariantTreeModel
+    records = [dict(path="/Set/Prop", sets=[dict(name="lod", selection="a", variants=["a", "b"])])]
+    model = UsdVariantTreeModel(["root.usda"], lambda: iter(records))
+    prim_idx = _find(model, "Prim")
+    vs_idx = _find(model, "VariantSet", prim_idx)
+    model.set_variant_selection(_find(model, "Variant", vs_idx, name="b"))
+    assert records[0]['sets'][0]['selection'] == "a"
+
+    # The session selection survives a filter reset
+    model.set_filter("Prop")
+    prim_idx = _find(model, "Prim")
+    vs_idx = _find(model, "VariantSet", prim_idx)
+    assert model.index(vs_idx.row(), 2, prim_idx).data() == "b"
+
+def test_variant_switch_uses_live_proxy_session_layer(ui_app, monkeypatch):
+    ui_app.current_usd = "dummy.usda"
     ui_app.populate_usd_tree("dummy.usda")
-    prim_item = next(
-        ui_app.usd_tree.topLevelItem(i)
-        for i in range(ui_app.usd_tree.topLevelItemCount())
-        if ui_app.usd_tree.topLevelItem(i).text(1) == "Prim"
-    )
-    vs_item  = next(
-        prim_item.child(j)
-        for j in range(prim_item.childCount())
-        if prim_item.child(j).text(1) == "VariantSet"
-    )
-    assert vs_item.text(2) == "high"
+    model = ui_app.usd_model
+    stage = pipeline_ui.Usd.Stage.Open(ui_app.current_usd)
+    monkeypatch.setattr(ui_app, "_live_usd_stage", lambda path: stage)
+    reloaded = []
+    monkeypatch.setattr(ui_app, "_reload_usd_references", lambda path: reloaded.append(path))
+
+    prim_idx = _find(model, "Prim")
+    vs_idx = _find(model, "VariantSet", prim_idx)
+    ui_app.on_variant_activate(_find(model, "Variant", vs_idx, name="high"), 0)
+
+    assert stage.edit_targets == [stage.session]
+    assert not stage.saved and not stage.session.saved
+    assert reloaded == []
+    assert model.index(vs_idx.row(), 2, prim_idx).data() == "high"
+
+def test_variant_switch_without_proxy_or_save_is_noop(ui_app):
+    ui_app.current_usd = "dummy.usda"
+    ui_app.populate_usd_tree("dummy.usda")
+    model = ui_app.usd_model
+    stage = pipeline_ui.Usd.Stage.Open(ui_app.current_usd)
+
+    prim_idx = _find(model, "Prim")
+    vs_idx = _find(model, "VariantSet", prim_idx)
+    ui_app.on_variant_activate(_find(model, "Variant", vs_idx, name="high"), 0)
+    assert not stage.saved
+    assert "enable saving" in ui_app.log_output.toPlainText()
@@ -0,0 +1,127 @@
+import os
+import json
+import pickle
+import pytest
+import import_cleanup_prototype as icp
+from rules_engine import PipelineRules, RulesError
+
+RULES = os.path.join(os.path.dirname(__file__), '..', 'src', 'rules', 'pipeline_rules.json')
+
+def _write(path, prefix="ASSET_", pattern="[^A-Za-z0-9_]"):
+    path.write_text(json.dumps({
+        "naming": {"prefix": prefix, "sanitizePattern": pattern},
+        "cleanup": {"deleteEmptyGroups": True, "namespaceCleanup": False},
+        "pathRepair": {"autoFix": True},
+    }))
+
+def test_shipped_rules_compile_once():
+    rules = PipelineRules.load(RULES)
+    assert rules.prefix == "ASSET_"
+    assert rules.sanitize_name("my-crate v2") == "my_crate_v2"
+    assert rules.validate is True and rules.unit_scale == 1.0
+
+def test_schema_errors_are_reported_together(tmp_path):
+    with pytest.raises(RulesError) as exc:
+        PipelineRules({"naming": {"prefix": 3, "sanitizePattern": "["}, "cleanup": {}, "pathRepair": {"autoFix": "yes"}})
+    msg = str(exc.value)
+    for part in ("naming.prefix", "cleanup.deleteEmptyGroups", "pathRepair.autoFix"):
+        assert part in msg
+    with pytest.raises(RulesError, match="sanitizePattern"):
+        bad = tmp_path / "bad.json"
+        _write(bad, pattern="[")
+        PipelineRules.load(str(bad))
+
+def test_rules_are_immutable_and_replace_copies(tmp_path):
+    rules = PipelineRules.load(RULES)
+    with pytest.raises(AttributeError):
+        rules.prefix = "X_"
+    with pytest.raises(TypeError):
+        rules["naming"]["prefix"] = "X_"
+    changed = rules.replace(prefix="X_", path_autofix=False)
+    assert (changed.prefix, changed.path_autofix) == ("X_", False)
+    assert (rules.prefix, rules.path_autofix) == ("ASSET_", True)
+    assert changed["naming"]["prefix"] == "X_"
+    assert pickle.loads(pickle.dumps(changed)) == changed
+
+def test_current_rules_hot_reloads_on_mtime_change(tmp_path):
+    path = tmp_path / "rules.json"
+    _write(path)
+    icp.reload_rules(str(path))
+    first = icp.current_rules()
+    assert icp.current_rules() is first
+    _write(path, prefix="NEW_")
+    os.utime(path, ns=(first.mtime + 10 ** 9, first.mtime + 10 ** 9))
+    assert icp.current_rules().prefix == "NEW_"
+    assert first.snapshot().reloaded().prefix == "ASSET_"
+
+def test_current_rules_accepts_plain_dict():
+    icp.pipeline_rules = {"naming": {"prefix": "P_", "sanitizePattern": "x"},
+                          "cleanup": {"deleteEmptyGroups": False, "namespaceCleanup": False},
+                          "pathRepair": {"autoFix": False}}
+    assert isinstance(icp.current_rules(), PipelineRules)
+    assert icp.pipeline_rules.prefix == "P_"
+
+def _with_overrides(overrides):
+    data = PipelineRules.load(RULES).to_dict()
+    data["overrides"] = overrides
+    return PipelineRules(data)
+
+def test_override_index_merges_matches_in_order():
+    rules = _with_overrides([
+        {"match": "vendors/acme/**/*.fbx", "prefix": "ACME_"},
+        {"regex": r".*_v\d+\.usda?$", "usdImport": "reference"},
+        {"match": "vendors/acme/chairs/*.fbx", "scaleFactor": 0.01, "prefix": "CHAIR_"},
+    ])
+    assert rules.for_asset("vendors/acme/lamp.fbx") == {"prefix": "ACME_"}
+    assert rules.for_asset("vendors/acme/chairs/a.fbx") == {"prefix": "CHAIR_", "scaleFactor": 0.01}
+    assert rules.for_asset("vendors/acme/chairs/old/a.fbx") == {"prefix": "ACME_"}
+    assert rules.for_asset("vendors/other/a.fbx") == {}
+    assert rules.for_asset("props/tree_v3.usd") == {"usdImport": "reference"}
+    # only the root and vendors/acme buckets are consulted for acme files
+    assert len(rules.override_index._candidates("vendors/acme")) == 2
+
+def test_override_schema_errors():
+    with pytest.raises(RulesError) as exc:
+        _with_overrides([{"prefix": "X_"}, {"match": "*.fbx", "usdImport": "maybe"}, {"regex": "(", "bogus": 1}])
+    msg = str(exc.value)
+    assert "overrides[0]" in msg and "overrides[1].usdImport" in msg
+    assert "overrides[2].regex" in msg and "overrides[2].bogus" in msg
+
+def test_batch_applies_per_asset_overrides(monkeypatch, tmp_path):
+    (tmp_path / "vendors" / "acme").mkdir(parents=True)
+    (tmp_path / "vendors" / "acme" / "crate.ma").write_text("")
+    (tmp_path / "props").mkdir()
+    (tmp_path / "props" / "barrel.ma").write_text("")
+    (tmp_path / "props" / "tree.usd").write_text("")
+    icp.pipeline_rules = _with_overrides([
+        {"match": "vendors/acme/**", "prefix": "ACME_", "scaleFactor": 0.01},
+        {"match": "props/*.usd", "usdImport": "reference"},
+    ]).replace(validate=False)
+    imports, scales, renames = [], [], []
+    def fake_file(fp, **k):
+        imports.append((os.path.basename(fp), k.get("reference", False)))
+        return [os.path.splitext(os.path.basename(fp))[0] + "_root"]
+    monkeypatch.setattr(icp.cmds, "file", fake_file)
+    monkeypatch.setattr(icp.cmds, "listRelatives", lambda n, **k: [])
+    monkeypatch.setattr(icp.cmds, "scale", lambda *a, **k: scales.append(a))
+    monkeypatch.setattr(icp.cmds, "rename", lambda old, new: renames.append((old, new)) or new)
+    icp.batch_import_and_cleanup(str(tmp_path), recursive=True)
+    assert ("tree.usd", True) in imports and ("barrel.ma", False) in imports
+    assert scales == [(0.01, 0.01, 0.01, "crate_root")]
+    assert sorted(renames) == [("barrel_root", "ASSET_barrel"), ("crate_root", "ACME_crate"),
+                               ("tree_root", "ASSET_tree")]
+
+def test_current_rules_keeps_last_valid_rules_on_bad_reload(tmp_path, capsys):
+    path = tmp_path / "rules.json"
+    _write(path)
+    icp.reload_rules(str(path))
+    first = icp.current_rules()
+    for n, text in enumerate(['{"naming": {"prefix": ', '{"naming": {"prefix": 5}}'], 1):
+        path.write_text(text)
+        os.utime(path, ns=(first.mtime + n * 10 ** 9, first.mtime + n * 10 ** 9))
+        assert icp.current_rules() is first
+        assert icp.current_rules() is first
+    assert capsys.readouterr().out.count("keeping the previous rules") == 2
+    _write(path, prefix="NEW_")
+    os.utime(path, ns=(first.mtime + 5 * 10 ** 9, first.mtime + 5 * 10 ** 9))
+    assert icp.current_rules().prefix == "NEW_"
@@ -0,0 +1,82 @@
+import os
+import types
+import usd_metadata_index as umi
+
+class FakeVariantSet:
+    def __init__(self, sel):
+        self.sel = sel
+    def GetVariantNames(self):     return ["high", "low"]
+    def GetVariantSelection(self): return self.sel
+
+class FakePrim:
+    def __init__(self, path, variants):
+        self.path, self.variants = path, variants
+    def GetPath(self):
+        return types.SimpleNamespace(pathString=self.path)
+    def GetVariantSets(self):
+        return types.SimpleNamespace(
+            GetNames=lambda: ["lod"] if self.variants else [],
+            GetVariantSet=lambda name: FakeVariantSet("low"),
+        )
+
+class FakeStage:
+    def __init__(self, root):
+        self.root = root
+    def GetLayerStack(self):
+        return [types.SimpleNamespace(identifier=self.root, realPath=self.root)]
+    def Traverse(self):
+        return iter([FakePrim("/World", False), FakePrim("/World/Chair", True)])
+
+def _index(tmp_path, opened):
+    def opener(path):
+        opened.append(path)
+        return FakeStage(path)
+    return umi.UsdMetadataIndex(cache_dir=str(tmp_path / "cache"), opener=opener)
+
+def test_index_describes_stage_and_caches(tmp_path):
+    usd = tmp_path / "set.usda"
+    usd.write_text("#usda 1.0")
+    opened = []
+    index = _index(tmp_path, opened)
+    info = index.get(str(usd))
+    assert "prims" not in info
+    assert info["variant_prims"] == [dict(path="/World/Chair", sets=[dict(name="lod", selection="low", variants=["high", "low"])])]
+    assert index.has_variants(str(usd))
+    assert len(opened) == 1
+
+    # A fresh index instance is served from the stage's own cache file
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+    assert _index(tmp_path, opened).get(str(usd)) == info
+    assert len(opened) == 1
+
+def test_index_refreshes_when_file_changes(tmp_path):
+    usd = tmp_path / "set.usda"
+    usd.write_text("#usda 1.0")
+    opened = []
+    index = _index(tmp_path, opened)
+    index.get(str(usd))
+    os.utime(str(usd), (1, 1))
+    index.get(str(usd))
+    assert len(opened) == 2
+    index.invalidate(str(usd))
+    index.get(str(usd))
+    assert len(opened) == 3
+
+def test_index_does_not_cache_missing_files(tmp_path):
+    opened = []
+    index = _index(tmp_path, opened)
+    index.get(str(tmp_path / "missing.usda"))
+    index.get(str(tmp_path / "missing.usda"))
+    assert len(opened) == 2
+    assert not (tmp_path / "cache").exists()
+
+def test_index_invalidate_removes_only_that_stage(tmp_path):
+    opened = []
+    index = _index(tmp_path, opened)
+    for name in ("a.usda", "b.usda"):
+        (tmp_path / name).write_text("#usda 1.0")
+        index.get(str(tmp_path / name))
+    index.invalidate(str(tmp_path / "a.usda"))
+    fresh = _index(tmp_path, opened)
+    assert fresh.peek(str(tmp_path / "a.usda")) is None
+    assert fresh.peek(str(tmp_path / "b.usda")) is not None
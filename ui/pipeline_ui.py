@@ -3,8 +3,16 @@ import maya.cmds as cmds
 import maya.OpenMayaUI as omui
 from shiboken2 import wrapInstance
 import import_cleanup_prototype
+import usd_metadata_index
+import pipeline_logging
+import import_scheduler
+from usd_variant_model import UsdVariantTreeModel
+from preview_model import PreviewTableModel
 import os
 import re
+import time
+import functools
+import contextlib
 
 try:
     from pxr import Usd
@@ -16,14 +24,119 @@ def maya_main_window():
     ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(ptr), QtWidgets.QWidget)
 
+LOG_MAX_BLOCKS = 5000      # lines kept in the log panel
+LOG_FLUSH_INTERVAL = 100   # ms between log panel updates
+PREVIEW_CHUNK = 500        # preview rows added to the table per event-loop pass
+WARMUP_INTERVAL = 20       # ms between plugin warm-up steps
+
+# Runs iter_batch_import_and_cleanup cooperatively on Maya's main thread: a zero-interval
+# QTimer advances the generator for a short time slice per event-loop pass. Printed output
+# goes to the asset_pipeline logger one record per line. A run ends with exactly one of
+# finished(cancelled) or failed(error message).
+class ImportJob(QtCore.QObject):
+    progress = QtCore.Signal(int)
+    finished = QtCore.Signal(bool)
+    failed = QtCore.Signal(str)
+
+    def __init__(self, steps_factory, parent=None, time_slice=0.03, scheduler=None):
+        super(ImportJob, self).__init__(parent)
+        self.time_slice = time_slice
+        self.scheduler = scheduler
+        self._done = 0
+        self._cancelled = False
+        self._paused = False
+        self._running = False
+        self._steps = steps_factory(cancel_check=lambda: self._cancelled)
+        self._stream = pipeline_logging.StreamToLogger()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._tick)
+
+    def is_running(self):
+        return self._running
+
+    def is_paused(self):
+        return self._paused
+
+    def start(self):
+        self._running = True
+        self._timer.start()
+
+    def pause(self):
+        if self._running and not self._cancelled:
+            self._paused = True
+            self._timer.stop()
+
+    def resume(self):
+        if self._running and self._paused:
+            self._paused = False
+            self._timer.start()
+
+    def cancel(self):
+        # Let the generator observe the flag so post-import cleanup still runs
+        self._cancelled = True
+        self._paused = False
+        if self._running:
+            self._timer.start()
+
+    def _tick(self):
+        deadline = time.perf_counter() + self.time_slice
+        pct = None
+        ended = False
+        error = None
+        with contextlib.redirect_stdout(self._stream):
+            try:
+                # Always advance at least one file per pass
+                while True:
+                    done, total = next(self._steps)
+                    self._done = done
+                    if self.scheduler:
+                        pct = int(self.scheduler.fraction(done, total) * 100)
+                    else:
+                        pct = int(done / total * 100)
+                    if time.perf_counter() >= deadline:
+                        break
+            except StopIteration:
+                ended = True
+            except Exception as e:
+                print(f"Import failed: {e}")
+                ended, error = True, str(e) or type(e).__name__
+        if pct is not None:
+            self.progress.emit(pct)
+        if ended:
+            self._finish(error)
+
+    def eta(self):
+        return self.scheduler.eta(self._done) if self.scheduler else None
+
+    def _finish(self, error=None):
+        self._running = False
+        self._timer.stop()
+        self._stream.flush()
+        if error is None:
+            self.finished.emit(self._cancelled)
+        else:
+            self.failed.emit(error)
+
 class PipelineToolUI(QtWidgets.QDialog):
     def __init__(self):
         super(PipelineToolUI, self).__init__(parent=maya_main_window())
         self.setWindowTitle("Asset Import & Prep Tool")
         self.setMinimumWidth(480)
         self.original_scales = {}  # Cache original scales to avoid cumulative scaling
+        self.import_job = None
+        self.usd_index = usd_metadata_index.UsdMetadataIndex(
+            opener=lambda path: usd_metadata_index.open_stage_unloaded(path, Usd)
+        )
         self._build_ui()
         self._update_ui_from_rules()
+        # Load import translators for the current folder once the window is up, a step per timer tick
+        self._warmup_steps = None
+        self._warmup_timer = QtCore.QTimer(self)
+        self._warmup_timer.setInterval(WARMUP_INTERVAL)
+        self._warmup_timer.timeout.connect(self._warm_up_step)
+        QtCore.QTimer.singleShot(0, self._warm_up_plugins)
 
         try:
             self.script_job_number = cmds.scriptJob(event=["SelectionChanged", self._on_selection_changed], protected=True)
@@ -31,6 +144,11 @@ class PipelineToolUI(QtWidgets.QDialog):
             self.script_job_number = None
 
     def closeEvent(self, event):
+        if self.import_job and self.import_job.is_running():
+            self.import_job.cancel()
+        self._stop_preview()
+        self._stop_warm_up()
+        pipeline_logging.get_logger().removeHandler(self.log_handler)
         if self.script_job_number and cmds.scriptJob(exists=self.script_job_number):
             cmds.scriptJob(kill=self.script_job_number, force=True)
         super(PipelineToolUI, self).closeEvent(event)
@@ -75,12 +193,19 @@ class PipelineToolUI(QtWidgets.QDialog):
         row.addWidget(self.batch_repair_btn)
         layout.addLayout(row)
 
-        # Preview table
-        self.preview_table = QtWidgets.QTableWidget(0, 2)
-        self.preview_table.setHorizontalHeaderLabels(["Original", "New Name"])
+        # Preview table, filled a chunk at a time from iter_preview_renaming
+        self.preview_model = PreviewTableModel(self)
+        self.preview_table = QtWidgets.QTableView()
+        self.preview_table.setModel(self.preview_model)
+        self.preview_table.verticalHeader().setVisible(False)
         self.preview_table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
         self.preview_table.horizontalHeader().setSectionResizeMode(1, QtWidgets.QHeaderView.Stretch)
+        self.preview_table.horizontalHeader().setSectionResizeMode(2, QtWidgets.QHeaderView.Interactive)
         layout.addWidget(self.preview_table)
+        self._preview_rows = None
+        self._preview_timer = QtCore.QTimer(self)
+        self._preview_timer.setInterval(0)
+        self._preview_timer.timeout.connect(self._fill_preview)
 
         # Naming checkbox + prefix input
         h_naming = QtWidgets.QHBoxLayout()
@@ -99,6 +224,8 @@ class PipelineToolUI(QtWidgets.QDialog):
         layout.addWidget(self.path_cb)
         self.ns_cb = QtWidgets.QCheckBox("Enable Namespace Cleanup")
         layout.addWidget(self.ns_cb)
+        self.incremental_cb = QtWidgets.QCheckBox("Incremental Import (keep scene, only new/changed assets)")
+        layout.addWidget(self.incremental_cb)
 
         # Center on import checkbox + scale slider
         h_scale_center = QtWidgets.QHBoxLayout()
@@ -132,10 +259,18 @@ class PipelineToolUI(QtWidgets.QDialog):
         self.usd_group.setCheckable(True)
         self.usd_group.setChecked(False)
         vb = QtWidgets.QVBoxLayout(self.usd_group)
-        self.usd_tree = QtWidgets.QTreeWidget()
-        self.usd_tree.setHeaderLabels(["Path/Name", "Type", "Selected"])
-        self.usd_tree.itemDoubleClicked.connect(self._on_variant_activate)
+        self.usd_filter_edit = QtWidgets.QLineEdit()
+        self.usd_filter_edit.setPlaceholderText("Filter prim paths…")
+        self.usd_filter_edit.textChanged.connect(self._on_usd_filter_changed)
+        vb.addWidget(self.usd_filter_edit)
+        self.usd_model = UsdVariantTreeModel(parent=self)
+        self.usd_tree = QtWidgets.QTreeView()
+        self.usd_tree.setUniformRowHeights(True)
+        self.usd_tree.setModel(self.usd_model)
+        self.usd_tree.doubleClicked.connect(self._on_variant_activate)
         vb.addWidget(self.usd_tree)
+        self.save_variant_cb = QtWidgets.QCheckBox("Save variant selection to file")
+        vb.addWidget(self.save_variant_cb)
         layout.addWidget(self.usd_group)
 
         # Export button
@@ -143,15 +278,32 @@ class PipelineToolUI(QtWidgets.QDialog):
         self.export_btn.clicked.connect(self._on_usd_export)
         layout.addWidget(self.export_btn)
 
-        # Run button
+        # Run, pause and cancel buttons
+        run_row = QtWidgets.QHBoxLayout()
         self.run_btn = QtWidgets.QPushButton("Import & Clean")
         self.run_btn.clicked.connect(self._on_run)
-        layout.addWidget(self.run_btn)
-
-        # Log output
+        self.pause_btn = QtWidgets.QPushButton("Pause")
+        self.pause_btn.setEnabled(False)
+        self.pause_btn.clicked.connect(self._on_pause)
+        self.cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self._on_cancel)
+        run_row.addWidget(self.run_btn)
+        run_row.addWidget(self.pause_btn)
+        run_row.addWidget(self.cancel_btn)
+        layout.addLayout(run_row)
+
+        # Log output: bounded panel fed from a ring buffer, redrawn at most every LOG_FLUSH_INTERVAL ms
         self.log_output = QtWidgets.QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(LOG_MAX_BLOCKS)
         layout.addWidget(self.log_output)
+        self.log_handler = pipeline_logging.RingBufferHandler(capacity=LOG_MAX_BLOCKS)
+        pipeline_logging.get_logger().addHandler(self.log_handler)
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
 
         # Progress bar at bottom
         self.progress_bar = QtWidgets.QProgressBar()
@@ -160,13 +312,22 @@ class PipelineToolUI(QtWidgets.QDialog):
         layout.addWidget(self.progress_bar)
 
     def _update_ui_from_rules(self):
-        rules = import_cleanup_prototype.pipeline_rules
-        pfx = rules['naming']['prefix']
+        rules = import_cleanup_prototype.current_rules()
+        pfx = rules.prefix
         self.naming_cb.setChecked(bool(pfx))
         self.naming_prefix_edit.setText(pfx)
         self.naming_prefix_edit.setEnabled(self.naming_cb.isChecked())
-        self.path_cb.setChecked(rules['pathRepair']['autoFix'])
-        self.ns_cb.setChecked(rules['cleanup']['namespaceCleanup'])
+        self.path_cb.setChecked(rules.path_autofix)
+        self.ns_cb.setChecked(rules.namespace_cleanup)
+
+    def _rules_from_ui(self):
+        # Per-run copy of the active rules with the UI toggles applied; the module rules are not touched
+        prefix = self.naming_prefix_edit.text() if self.naming_cb.isChecked() else ""
+        return import_cleanup_prototype.current_rules().replace(
+            prefix=prefix,
+            path_autofix=self.path_cb.isChecked(),
+            namespace_cleanup=self.ns_cb.isChecked()
+        )
 
     def _on_naming_enabled(self, state):
         enabled = state == QtCore.Qt.Checked
@@ -220,24 +381,77 @@ class PipelineToolUI(QtWidgets.QDialog):
         sel = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Asset Folder")
         if sel:
             self.dir_line.setText(sel)
+            self._warm_up_plugins()
+
+    def _warm_up_plugins(self):
+        # Scans the folder on a worker thread while the translators its file types need are
+        # loaded, one per timer tick, so opening the window never waits on the scan; also warms
+        # the scan cache
+        self._stop_warm_up()
+        folder = self.dir_line.text().strip()
+        if not folder or not os.path.isdir(folder):
+            return
+        self._warmup_steps = import_cleanup_prototype.iter_collect_and_preload(folder, poll=0)
+        self._warmup_timer.start()
+
+    def _warm_up_step(self):
+        with contextlib.redirect_stdout(pipeline_logging.StreamToLogger()):
+            try:
+                next(self._warmup_steps)
+                return
+            except StopIteration:
+                pass
+            except Exception as e:
+                print(f"Plugin warmup failed: {e}")
+        self._stop_warm_up()
+        report = import_cleanup_prototype.plugins.report()
+        if report:
+            pipeline_logging.get_logger().info("Import plugins:\n%s", report)
+
+    def _stop_warm_up(self):
+        self._warmup_timer.stop()
+        self._warmup_steps = None
 
     def _on_preview(self):
+        self._stop_preview()
         try:
-            mapping = import_cleanup_prototype.preview_renaming(self.dir_line.text().strip() or None)
+            rows = import_cleanup_prototype.iter_preview_renaming(self.dir_line.text().strip() or None,
+                                                                  rules=self._rules_from_ui(),
+                                                                  chunk_size=PREVIEW_CHUNK)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "Preview Failed", str(e))
+            return
+        self.preview_model.clear()
+        self._preview_rows = rows
+        self._preview_timer.start()
+
+    def _fill_preview(self):
+        # One chunk per event-loop pass: the first rows show at once and the dialog stays responsive
+        try:
+            chunk = next(self._preview_rows)
+        except StopIteration:
+            self._stop_preview()
+            pipeline_logging.get_logger().info("Preview: %d assets, %d numbered to avoid clashes",
+                                               self.preview_model.rowCount(), self.preview_model.conflicts)
+            return
         except Exception as e:
+            self._stop_preview()
             QtWidgets.QMessageBox.critical(self, "Preview Failed", str(e))
             return
+        self.preview_model.append_rows(chunk)
 
-        self.preview_table.setRowCount(0)
-        for orig, new in mapping.items():
-            r = self.preview_table.rowCount()
-            self.preview_table.insertRow(r)
-            self.preview_table.setItem(r, 0, QtWidgets.QTableWidgetItem(orig))
-            self.preview_table.setItem(r, 1, QtWidgets.QTableWidgetItem(new))
+    def _stop_preview(self):
+        self._preview_timer.stop()
+        self._preview_rows = None
 
     def _on_batch_repair(self):
         self.log_output.appendPlainText(">>> Running Batch Path Repair…")
-        import_cleanup_prototype.fix_missing_paths()
+        # Scoped to the nodes of the last import while any of them exist, searching its folder first
+        folder = self.dir_line.text().strip()
+        last = import_cleanup_prototype.last_import_nodes
+        nodes = (cmds.ls(last) or None) if last else None
+        roots = import_cleanup_prototype.repair_search_roots(folder if os.path.isdir(folder) else None)
+        import_cleanup_prototype.fix_missing_paths(search_roots=roots, nodes=nodes)
 
     def _on_usd_export(self):
         sel = cmds.ls(selection=True, long=True)
@@ -273,92 +487,146 @@ class PipelineToolUI(QtWidgets.QDialog):
     def populate_usd_tree(self, usd_path):
         if not Usd:
             return
-        self.usd_tree.clear()
-        stage = Usd.Stage.Open(usd_path)
-        if not stage:
-            return
+        # Use the cached index entry when fresh, otherwise traverse the stage lazily
+        info = self.usd_index.peek(usd_path)
+        if info:
+            layers = [lyr['identifier'] for lyr in info['layers']]
+            records = lambda: iter(info['variant_prims'])
+        else:
+            stage = usd_metadata_index.open_stage_unloaded(usd_path, Usd)
+            if not stage:
+                return
+            layers = [lyr['identifier'] for lyr in usd_metadata_index.describe_layers(stage)]
+            records = lambda: usd_metadata_index.iter_variant_prims(stage)
+
+        self.usd_model = UsdVariantTreeModel(layers, records, parent=self)
+        self.usd_model.set_filter(self.usd_filter_edit.text())
+        self.usd_tree.setModel(self.usd_model)
+        self.usd_group.setChecked(True)
 
-        for lyr in stage.GetLayerStack():
-            item = QtWidgets.QTreeWidgetItem([lyr.identifier, "Layer", ""])
-            self.usd_tree.addTopLevelItem(item)
-
-        for prim in stage.Traverse():
-            vs = prim.GetVariantSets()
-            names = vs.GetNames()
-            if names:
-                pi = QtWidgets.QTreeWidgetItem([prim.GetPath().pathString, "Prim", ""])
-                self.usd_tree.addTopLevelItem(pi)
-                for sn in names:
-                    vset = vs.GetVariantSet(sn)
-                    sel = vset.GetVariantSelection()
-                    si = QtWidgets.QTreeWidgetItem([sn, "VariantSet", sel])
-                    pi.addChild(si)
-                    for v in vset.GetVariantNames():
-                        leaf = QtWidgets.QTreeWidgetItem([v, "Variant", ""])
-                        if v == sel:
-                            leaf.setSelected(True)
-                        si.addChild(leaf)
+    def _on_usd_filter_changed(self, text):
+        self.usd_model.set_filter(text)
 
-        self.usd_group.setChecked(True)
-        self.usd_tree.expandAll()
+    def _live_usd_stage(self, usd_path):
+        # Stage owned by a mayaUsdProxyShape already showing this file, if any
+        try:
+            import mayaUsd.ufe
+        except ImportError:
+            return None
+        target = os.path.normpath(usd_path)
+        for shape in cmds.ls(type='mayaUsdProxyShape', long=True) or []:
+            if os.path.normpath(cmds.getAttr(f"{shape}.filePath") or '') == target:
+                stage = mayaUsd.ufe.getStage(shape)
+                if stage:
+                    return stage
+        return None
+
+    def _reload_usd_references(self, usd_path):
+        # Reload only the Maya references that point at the edited file
+        target = os.path.normpath(usd_path)
+        for ref_file in cmds.file(query=True, reference=True) or []:
+            if os.path.normpath(ref_file.split('{')[0]) != target:
+                continue
+            try:
+                rn = cmds.referenceQuery(ref_file, referenceNode=True)
+                cmds.file(loadReference=rn)
+            except Exception as e:
+                self.log_output.appendPlainText(f"Failed to reload reference {ref_file}: {e}")
 
-    def _on_variant_activate(self, item, _):
-        if item.text(1) != "Variant":
+    def _on_variant_activate(self, index, _=None):
+        node = self.usd_model.node(index)
+        if not index.isValid() or node.kind != "Variant":
             return
-        set_item = item.parent()
-        prim_item = set_item.parent()
-        prim_path = prim_item.text(0)
-        set_name = set_item.text(0)
-        variant = item.text(0)
-
-        stage = Usd.Stage.Open(self.current_usd)
-        prim = stage.GetPrimAtPath(prim_path)
-        prim.GetVariantSets().GetVariantSet(set_name).SetVariantSelection(variant)
-        stage.GetRootLayer().Save()
-        for rn in cmds.ls(type='reference'):
-            cmds.file(rn, loadReference=True)
+        prim_path = self.usd_model.prim_path(index)
+        set_name = node.parent.name
+        variant = node.name
+        save = self.save_variant_cb.isChecked()
+
+        # Edit the live proxy stage in its session layer; only touch disk when asked
+        stage = self._live_usd_stage(self.current_usd)
+        if stage is None:
+            if not save:
+                self.log_output.appendPlainText(
+                    f"No USD proxy is showing {self.current_usd}; enable saving to apply this variant.")
+                return
+            stage = Usd.Stage.Open(self.current_usd)
+
+        layer = stage.GetRootLayer() if save else stage.GetSessionLayer()
+        with Usd.EditContext(stage, layer):
+            prim = stage.GetPrimAtPath(prim_path)
+            prim.GetVariantSets().GetVariantSet(set_name).SetVariantSelection(variant)
+        self.usd_model.set_variant_selection(index)
+
+        if save:
+            layer.Save()
+            self.usd_index.invalidate(self.current_usd)
+            self._reload_usd_references(self.current_usd)
 
     def _on_run(self):
+        if self.import_job and self.import_job.is_running():
+            return
         self.run_btn.setEnabled(False)
+        self.log_handler.drain()
         self.log_output.clear()
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("%p%")
 
-        import sys
-        orig_stdout = sys.stdout
-        class Stream:
-            def write(_, msg):
-                if msg.strip():
-                    self.log_output.appendPlainText(msg)
-            def flush(_): pass
-        sys.stdout = Stream()
-
-        cmds.file(new=True, force=True)
+        incremental = self.incremental_cb.isChecked()
+        if not incremental:
+            cmds.file(new=True, force=True)
 
         import_cleanup_prototype.USD_IMPORT_AS_REF = self.radio_ref.isChecked()
         import_cleanup_prototype.USD_IMPORT_AS_NODES = self.radio_nodes.isChecked()
 
-        prefix = self.naming_prefix_edit.text() if self.naming_cb.isChecked() else ""
-        import_cleanup_prototype.pipeline_rules['naming']['prefix'] = prefix
-
-        import_cleanup_prototype.pipeline_rules['pathRepair']['autoFix'] = self.path_cb.isChecked()
-        import_cleanup_prototype.pipeline_rules['cleanup']['namespaceCleanup'] = self.ns_cb.isChecked()
-
-        # Pass center_on_import and scale value to the batch import function
-        import_cleanup_prototype.batch_import_and_cleanup(
+        # The batch runs as a cooperative job so artists can keep working; the
+        # scheduler orders files by estimated cost and drives progress and ETA
+        scheduler = import_scheduler.ImportScheduler()
+        steps = functools.partial(
+            import_cleanup_prototype.iter_batch_import_and_cleanup,
             self.dir_line.text().strip() or None,
             center_on_import=self.center_on_import_cb.isChecked(),
             scale_factor=self.scale_slider.value() / 100.0,
-            progress_callback=self._on_progress_update
+            incremental=incremental,
+            scheduler=scheduler,
+            rules=self._rules_from_ui()
         )
-
-        if self.radio_ref.isChecked() and Usd:
+        self.import_job = ImportJob(steps, parent=self, scheduler=scheduler)
+        self.import_job.progress.connect(self._on_progress_update)
+        self.import_job.finished.connect(self._on_run_finished)
+        self.import_job.failed.connect(self._on_run_failed)
+        self.pause_btn.setText("Pause")
+        self.pause_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(True)
+        self.import_job.start()
+
+    def _on_pause(self):
+        job = self.import_job
+        if not job or not job.is_running():
+            return
+        if job.is_paused():
+            job.resume()
+            self.pause_btn.setText("Pause")
+        else:
+            job.pause()
+            self.pause_btn.setText("Resume")
+
+    def _on_cancel(self):
+        if self.import_job and self.import_job.is_running():
+            self.log_output.appendPlainText(">>> Cancelling…")
+            self.cancel_btn.setEnabled(False)
+            self.import_job.cancel()
+
+    def _flush_log(self):
+        lines = self.log_handler.drain()
+        if lines:
+            self.log_output.appendPlainText('\n'.join(lines))
+
+    def _on_run_finished(self, cancelled):
+        self._flush_log()
+        if self.radio_ref.isChecked() and Usd and not cancelled:
             refs = cmds.file(query=True, reference=True) or []
             usd_refs = [f for f in refs if f.lower().endswith(('.usd', '.usda'))]
-            chosen = None
-            for usd in usd_refs:
-                stage = Usd.Stage.Open(usd)
-                if any(prim.GetVariantSets().GetNames() for prim in stage.Traverse()):
-                    chosen = usd
-                    break
+            chosen = next((usd for usd in usd_refs if self.usd_index.has_variants(usd)), None)
 
             if chosen:
                 self.current_usd = chosen
@@ -367,12 +635,26 @@ class PipelineToolUI(QtWidgets.QDialog):
             else:
                 self.log_output.appendPlainText("No variant-enabled USD found among references.")
 
-        sys.stdout = orig_stdout
-        self.run_btn.setEnabled(True)
+        self._reset_run_controls()
         self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("%p%")
+
+    def _on_run_failed(self, message):
+        # Keeps the progress reached so far and says the run failed; nothing is reported as done
+        self._flush_log()
+        self._reset_run_controls()
+        self.progress_bar.setFormat("Failed at %p%")
+        QtWidgets.QMessageBox.critical(self, "Import Failed", message)
+
+    def _reset_run_controls(self):
+        self.run_btn.setEnabled(True)
+        self.pause_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(False)
 
     def _on_progress_update(self, percent):
         self.progress_bar.setValue(percent)
+        eta = self.import_job.eta() if self.import_job else None
+        self.progress_bar.setFormat("%p%" if eta is None else "%p%  ETA {:d}:{:02d}".format(*divmod(int(eta + 0.5), 60)))
 
     def _on_help(self):
         QtWidgets.QMessageBox.information(self, "Help", "Asset Import & Prep Tool\n\n"
@@ -386,7 +668,9 @@ class PipelineToolUI(QtWidgets.QDialog):
             "8. Center on Import: Move imported assets to world origin (0,0,0).\n"
             "9. Scale Assets: Adjust scale of imported assets (slider: 50% to 150%, default 100%).\n"
             "10. USD Import Mode: Choose node or reference import for USD files.\n"
-            "11. Import & Clean: Run batch import and cleanup.\n"
+            "    Double-click a variant to switch it on the live USD proxy; tick 'Save variant selection to file' to write it to disk.\n"
+            "11. Import & Clean: Run batch import and cleanup in the background (Pause/Cancel available).\n"
+            "    Incremental Import keeps the current scene and only re-imports new or changed files.\n"
             "12. Export Selection to USD: Export current selection.\n"
             "13. Batch Path Repair: Fix broken paths without re-importing.\n"
             "\nFor detailed documentation, please see the project README.")
@@ -0,0 +1,64 @@
+from PySide2 import QtCore, QtGui
+
+# Table model for the renaming preview.
+#
+# Rows are PreviewRow records (original, new_name, source_path, conflict) appended
+# a chunk at a time as iter_preview_renaming produces them, with one insert
+# notification per chunk, so the view shows the first rows while the rest of a
+# large folder is still being previewed.
+
+COLUMNS = ("Original", "New Name", "Source")
+CONFLICT_COLOR = QtGui.QColor(230, 160, 60)
+
+
+class PreviewTableModel(QtCore.QAbstractTableModel):
+    def __init__(self, parent=None):
+        super(PreviewTableModel, self).__init__(parent)
+        self._rows = []
+        self.conflicts = 0
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self.conflicts = 0
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        rows = list(rows)
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.conflicts += sum(1 for r in rows if r[3])
+        self.endInsertRows()
+
+    def row_record(self, row):
+        return self._rows[row]
+
+    # --- Qt model interface ----------------------------------------------------
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        original, new_name, source, conflict = self._rows[index.row()]
+        col = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            return (original, new_name, source)[col]
+        if role == QtCore.Qt.ToolTipRole:
+            if col == 1 and conflict:
+                return "Numbered to avoid a clash with an existing node or another asset"
+            return source if col == 2 else None
+        if role == QtCore.Qt.ForegroundRole and col == 1 and conflict:
+            return QtGui.QBrush(CONFLICT_COLOR)
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return COLUMNS[section]
+        return None
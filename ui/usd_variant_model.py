@@ -0,0 +1,190 @@
+from PySide2 import QtCore, QtGui
+
+# Lazy item model for the USD Layers & Variants browser.
+#
+# Top-level rows are the layer stack followed by prims that carry variant sets.
+# Prims are pulled from a record iterator (a live stage traversal or a cached
+# index entry) a batch at a time through canFetchMore/fetchMore; variant sets
+# and variants are only materialised when a prim or set is expanded.
+
+COLUMNS = ("Path/Name", "Type", "Selected")
+
+
+class _Node(object):
+    __slots__ = ('kind', 'name', 'selection', 'record', 'parent', 'row', 'children', 'fetched')
+
+    def __init__(self, kind, name, parent=None, selection="", record=None):
+        self.kind = kind
+        self.name = name
+        self.selection = selection
+        self.record = record
+        self.parent = parent
+        self.row = 0
+        self.children = []
+        self.fetched = kind not in ("Prim", "VariantSet")
+
+    def add(self, child):
+        child.parent = self
+        child.row = len(self.children)
+        self.children.append(child)
+        return child
+
+
+class UsdVariantTreeModel(QtCore.QAbstractItemModel):
+    def __init__(self, layers=(), records_factory=None, batch_size=200, scan_limit=5000, parent=None):
+        super(UsdVariantTreeModel, self).__init__(parent)
+        self.batch_size = batch_size
+        self.scan_limit = scan_limit
+        self._layers = list(layers)
+        self._records_factory = records_factory or (lambda: iter(()))
+        self._filter = ""
+        # Session-only selections keyed by (prim path, set name); records may be
+        # shared with the metadata index cache, so they are never edited in place
+        self._selections = {}
+        self._reset_root()
+
+    # --- building ------------------------------------------------------------
+    def _reset_root(self):
+        self._root = _Node("Root", "")
+        self._records = self._records_factory()
+        self._exhausted = False
+        if not self._filter:
+            for lyr in self._layers:
+                self._root.add(_Node("Layer", lyr))
+
+    def set_filter(self, text):
+        text = text.strip()
+        if text == self._filter:
+            return
+        self.beginResetModel()
+        self._filter = text
+        self._reset_root()
+        self.endResetModel()
+
+    def filter_text(self):
+        return self._filter
+
+    def _pull_records(self):
+        # At most batch_size matches per call, and never scan more than scan_limit
+        # records, so one fetch stays cheap even when few prims match the filter.
+        out = []
+        scanned = 0
+        while len(out) < self.batch_size and scanned < self.scan_limit:
+            try:
+                record = next(self._records)
+            except StopIteration:
+                self._exhausted = True
+                break
+            scanned += 1
+            if not self._filter or self._filter in record['path']:
+                out.append(record)
+        return out
+
+    def _children_for(self, node):
+        if node.kind == "Prim":
+            return [_Node("VariantSet", s['name'], record=s,
+                          selection=self._selections.get((node.name, s['name']), s['selection']))
+                    for s in node.record['sets']]
+        if node.kind == "VariantSet":
+            return [_Node("Variant", v) for v in node.record['variants']]
+        return []
+
+    # --- lookup ----------------------------------------------------------------
+    def node(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    def prim_path(self, index):
+        node = self.node(index)
+        while node is not None and node.kind != "Prim":
+            node = node.parent
+        return node.name if node is not None else None
+
+    def fetch_all(self, parent=QtCore.QModelIndex()):
+        while self.canFetchMore(parent):
+            self.fetchMore(parent)
+
+    # --- QAbstractItemModel ----------------------------------------------------
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        pnode = self.node(parent)
+        if 0 <= row < len(pnode.children) and 0 <= column < len(COLUMNS):
+            return self.createIndex(row, column, pnode.children[row])
+        return QtCore.QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        pnode = index.internalPointer().parent
+        if pnode is None or pnode is self._root:
+            return QtCore.QModelIndex()
+        return self.createIndex(pnode.row, 0, pnode)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(COLUMNS)
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        node = self.node(parent)
+        if node is self._root:
+            return bool(node.children) or not self._exhausted
+        return bool(node.children) or not node.fetched
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        if node is self._root:
+            return not self._exhausted
+        return not node.fetched
+
+    def fetchMore(self, parent):
+        node = self.node(parent)
+        if node is self._root:
+            new = [_Node("Prim", r['path'], record=r) for r in self._pull_records()]
+        else:
+            new = self._children_for(node)
+            node.fetched = True
+        if not new:
+            return
+        start = len(node.children)
+        self.beginInsertRows(parent, start, start + len(new) - 1)
+        for child in new:
+            node.add(child)
+        self.endInsertRows()
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == QtCore.Qt.DisplayRole:
+            if index.column() == 0:
+                return node.name
+            if index.column() == 1:
+                return node.kind
+            return node.selection if node.kind == "VariantSet" else ""
+        if role == QtCore.Qt.FontRole and node.kind == "Variant" and node.parent.selection == node.name:
+            font = QtGui.QFont()
+            font.setBold(True)
+            return font
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return COLUMNS[section]
+        return None
+
+    # --- edits -------------------------------------------------------------------
+    def set_variant_selection(self, variant_index):
+        node = self.node(variant_index)
+        if node.kind != "Variant":
+            return
+        vset = node.parent
+        vset.selection = node.name
+        self._selections[(vset.parent.name, vset.name)] = node.name
+        set_index = self.parent(variant_index)
+        self.dataChanged.emit(self.index(set_index.row(), 2, self.parent(set_index)),
+                              self.index(set_index.row(), 2, self.parent(set_index)))
+        if vset.children:
+            self.dataChanged.emit(self.index(0, 0, set_index),
+                                  self.index(len(vset.children) - 1, 0, set_index))